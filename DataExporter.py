@@ -1,278 +1,548 @@
+import csv
+import io
+import json
+import os
 from datetime import datetime
+from functools import lru_cache
 from tkinter import messagebox, filedialog
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-# Додайте цей імпорт, якщо його немає, для вирівнювання
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+LOGO_PATH = 'logo.png'
+
+
+@lru_cache(maxsize=None)
+def load_logo(path):
+    # Логотип читається з диска один раз на процес, далі кожен звіт бере байти з пам'яті
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        print(f"Warning: Logo file not found at '{path}'. Skipping logo.")
+        return None
 
 
 class DataExporter:
+    # python-docx та openpyxl імпортуються в методах експорту, щоб не сповільнювати запуск
 
     def __init__(self, db_manager):
         self.db = db_manager
 
     def export_to_word(self):
         try:
-            words = self.db.get_all_words()
-
-            if not words:
+            snapshot = self.take_snapshot()
+            if not snapshot['stats']['total_words']:
                 messagebox.showwarning("Експорт", "Немає слів для експорту!")
                 return
+        except Exception as e:
+            messagebox.showerror("Помилка експорту", f"Не вдалося експортувати:\n{str(e)}")
+            return
 
-            doc = Document()
-
-            title = doc.add_heading('Звіт - Статистика навчання', 0)
-            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            date_para = doc.add_paragraph()
-            date_run = date_para.add_run(f"Дата створення: {datetime.now().strftime('%d.%m.%Y %H:%M')}")
-            date_run.italic = True
-            date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            doc.add_paragraph()
-
-            cat_stats = self.db.get_category_statistics()
-
-            if cat_stats:
-                doc.add_heading('Статистика по категоріям', level=1)
-                table = doc.add_table(rows=1, cols=5)
-                table.style = 'Light Grid Accent 1'
-
-                hdr_cells = table.rows[0].cells
-                headers = ['Категорія', 'Всього', 'Вивчено', 'Вивчається', 'Нові']
-                for i, header in enumerate(headers):
-                    hdr_cells[i].text = header
-                    for paragraph in hdr_cells[i].paragraphs:
-                        for run in paragraph.runs:
-                            run.font.bold = True
-                            run.font.size = Pt(12)
-
-                for cat in cat_stats:
-                    row_cells = table.add_row().cells
-                    row_cells[0].text = cat[0] or "Без категорії"
-                    row_cells[1].text = str(cat[1])
-                    row_cells[2].text = str(cat[2] or 0)
-                    row_cells[3].text = str(cat[3] or 0)
-                    row_cells[4].text = str(cat[4] or 0)
-            else:
-                doc.add_paragraph("Немає даних по категоріях для відображення.")
-
-            section = doc.sections[0]
-            footer = section.footer
-
-            footer_para = footer.paragraphs[0]
-            footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            LOGO_PATH = 'logo.png'
+        return self._save_report(snapshot)
 
-            try:
-                run_logo = footer_para.add_run()
-                run_logo.add_picture(LOGO_PATH, height=Inches(0.3))
-                footer_para.add_run("   ")
-            except FileNotFoundError:
-                print(f"Warning: Logo file not found at '{LOGO_PATH}'. Skipping logo.")
-            except Exception as e:
-                print(f"Warning: Could not add logo. Error: {e}")
-
-            stats = self.db.get_statistics()
-            stats_text = (
-                f"Загальна статистика: "
-                f"Всього слів: {stats['total_words']} | "
-                f"Вивчено: {stats['learned_words']} | "
-                f"Вивчається: {stats['learning_words']} | "
-                f"Нові: {stats['new_words']} | "
-                f"Прогрес: {stats['progress_percentage']:.1f}%"
-            )
+    def export_statistics_to_word(self):
+        try:
+            snapshot = self.take_snapshot()
+        except Exception as e:
+            messagebox.showerror("Помилка експорту", f"Не вдалося експортувати:\n{str(e)}")
+            return
 
-            run_stats = footer_para.add_run(stats_text)
-            run_stats.font.size = Pt(9)
-            run_stats.font.italic = True
+        return self._save_report(snapshot)
 
+    def _save_report(self, snapshot):
+        try:
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".docx",
                 filetypes=[("Word Documents", "*.docx"), ("All Files", "*.*")],
-                initialfile=f"LearnEasy_Statistics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
+                initialfile=f"LearnEasy_Statistics_{snapshot['created_at'].strftime('%Y%m%d_%H%M%S')}.docx"
             )
 
             if file_path:
-                doc.save(file_path)
+                self.render_docx(snapshot, file_path)
                 messagebox.showinfo("Успіх", f"Файл експортовано:\n{file_path}")
                 return file_path
 
         except Exception as e:
             messagebox.showerror("Помилка експорту", f"Не вдалося експортувати:\n{str(e)}")
 
-    def export_to_excel(self):
-        try:
-            words = self.db.get_all_words()
+    REPORT_FORMATS = ("docx", "xlsx", "json")
+    CATEGORY_HEADERS = ['Категорія', 'Всього', 'Вивчено', 'Вивчається', 'Нові']
+
+    def take_snapshot(self):
+        """Усі дані звіту за один прохід; з одного знімка можна побудувати звіт у кількох форматах."""
+        return {
+            'created_at': datetime.now(),
+            'stats': self.db.get_statistics(),
+            'categories': [
+                (name or "Без категорії", total, learned or 0, learning or 0, new or 0)
+                for name, total, learned, learning, new in self.db.get_category_statistics()
+            ]
+        }
+
+    def build_reports(self, directory, formats=REPORT_FORMATS, snapshot=None, name="LearnEasy_Statistics"):
+        """Будує набір звітів з одного знімка й повертає шляхи до створених файлів."""
+        snapshot = snapshot or self.take_snapshot()
+        stamp = snapshot['created_at'].strftime('%Y%m%d_%H%M%S')
+        renderers = {"docx": self.render_docx, "xlsx": self.render_xlsx, "json": self.render_json}
+
+        paths = []
+        for fmt in formats:
+            path = os.path.join(directory, f"{name}_{stamp}.{fmt}")
+            renderers[fmt](snapshot, path)
+            paths.append(path)
+        return paths
+
+    def stats_summary(self, stats):
+        return (
+            f"Загальна статистика: "
+            f"Всього слів: {stats['total_words']} | "
+            f"Вивчено: {stats['learned_words']} | "
+            f"Вивчається: {stats['learning_words']} | "
+            f"Нові: {stats['new_words']} | "
+            f"Прогрес: {stats['progress_percentage']:.1f}%"
+        )
+
+    def render_docx(self, snapshot, file_path):
+        from docx import Document
+        from docx.shared import Pt, Inches
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+        doc = Document()
+
+        title = doc.add_heading('Звіт - Статистика навчання', 0)
+        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        date_para = doc.add_paragraph()
+        date_run = date_para.add_run(f"Дата створення: {snapshot['created_at'].strftime('%d.%m.%Y %H:%M')}")
+        date_run.italic = True
+        date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        doc.add_paragraph()
+
+        cat_stats = snapshot['categories']
+
+        if cat_stats:
+            doc.add_heading('Статистика по категоріям', level=1)
+            table = doc.add_table(rows=1, cols=5)
+            table.style = 'Light Grid Accent 1'
+
+            hdr_cells = table.rows[0].cells
+            for i, header in enumerate(self.CATEGORY_HEADERS):
+                hdr_cells[i].text = header
+                for paragraph in hdr_cells[i].paragraphs:
+                    for run in paragraph.runs:
+                        run.font.bold = True
+                        run.font.size = Pt(12)
+
+            for cat in cat_stats:
+                row_cells = table.add_row().cells
+                for i, value in enumerate(cat):
+                    row_cells[i].text = str(value)
+        else:
+            doc.add_paragraph("Немає даних по категоріях для відображення.")
+
+        footer_para = doc.sections[0].footer.paragraphs[0]
+        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        logo = load_logo(LOGO_PATH)
+        if logo is not None:
+            try:
+                footer_para.add_run().add_picture(io.BytesIO(logo), height=Inches(0.3))
+                footer_para.add_run("   ")
+            except Exception as e:
+                print(f"Warning: Could not add logo. Error: {e}")
 
-            if not words:
+        run_stats = footer_para.add_run(self.stats_summary(snapshot['stats']))
+        run_stats.font.size = Pt(9)
+        run_stats.font.italic = True
+
+        doc.save(file_path)
+        return file_path
+
+    def render_xlsx(self, snapshot, file_path):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Статистика")
+        ws.column_dimensions['A'].width = 25
+        for column in "BCDE":
+            ws.column_dimensions[column].width = 14
+
+        title = WriteOnlyCell(ws, value="Звіт - Статистика навчання")
+        title.font = Font(bold=True, size=14)
+        ws.append([title])
+        ws.append([f"Дата створення: {snapshot['created_at'].strftime('%d.%m.%Y %H:%M')}"])
+        ws.append([])
+
+        header_fill = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF")
+        header_row = []
+        for header in self.CATEGORY_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            header_row.append(cell)
+        ws.append(header_row)
+
+        for cat in snapshot['categories']:
+            ws.append(list(cat))
+
+        stats = snapshot['stats']
+        ws.append([])
+        ws.append(["Всього слів", stats['total_words']])
+        ws.append(["Вивчено", stats['learned_words']])
+        ws.append(["Вивчається", stats['learning_words']])
+        ws.append(["Нові", stats['new_words']])
+        ws.append(["Прогрес, %", round(stats['progress_percentage'], 1)])
+
+        wb.save(file_path)
+        return file_path
+
+    def render_json(self, snapshot, file_path):
+        report = {
+            'created_at': snapshot['created_at'].isoformat(timespec="seconds"),
+            'stats': snapshot['stats'],
+            'categories': [dict(zip(('category', 'total', 'learned', 'learning', 'new'), cat))
+                           for cat in snapshot['categories']]
+        }
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return file_path
+
+    WORD_HEADERS = ['№', 'Слово', 'Переклад', 'Транскрипція', 'Рівень', 'Категорія',
+                    'Показів', 'Правильно', 'Неправильно', 'Улюблене', 'Складність']
+    WORD_COLUMN_WIDTHS = [5, 20, 20, 20, 10, 15, 10, 12, 12, 10, 12]
+
+    def export_to_excel(self, parent=None, on_progress=None):
+        """Експорт слів у .xlsx. Якщо передано parent, файл пишеться у фоновому потоці, а
+        on_progress(записано, всього) і підсумкове повідомлення викликаються в потоці Tk."""
+        try:
+            if not self.db.get_words_page(page_size=1, with_total=False)['rows']:
                 messagebox.showwarning("Експорт", "Немає слів для експорту!")
                 return
 
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Слова"
-
-            headers = ['№', 'Слово', 'Переклад', 'Транскрипція', 'Рівень', 'Категорія',
-                       'Показів', 'Правильно', 'Неправильно', 'Улюблене', 'Складність']
-            ws.append(headers)
-
-            header_fill = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=12)
-
-            for col in range(1, len(headers) + 1):
-                cell = ws.cell(row=1, column=col)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-            for idx, word in enumerate(words, 1):
-                ws.append([
-                    idx,
-                    word[1],
-                    word[2],
-                    word[3] or "",
-                    word[4],
-                    word[5] or "-",
-                    word[6],
-                    word[7],
-                    word[8],
-                    "✓" if word[9] else "",
-                    word[10]
-                ])
-
-            column_widths = [5, 20, 20, 20, 10, 15, 10, 12, 12, 10, 12]
-            for i, width in enumerate(column_widths, 1):
-                ws.column_dimensions[chr(64 + i)].width = width
-
-            stats_ws = wb.create_sheet("Статистика")
-            stats = self.db.get_statistics()
-
-            stats_ws['A1'] = "Загальна статистика"
-            stats_ws['A1'].font = Font(bold=True, size=14)
-
-            stats_data = [
-                ["Показник", "Значення"],
-                ["Всього слів", stats['total_words']],
-                ["Вивчено", stats['learned_words']],
-                ["Вивчається", stats['learning_words']],
-                ["Нові", stats['new_words']],
-                ["Прогрес, %", f"{stats['progress_percentage']:.1f}"],
-                ["Дата звіту", datetime.now().strftime('%d.%m.%Y %H:%M')]
-            ]
-
-            for row in stats_data:
-                stats_ws.append(row)
-
-            stats_ws.column_dimensions['A'].width = 25
-            stats_ws.column_dimensions['B'].width = 20
-
-            stat_header_fill = PatternFill(start_color="10B981", end_color="10B981", fill_type="solid")
-            stat_header_font = Font(bold=True, color="FFFFFF")
-
-            for col in range(1, 3):
-                cell = stats_ws.cell(row=1, column=col)
-                cell.fill = stat_header_fill
-                cell.font = stat_header_font
-
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
                 filetypes=[("Excel Files", "*.xlsx"), ("All Files", "*.*")],
                 initialfile=f"LearnEasy_Words_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
             )
+            if not file_path:
+                return
 
-            if file_path:
-                wb.save(file_path)
+            if parent is None:
+                self.write_excel(file_path, on_progress)
                 messagebox.showinfo("Успіх", f"Файл експортовано:\n{file_path}")
                 return file_path
 
         except Exception as e:
             messagebox.showerror("Помилка експорту", f"Не вдалося експортувати:\n{str(e)}")
-
-    def export_statistics_to_word(self):
-        try:
-            doc = Document()
-
-            title = doc.add_heading('Звіт - Статистика навчання', 0)
-            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            date_para = doc.add_paragraph()
-            date_run = date_para.add_run(f"Дата створення: {datetime.now().strftime('%d.%m.%Y %H:%M')}")
-            date_run.italic = True
-            date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            doc.add_paragraph()
-
-            cat_stats = self.db.get_category_statistics()
-
-            if cat_stats:
-                doc.add_heading('Статистика по категоріям', level=1)
-                table = doc.add_table(rows=1, cols=5)
-                table.style = 'Light Grid Accent 1'
-
-                hdr_cells = table.rows[0].cells
-                headers = ['Категорія', 'Всього', 'Вивчено', 'Вивчається', 'Нові']
-                for i, header in enumerate(headers):
-                    hdr_cells[i].text = header
-                    for paragraph in hdr_cells[i].paragraphs:
-                        for run in paragraph.runs:
-                            run.font.bold = True
-                            run.font.size = Pt(12)
-
-                for cat in cat_stats:
-                    row_cells = table.add_row().cells
-                    row_cells[0].text = cat[0] or "Без категорії"
-                    row_cells[1].text = str(cat[1])
-                    row_cells[2].text = str(cat[2] or 0)
-                    row_cells[3].text = str(cat[3] or 0)
-                    row_cells[4].text = str(cat[4] or 0)
-            else:
-                doc.add_paragraph("Немає даних по категоріях для відображення.")
-
-            section = doc.sections[0]
-            footer = section.footer
-
-            footer_para = footer.paragraphs[0]
-            footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            LOGO_PATH = 'logo.png'
-
+            return
+
+        self._run_in_background(parent, self._export_work(self.write_excel, file_path), on_progress,
+                                lambda _: messagebox.showinfo("Успіх", f"Файл експортовано:\n{file_path}"))
+        return file_path
+
+    def write_excel(self, file_path, on_progress=None, chunk_size=500):
+        """Потоково записує слова у .xlsx: рядки читаються сторінками по chunk_size і одразу
+        пишуться через write-only книгу, тож пам'ять не росте з кількістю слів."""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
+
+        # Підсумки беруться з лічильників, тож і загальна кількість для прогресу нічого не коштує
+        stats = self.db.get_statistics()
+        total = stats['total_words']
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Слова")
+
+        # У write-only режимі ширину колонок треба задати до першого рядка
+        for i, width in enumerate(self.WORD_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(i)].width = width
+
+        header_fill = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF", size=12)
+        header_alignment = Alignment(horizontal="center", vertical="center")
+
+        header_row = []
+        for header in self.WORD_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = header_alignment
+            header_row.append(cell)
+        ws.append(header_row)
+
+        idx = 0
+        for word in self.db.iter_all_words(page_size=chunk_size):
+            idx += 1
+            ws.append([
+                idx,
+                word[1],
+                word[2],
+                word[3] or "",
+                word[4],
+                word[5] or "-",
+                word[6],
+                word[7],
+                word[8],
+                "✓" if word[9] else "",
+                word[10]
+            ])
+            if on_progress and idx % chunk_size == 0:
+                on_progress(idx, max(total, idx))
+
+        stats_ws = wb.create_sheet("Статистика")
+        stats_ws.column_dimensions['A'].width = 25
+        stats_ws.column_dimensions['B'].width = 20
+
+        title = WriteOnlyCell(stats_ws, value="Загальна статистика")
+        title.font = Font(bold=True, size=14)
+        stats_ws.append([title])
+
+        stat_header_fill = PatternFill(start_color="10B981", end_color="10B981", fill_type="solid")
+        stat_header_font = Font(bold=True, color="FFFFFF")
+
+        stat_header_row = []
+        for header in ["Показник", "Значення"]:
+            cell = WriteOnlyCell(stats_ws, value=header)
+            cell.fill = stat_header_fill
+            cell.font = stat_header_font
+            stat_header_row.append(cell)
+        stats_ws.append(stat_header_row)
+
+        stats_data = [
+            ["Всього слів", stats['total_words']],
+            ["Вивчено", stats['learned_words']],
+            ["Вивчається", stats['learning_words']],
+            ["Нові", stats['new_words']],
+            ["Прогрес, %", f"{stats['progress_percentage']:.1f}"],
+            ["Дата звіту", datetime.now().strftime('%d.%m.%Y %H:%M')]
+        ]
+
+        for row in stats_data:
+            stats_ws.append(row)
+
+        wb.save(file_path)
+        if on_progress:
+            on_progress(idx, idx)
+        return idx
+
+    def _run_in_background(self, parent, work, on_progress, on_success, error_title="Помилка експорту",
+                           on_failure=None):
+        """Виконує work(progress) у спільному QueryExecutor. Робочий потік не звертається до Tk: прогрес
+        і результат приходять через чергу виконавця, а закриття вікна скасовує операцію й чекає на неї."""
+        # Лише для GUI: report_cli імпортує цей модуль без customtkinter
+        from query_executor import get_executor
+
+        def failed(error):
+            if on_progress:
+                on_progress(0, 0)
+            messagebox.showerror(error_title, f"Операцію не виконано:\n{str(error)}")
+            if on_failure:
+                on_failure(error)
+
+        return get_executor(parent).submit(
+            work,
+            on_done=on_success,
+            on_error=failed,
+            on_progress=on_progress or (lambda done, total: None),
+            timeout=0,
+            scope="transfer",
+            persistent=True
+        )
+
+    @staticmethod
+    def _export_work(write, file_path):
+        def work(progress):
             try:
-                run_logo = footer_para.add_run()
-                run_logo.add_picture(LOGO_PATH, height=Inches(0.3))
-                footer_para.add_run("   ")
-            except FileNotFoundError:
-                print(f"Warning: Logo file not found at '{LOGO_PATH}'. Skipping logo.")
-            except Exception as e:
-                print(f"Warning: Could not add logo. Error: {e}")
-
-            stats = self.db.get_statistics()
-            stats_text = (
-                f"Загальна статистика: "
-                f"Всього слів: {stats['total_words']} | "
-                f"Вивчено: {stats['learned_words']} | "
-                f"Вивчається: {stats['learning_words']} | "
-                f"Нові: {stats['new_words']} | "
-                f"Прогрес: {stats['progress_percentage']:.1f}%"
-            )
-
-            run_stats = footer_para.add_run(stats_text)
-            run_stats.font.size = Pt(9)
-            run_stats.font.italic = True
-
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".docx",
-                filetypes=[("Word Documents", "*.docx"), ("All Files", "*.*")],
-                initialfile=f"LearnEasy_Statistics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
-            )
-
-            if file_path:
-                doc.save(file_path)
-                messagebox.showinfo("Успіх", f"Файл експортовано:\n{file_path}")
-                return file_path
-
-        except Exception as e:
-            messagebox.showerror("Помилка експорту", f"Не вдалося експортувати:\n{str(e)}")
\ No newline at end of file
+                return write(file_path, progress)
+            except BaseException:
+                # Обірваний файл не лишаємо, щоб його не прийняли за повний експорт
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                raise
+        return work
+
+    DATA_FILETYPES = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Parquet", "*.parquet")]
+
+    def export_data(self, parent, on_progress=None):
+        """Експорт усіх слів у CSV, JSON Lines або Parquet - формат обирається за розширенням файлу."""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=self.DATA_FILETYPES,
+            initialfile=f"LearnEasy_Words_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+        if file_path:
+            self._run_in_background(parent, self._export_work(self.write_data, file_path), on_progress,
+                                    lambda _: messagebox.showinfo("Успіх", f"Файл експортовано:\n{file_path}"))
+        return file_path
+
+    def import_data(self, parent, on_progress=None, on_done=None):
+        file_path = filedialog.askopenfilename(filetypes=self.DATA_FILETYPES + [("All Files", "*.*")])
+        if not file_path:
+            return
+
+        def imported(result):
+            message = (f"Імпортовано слів: {result['added']}\nПропущено дублікатів: {result['duplicates']}\n"
+                       f"з файлу:\n{file_path}")
+            if result['errors']:
+                message += f"\n\nЗаписів з помилками: {len(result['errors'])}"
+                message += "".join(f"\n№{number}: {error}" for number, error in result['errors'][:5])
+            messagebox.showinfo("Успіх", message)
+            if on_done:
+                on_done()
+
+        def failed_after_commit(error):
+            # Пачки, збережені до помилки, лишаються в базі - список слів треба оновити
+            if on_done and getattr(error, 'imported', 0):
+                on_done()
+
+        self._run_in_background(parent, lambda progress: self.read_data(file_path, progress), on_progress,
+                                imported, error_title="Помилка імпорту", on_failure=failed_after_commit)
+        return file_path
+
+    def write_data(self, file_path, on_progress=None, chunk_size=5000):
+        writer = self._data_format(file_path, self.DATA_WRITERS)
+        total = self.db.get_statistics()['total_words']
+
+        def rows():
+            count = 0
+            for row in self.db.iter_transfer_rows(page_size=chunk_size):
+                yield row
+                count += 1
+                if on_progress and count % chunk_size == 0:
+                    on_progress(count, max(total, count))
+
+        count = writer(self, file_path, rows(), chunk_size)
+        if on_progress:
+            on_progress(count, count)
+        return count
+
+    def read_data(self, file_path, on_progress=None, batch_size=5000):
+        reader = self._data_format(file_path, self.DATA_READERS)
+
+        def rows():
+            count = 0
+            for row in reader(self, file_path, batch_size):
+                yield row
+                count += 1
+                if on_progress and count % batch_size == 0:
+                    on_progress(count, 0)
+
+        result = self.db.import_words(rows(), batch_size=batch_size)
+        if on_progress:
+            processed = result['added'] + result['duplicates'] + len(result['errors'])
+            on_progress(processed, processed)
+        return result
+
+    @staticmethod
+    def _data_format(file_path, handlers):
+        extension = file_path.rsplit(".", 1)[-1].lower()
+        if extension not in handlers:
+            raise ValueError(f"Непідтримуваний формат файлу: .{extension}")
+        return handlers[extension]
+
+    @staticmethod
+    def _text(value):
+        if value is None:
+            return ""
+        if hasattr(value, "isoformat"):
+            return value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+        return value
+
+    def _write_csv(self, file_path, rows, chunk_size):
+        count = 0
+        # utf-8-sig, щоб Excel правильно показував кирилицю
+        with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.db.TRANSFER_COLUMNS)
+            for row in rows:
+                writer.writerow([self._text(value) for value in row])
+                count += 1
+        return count
+
+    def _read_csv(self, file_path, batch_size):
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+    def _write_jsonl(self, file_path, rows, chunk_size):
+        columns = self.db.TRANSFER_COLUMNS
+        count = 0
+        with open(file_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                record = {column: self._text(value) if value is not None else None
+                          for column, value in zip(columns, row)}
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        return count
+
+    def _read_jsonl(self, file_path, batch_size):
+        with open(file_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    # Пошкоджений рядок стає помилкою цього запису, а не зупиняє імпорт
+                    yield ValueError(f"рядок {line_number}, позиція {e.colno}: {e.msg}")
+
+    def _write_parquet(self, file_path, rows, chunk_size):
+        pa, pq = self._pyarrow()
+        columns = self.db.TRANSFER_COLUMNS
+        schema = pa.schema([
+            (column, pa.int64() if column in ("difficulty_level", "knowledge_level", "times_shown",
+                                              "times_correct", "times_wrong")
+             else pa.bool_() if column in ("is_favorite", "is_archived")
+             else pa.timestamp("s") if column in ("last_shown", "created_at")
+             else pa.string())
+            for column in columns
+        ])
+
+        count = 0
+        with pq.ParquetWriter(file_path, schema) as writer:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    writer.write_table(self._parquet_table(pa, schema, chunk))
+                    count += len(chunk)
+                    chunk = []
+            if chunk or not count:
+                writer.write_table(self._parquet_table(pa, schema, chunk))
+                count += len(chunk)
+        return count
+
+    @staticmethod
+    def _parquet_table(pa, schema, chunk):
+        columns = list(zip(*chunk)) if chunk else [[] for _ in schema]
+        arrays = []
+        for field, values in zip(schema, columns):
+            if pa.types.is_boolean(field.type):
+                values = [bool(value) for value in values]
+            elif pa.types.is_timestamp(field.type):
+                values = [value if not isinstance(value, str) else datetime.fromisoformat(value)
+                          for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def _read_parquet(self, file_path, batch_size):
+        _, pq = self._pyarrow()
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+
+    @staticmethod
+    def _pyarrow():
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Для формату Parquet потрібен пакет pyarrow")
+        return pa, pq
+
+    DATA_WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+    DATA_READERS = {"csv": _read_csv, "jsonl": _read_jsonl, "parquet": _read_parquet}
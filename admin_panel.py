@@ -1,19 +1,53 @@
 import customtkinter as ctk
 from tkinter import messagebox, ttk
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
+from query_executor import get_executor
+from ui.user_rows import UserRow
+from ui.virtual_list import VirtualList
+from ui.word_rows import LabelRow
+from user_index import UserIndex
+
 
 class AdminPanel(ctk.CTkFrame):
-    def __init__(self, parent, auth_manager, user_manager, role_manager):
+    USERS_PAGE_SIZE = 100
+    SEARCH_DELAY_MS = 300
+
+    STATUS_FILTERS = {
+        "Усі статуси": None,
+        "✅ Активні": 'active',
+        "⏸️ Неактивні": 'inactive',
+        "🔒 Заблоковані": 'locked',
+    }
+    # (вхід не раніше ніж N днів тому, вхід раніше ніж N днів тому)
+    LAST_LOGIN_PERIODS = {
+        "Вхід будь-коли": (None, None),
+        "Вхід за 7 днів": (7, None),
+        "Вхід за 30 днів": (30, None),
+        "Вхід понад 30 днів тому": (None, 31),
+    }
+
+    def __init__(self, parent, auth_manager, user_manager, role_manager, run_in_session):
         super().__init__(parent, fg_color="transparent")
 
         self.auth = auth_manager
         self.user_manager = user_manager
         self.role_manager = role_manager
+        # Дії панелі, як і кнопки меню, виконуються лише після перевірки сесії
+        self.run_in_session = run_in_session
+        self.user_index = UserIndex()
+        self.users_filters = {}
+        self.users_next_cursor = None
+        # Пошук на сервері, поки завантажено не всіх: {'term', 'index', 'next_cursor', 'total'}
+        self.server_search = None
+        self.shown_term = ""
+        self.users_total = (None, False)
+        self.search_after_id = None
 
         self.create_widgets()
 
+        get_executor(self).submit(self.role_manager.get_all_roles, on_done=self.show_role_filter, owner=self)
         self.load_users()
 
     def create_widgets(self):
@@ -31,7 +65,7 @@ class AdminPanel(ctk.CTkFrame):
             add_btn = ctk.CTkButton(
                 header,
                 text="➕ Додати користувача",
-                command=self.show_create_user_dialog,
+                command=lambda: self.run_in_session(self.show_create_user_dialog),
                 height=40,
                 fg_color="#10B981",
                 hover_color="#059669"
@@ -54,17 +88,56 @@ class AdminPanel(ctk.CTkFrame):
             placeholder_text="Ім'я користувача або email"
         )
         self.search_entry.pack(side="left", padx=10, pady=10)
-        self.search_entry.bind("<KeyRelease>", lambda e: self.filter_users())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.on_search_key())
+
+        self.role_filter_var = ctk.StringVar(value="Усі ролі")
+        self.role_filter_menu = ctk.CTkOptionMenu(
+            filter_frame,
+            variable=self.role_filter_var,
+            values=["Усі ролі"],
+            command=lambda _: self.run_in_session(self.load_users),
+            width=140,
+            height=35
+        )
+        self.role_filter_menu.pack(side="left", padx=5, pady=10)
+
+        self.status_filter_var = ctk.StringVar(value="Усі статуси")
+        ctk.CTkOptionMenu(
+            filter_frame,
+            variable=self.status_filter_var,
+            values=list(self.STATUS_FILTERS),
+            command=lambda _: self.run_in_session(self.load_users),
+            width=140,
+            height=35
+        ).pack(side="left", padx=5, pady=10)
+
+        self.last_login_var = ctk.StringVar(value="Вхід будь-коли")
+        ctk.CTkOptionMenu(
+            filter_frame,
+            variable=self.last_login_var,
+            values=list(self.LAST_LOGIN_PERIODS),
+            command=lambda _: self.run_in_session(self.load_users),
+            width=190,
+            height=35
+        ).pack(side="left", padx=5, pady=10)
 
         ctk.CTkButton(
             filter_frame,
             text="🔄 Оновити",
-            command=self.load_users,
+            command=lambda: self.run_in_session(self.load_users),
             width=100,
             height=35,
             fg_color="#3B82F6"
         ).pack(side="right", padx=20, pady=10)
 
+        self.count_label = ctk.CTkLabel(
+            filter_frame,
+            text="",
+            font=ctk.CTkFont(size=13),
+            text_color="#94A3B8"
+        )
+        self.count_label.pack(side="right", padx=10, pady=10)
+
         self.create_users_table()
 
     def create_users_table(self):
@@ -87,167 +160,182 @@ class AdminPanel(ctk.CTkFrame):
             )
             label.pack(side="left", padx=10, pady=10)
 
-        self.users_scroll = ctk.CTkScrollableFrame(
-            table_frame,
-            fg_color="transparent"
+        self.users_list = VirtualList(table_frame, {
+            "user": (76, lambda parent: UserRow(parent, self)),
+            "message": (130, lambda parent: LabelRow(
+                parent, 130, ctk.CTkFont(size=14), "#94A3B8", anchor="center", pady=50)),
+        }, on_end_reached=self.load_more_users, fg_color="transparent")
+        self.users_list.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def show_role_filter(self, roles):
+        names = [role['display_name'] for role in roles if role['is_active']]
+        self.role_filter_menu.configure(values=["Усі ролі"] + names)
+
+    def read_users_filters(self):
+        # Пошуковий рядок сюди не входить: за ним фільтруються вже завантажені користувачі
+        role = self.role_filter_var.get()
+        newer_than, older_than = self.LAST_LOGIN_PERIODS[self.last_login_var.get()]
+        today = datetime.now()
+        return dict(
+            role=None if role == "Усі ролі" else role,
+            status=self.STATUS_FILTERS[self.status_filter_var.get()],
+            last_login_from=today - timedelta(days=newer_than) if newer_than else None,
+            last_login_to=today - timedelta(days=older_than) if older_than else None
         )
-        self.users_scroll.pack(fill="both", expand=True, padx=5, pady=5)
 
     def load_users(self):
+        self.cancel_search_timer()
+        self.users_filters = self.read_users_filters()
+        # Поки перша сторінка не прийшла, шукати нема серед чого
+        self.user_index = None
+        self.users_next_cursor = None
+        self.server_search = None
+        self.users_list.set_items([("message", "⏳ Завантаження...")])
+
+        executor = get_executor(self)
+        executor.cancel(scope="users")
+        executor.cancel(scope="user_search")
+        executor.submit(
+            self.user_manager.get_users_page,
+            page_size=self.USERS_PAGE_SIZE,
+            on_done=self.show_users_page,
+            on_error=lambda e: messagebox.showerror("Помилка", f"Не вдалося завантажити користувачів:\n{str(e)}"),
+            owner=self.users_list,
+            scope="users",
+            **self.users_filters
+        )
 
-        for widget in self.users_scroll.winfo_children():
-            widget.destroy()
-
-        try:
-            users = self.user_manager.get_all_users()
-
-            if not users:
-                no_data = ctk.CTkLabel(
-                    self.users_scroll,
-                    text="Немає користувачів або недостатньо прав для перегляду",
-                    font=ctk.CTkFont(size=14),
-                    text_color="#94A3B8"
-                )
-                no_data.pack(pady=50)
-                return
+    def show_users_page(self, page):
+        self.user_index = UserIndex(page['rows'])
+        self.users_next_cursor = page['next_cursor']
+        self.users_total = (page['total'], page['total_is_estimate'])
+        self.filter_users()
 
-            for user in users:
-                self.create_user_row(user)
+    def load_more_users(self):
+        if self.server_search is not None:
+            self.load_more_search_results()
+            return
+        # Поки діє пошук, у списку лише збіги з завантаженого - догортати за ним нічого
+        if self.users_next_cursor is None or self.search_term():
+            return
 
-        except Exception as e:
-            messagebox.showerror("Помилка", f"Не вдалося завантажити користувачів:\n{str(e)}")
+        cursor, self.users_next_cursor = self.users_next_cursor, None
+        get_executor(self).submit(
+            self.user_manager.get_users_page,
+            page_size=self.USERS_PAGE_SIZE,
+            after=cursor,
+            on_done=self.append_users_page,
+            owner=self.users_list,
+            scope="users",
+            **self.users_filters
+        )
 
-    def create_user_row(self, user: dict):
+    def append_users_page(self, page):
+        self.users_next_cursor = page['next_cursor']
+        self.user_index.extend(page['rows'])
+        if self.search_term():
+            # Пошук почали, поки сторінка вантажилась
+            self.filter_users()
+            return
+        self.users_list.append_items([("user", user) for user in page['rows']])
+        self.update_count_label(len(self.user_index))
 
-        row = ctk.CTkFrame(self.users_scroll, fg_color="#1E293B", height=70)
-        row.pack(fill="x", pady=3)
-        row.pack_propagate(False)
+    def search_term(self):
+        return self.search_entry.get().strip()
 
-        ctk.CTkLabel(row, text=str(user['id']), width=50).pack(side="left", padx=10)
+    def on_search_key(self):
+        # Стрілки, Shift тощо рядок пошуку не змінюють
+        if self.search_term() != self.shown_term:
+            self.filter_users()
 
-        username_label = ctk.CTkLabel(
-            row,
-            text=user['username'],
-            width=150,
-            anchor="w",
-            font=ctk.CTkFont(size=13, weight="bold")
+    def filter_users(self):
+        """Фільтрує завантажених користувачів у пам'яті; до сервера звертається лише тоді,
+        коли за поточними фільтрами завантажено не всіх."""
+        self.cancel_search_timer()
+        get_executor(self).cancel(scope="user_search")
+        self.server_search = None
+
+        term = self.shown_term = self.search_term()
+        if self.user_index is None:
+            return
+        self.show_users(self.user_index.search(term), searching=bool(term) and self.users_next_cursor is not None)
+        if term and self.users_next_cursor is not None:
+            self.search_after_id = self.after(self.SEARCH_DELAY_MS, lambda: self.search_server(term))
+
+    def show_users(self, users, searching=False, total=None):
+        if users:
+            self.users_list.set_items([("user", user) for user in users])
+        elif searching:
+            self.users_list.set_items([("message", "🔍 Пошук...")])
+        elif self.search_term() or any(self.users_filters.values()):
+            self.users_list.set_items([("message", "Користувачів не знайдено")])
+        else:
+            self.users_list.set_items([("message", "Немає користувачів або недостатньо прав для перегляду")])
+        self.update_count_label(len(users), total)
+
+    def search_server(self, term):
+        self.search_after_id = None
+        get_executor(self).submit(
+            self.user_manager.get_users_page,
+            search=term,
+            page_size=self.USERS_PAGE_SIZE,
+            on_done=lambda page: self.show_search_page(term, page),
+            owner=self.users_list,
+            scope="user_search",
+            **self.users_filters
         )
-        username_label.pack(side="left", padx=10)
 
-        email_label = ctk.CTkLabel(
-            row,
-            text=user['email'] or "-",
-            width=200,
-            anchor="w",
-            text_color="#94A3B8"
-        )
-        email_label.pack(side="left", padx=10)
-
-        role_label = ctk.CTkLabel(
-            row,
-            text=user['role'],
-            width=120,
-            fg_color="#3B82F6",
-            corner_radius=5
-        )
-        role_label.pack(side="left", padx=10, pady=15)
-
-        if user['is_locked']:
-            status_text = "🔒 Заблок."
-            status_color = "#EF4444"
-        elif not user['is_active']:
-            status_text = "⏸️ Неактив."
-            status_color = "#F59E0B"
-        else:
-            status_text = "✅ Активний"
-            status_color = "#10B981"
+    def show_search_page(self, term, page):
+        if term != self.search_term():
+            return
+        # Результати сервера тримаються окремо, щоб не змішувати їх зі сторінками повного списку
+        self.server_search = {
+            'term': term,
+            'index': UserIndex(page['rows']),
+            'next_cursor': page['next_cursor'],
+            'total': (page['total'], False),
+        }
+        self.show_users(self.server_search['index'].search(term), total=self.server_search['total'])
+
+    def load_more_search_results(self):
+        search = self.server_search
+        if search['next_cursor'] is None:
+            return
 
-        status_label = ctk.CTkLabel(
-            row,
-            text=status_text,
-            width=100,
-            text_color=status_color,
-            font=ctk.CTkFont(weight="bold")
+        cursor, search['next_cursor'] = search['next_cursor'], None
+        get_executor(self).submit(
+            self.user_manager.get_users_page,
+            search=search['term'],
+            page_size=self.USERS_PAGE_SIZE,
+            after=cursor,
+            on_done=lambda page: self.append_search_page(search, page),
+            owner=self.users_list,
+            scope="user_search",
+            **self.users_filters
         )
-        status_label.pack(side="left", padx=10)
 
-        last_login = user['last_login']
-        if last_login:
-            if isinstance(last_login, str):
-                last_login_text = last_login[:16]
-            else:
-                last_login_text = last_login.strftime("%d.%m.%Y %H:%M")
+    def append_search_page(self, search, page):
+        if search is not self.server_search:
+            return
+        search['next_cursor'] = page['next_cursor']
+        search['index'].extend(page['rows'])
+        self.users_list.append_items([("user", user) for user in page['rows']])
+        self.update_count_label(len(search['index']), search['total'])
+
+    def update_count_label(self, shown, total=None):
+        # Без пошуку - скільки завантажено зі скількох; при пошуку загальна кількість відома лише від сервера
+        if total is None and not self.search_term():
+            total = self.users_total
+        if total is None or total[0] is None:
+            self.count_label.configure(text=f"Показано: {shown}")
         else:
-            last_login_text = "Ніколи"
-
-        ctk.CTkLabel(
-            row,
-            text=last_login_text,
-            width=150,
-            text_color="#64748B"
-        ).pack(side="left", padx=10)
+            count, is_estimate = total
+            self.count_label.configure(text=f"Показано: {shown} з {'≈' if is_estimate else ''}{count}")
 
-        actions_frame = ctk.CTkFrame(row, fg_color="transparent", width=180)
-        actions_frame.pack(side="right", padx=10)
-
-        if self.auth.has_permission('users.edit'):
-            ctk.CTkButton(
-                actions_frame,
-                text="✏️",
-                width=35,
-                height=35,
-                command=lambda u=user: self.edit_user(u),
-                fg_color="#3B82F6"
-            ).pack(side="left", padx=2)
-
-        if self.auth.has_permission('users.block'):
-            if user['is_locked']:
-                ctk.CTkButton(
-                    actions_frame,
-                    text="🔓",
-                    width=35,
-                    height=35,
-                    command=lambda u=user: self.unblock_user(u),
-                    fg_color="#10B981"
-                ).pack(side="left", padx=2)
-            else:
-                ctk.CTkButton(
-                    actions_frame,
-                    text="🔒",
-                    width=35,
-                    height=35,
-                    command=lambda u=user: self.block_user(u),
-                    fg_color="#F59E0B"
-                ).pack(side="left", padx=2)
-
-        if self.auth.has_permission('users.delete'):
-            if user['id'] != self.auth.current_user['user_id']:
-                ctk.CTkButton(
-                    actions_frame,
-                    text="🗑️",
-                    width=35,
-                    height=35,
-                    command=lambda u=user: self.delete_user(u),
-                    fg_color="#EF4444"
-                ).pack(side="left", padx=2)
-
-    def filter_users(self):
-        search_text = self.search_entry.get().lower()
-
-        for row in self.users_scroll.winfo_children():
-            if isinstance(row, ctk.CTkFrame):
-                username_found = False
-                for widget in row.winfo_children():
-                    if isinstance(widget, ctk.CTkLabel):
-                        text = widget.cget("text").lower()
-                        if search_text in text:
-                            username_found = True
-                            break
-
-                if username_found or not search_text:
-                    row.pack(fill="x", pady=3)
-                else:
-                    row.pack_forget()
+    def cancel_search_timer(self):
+        if self.search_after_id is not None:
+            self.after_cancel(self.search_after_id)
+            self.search_after_id = None
 
     def show_create_user_dialog(self):
         dialog = CreateUserDialog(self, self.user_manager, self.role_manager, self.load_users)
@@ -340,25 +428,24 @@ class CreateUserDialog(ctk.CTkToplevel):
 
         ctk.CTkLabel(form_frame, text="Роль *:", anchor="w").pack(fill="x", pady=(10, 5))
 
-        roles = self.role_manager.get_all_roles()
-        role_names = [role['role_name'] for role in roles if role['is_active']]
-
-        self.role_var = ctk.StringVar(value=role_names[0] if role_names else "")
+        self.role_var = ctk.StringVar(value="")
         self.role_menu = ctk.CTkOptionMenu(
             form_frame,
-            values=role_names,
+            values=[""],
             variable=self.role_var,
             height=40
         )
         self.role_menu.pack(fill="x", pady=(0, 20))
 
+        get_executor(self).submit(self.role_manager.get_all_roles, on_done=self.show_roles, owner=self.role_menu)
+
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
         btn_frame.pack(pady=30)
 
         ctk.CTkButton(
             btn_frame,
             text="Створити",
-            command=self.create_user,
+            command=lambda: self.master.run_in_session(self.create_user),
             width=150,
             height=45,
             fg_color="#10B981",
@@ -374,6 +461,11 @@ class CreateUserDialog(ctk.CTkToplevel):
             fg_color="#64748B"
         ).pack(side="left", padx=10)
 
+    def show_roles(self, roles):
+        role_names = [role['role_name'] for role in roles if role['is_active']]
+        self.role_menu.configure(values=role_names or [""])
+        self.role_var.set(role_names[0] if role_names else "")
+
     def create_user(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
@@ -0,0 +1,228 @@
+import json
+import os
+import queue
+import threading
+
+from file_slots import MAX_SLOTS, claim_slot, orphaned_slots
+
+# Параметри sp_LogAction у порядку виклику; час дії процедура ставить сама
+AUDIT_COLUMNS = ("user_id", "action_type", "table_name", "record_id", "old_value", "new_value", "ip_address")
+
+
+class AuditQueue:
+    """Асинхронний запис журналу аудиту.
+
+    log() лише кладе запис в обмежену чергу; фоновий потік збирає записи пакетами та
+    передає їх у sp_LogAction одним executemany. Якщо черга переповнена, виклик чекає до
+    `put_timeout` секунд, а тоді пише запис у локальний файл. Туди ж потрапляють пакети,
+    які не вдалося записати в БД - вони повторюються перед наступним пакетом.
+
+    Помилки dialect.row_errors означають, що БД не приймає сам запис: пакет повторюється
+    по рядку, а такі записи переносяться у файл `<файл>.rejected` і не блокують наступні.
+
+    spill_path - базова назва файлу; кожен процес займає власний файл так само, як
+    InteractionJournal, і при старті забирає файли процесів, що завершились аварійно.
+    """
+
+    def __init__(self, pool, dialect, spill_path=None, max_size=1000, max_batch=100, flush_interval=2.0,
+                 put_timeout=0.5):
+        self.pool = pool
+        self.dialect = dialect
+        self.base_path = spill_path
+        self.spill_path = None
+        self._lock_file = None
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+
+        self._queue = queue.Queue(maxsize=max_size)
+        self._spill_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread = None
+
+    def start(self):
+        if self.base_path:
+            self._claim_spill()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def log(self, user_id, action_type, table_name, record_id=None, old_value=None, new_value=None,
+            ip_address=None):
+        entry = (user_id, action_type, table_name, record_id, old_value, new_value, ip_address)
+
+        if self._closed:
+            self._spill([entry])
+            return
+
+        try:
+            self._queue.put(entry, timeout=self.put_timeout)
+        except queue.Full:
+            print("Черга аудиту переповнена, запис збережено у файл")
+            self._spill([entry])
+
+    def pending_count(self):
+        return self._queue.qsize()
+
+    def flush(self):
+        with self._flush_lock:
+            written = 0
+            while True:
+                batch = self._take(self.max_batch)
+                if not batch:
+                    return written
+                if not self._write(batch):
+                    return written
+                written += len(batch)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread:
+            self._thread.join(self.flush_interval + 5)
+        self.flush()
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _run(self):
+        while not self._closed:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # Без нових записів пробуємо дописати те, що лишилось у файлі
+                with self._flush_lock:
+                    self._replay_spill()
+                continue
+
+            with self._flush_lock:
+                self._write([first] + self._take(self.max_batch - 1))
+
+    def _take(self, limit):
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        # Спершу старіші записи з файлу, щоб зберегти порядок
+        if not self._replay_spill():
+            self._spill(batch)
+            return False
+
+        left = self._store(batch)
+        if left:
+            self._spill(left)
+            return False
+        return True
+
+    def _store(self, entries):
+        """Записує entries у БД. Повертає ті, що лишились незаписаними, бо БД недоступна."""
+        try:
+            self._insert(entries)
+            return []
+        except self.dialect.row_errors as e:
+            print(f"Помилка запису аудиту: {e}")
+        except Exception as e:
+            print(f"Помилка запису аудиту: {e}")
+            return entries
+
+        # Пакет відкотився через якийсь рядок - шукаємо його, записуючи по одному
+        for position, entry in enumerate(entries):
+            try:
+                self._insert([entry])
+            except self.dialect.row_errors as e:
+                self._reject(entry, e)
+            except Exception:
+                return entries[position:]
+        return []
+
+    def _insert(self, entries):
+        with self.pool.cursor(commit=True) as cursor:
+            self.dialect.log_actions(cursor, entries)
+
+    def _spill(self, entries):
+        if not self.spill_path:
+            print(f"Втрачено {len(entries)} записів аудиту: файл для збереження не задано")
+            return
+        with self._spill_lock:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(self._spill_line(entry))
+
+    @staticmethod
+    def _spill_line(entry):
+        return json.dumps(entry, ensure_ascii=False) + "\n"
+
+    def _reject(self, entry, error):
+        print(f"Запис аудиту відхилено БД: {error}")
+        if not self.spill_path:
+            return
+        with open(self.spill_path + ".rejected", "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry + (str(error),), ensure_ascii=False) + "\n")
+
+    def _replay_spill(self):
+        if not self.spill_path:
+            return True
+
+        with self._spill_lock:
+            if not os.path.exists(self.spill_path) or not os.path.getsize(self.spill_path):
+                return True
+
+            entries = self._read_spill(self.spill_path)
+            left = self._store(entries)
+            with open(self.spill_path, "w", encoding="utf-8") as f:
+                for entry in left:
+                    f.write(self._spill_line(entry))
+
+            if left:
+                return False
+            print(f"Записано {len(entries)} збережених записів аудиту")
+            return True
+
+    def _claim_spill(self):
+        self.spill_path, self._lock_file = claim_slot(self.base_path)
+        if not self.spill_path:
+            print(f"Усі {MAX_SLOTS} файлів аудиту зайняті, записи без зв'язку з БД не зберігатимуться")
+            return
+
+        orphaned = orphaned_slots(self.base_path, self.spill_path)
+        if not orphaned:
+            return
+
+        # Спершу чужі записи переносяться у свій файл, а вже потім чужі файли видаляються
+        with self._spill_lock:
+            entries = self._read_spill(self.spill_path)
+            for path, _ in orphaned:
+                entries.extend(self._read_spill(path))
+            with open(self.spill_path, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(self._spill_line(entry))
+
+        for path, lock_file in orphaned:
+            os.remove(path)
+            lock_file.close()
+
+    @staticmethod
+    def _read_spill(path):
+        if not os.path.exists(path):
+            return []
+
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    # Файли попередніх версій мають ще й час дії - його тепер ставить процедура
+                    entries.append(tuple(json.loads(line))[:len(AUDIT_COLUMNS)])
+                except ValueError:
+                    # Обірваний останній рядок після аварії
+                    continue
+        return entries
@@ -1,36 +1,57 @@
 import hashlib
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, FrozenSet
 import pyodbc
 
+from audit_log import AuditQueue
+from config import AppConfig, DatabaseConfig
+
 
 class AuthManager:
 
-    def __init__(self, db_connection):
-        self.conn = db_connection
-        self.cursor = db_connection.cursor()
+    def __init__(self, db_pool, dialect):
+        self.pool = db_pool
         self.current_user: Optional[Dict] = None
         self.session_token: Optional[str] = None
+        # Дозволи поточного користувача: завантажуються при вході й оновлюються після TTL
+        self._permissions: Optional[FrozenSet[str]] = None
+        self._permissions_loaded_at = 0.0
+        self._permissions_lock = threading.Lock()
+        # Ковзне вікно сесії: кожна дія користувача відсуває момент завершення
+        self._session_expires_at = 0.0
+        # Коли сесію востаннє підтвердив сервер - від цього, а не від активності, рахується повторна перевірка
+        self._validated_at = 0.0
+        self.audit = AuditQueue(
+            db_pool,
+            dialect,
+            spill_path=DatabaseConfig.AUDIT_SPILL_PATH,
+            max_size=DatabaseConfig.AUDIT_QUEUE_SIZE,
+            max_batch=DatabaseConfig.AUDIT_MAX_BATCH,
+            flush_interval=DatabaseConfig.AUDIT_FLUSH_SECONDS,
+            put_timeout=DatabaseConfig.AUDIT_PUT_TIMEOUT_SECONDS
+        ).start()
 
     def login(self, username: str, password: str, ip_address: str = None) -> Dict:
         print(f"--- ПОЧАТОК ВХОДУ: {username} ---")
         try:
-            sql = "{CALL LoginUser (?, ?)}"
-            self.cursor.execute(sql, (username, password))
-
-            while self.cursor.description is None:
-                if not self.cursor.nextset():
-                    break
+            with self.pool.cursor(commit=True) as cursor:
+                sql = "{CALL LoginUser (?, ?)}"
+                cursor.execute(sql, (username, password))
 
-            row = self.cursor.fetchone()
+                while cursor.description is None:
+                    if not cursor.nextset():
+                        break
 
-            if row:
-                print(f"Відповідь від БД: success={row[0]}, message={row[1]}, role={row[2]}")
-            else:
-                print("БД не повернула жодних даних")
+                row = cursor.fetchone()
+                columns = [column[0].lower() for column in cursor.description or ()]
 
-            self.conn.commit()
+                if row:
+                    print(f"Відповідь від БД: success={row[0]}, message={row[1]}, role={row[2]}")
+                else:
+                    print("БД не повернула жодних даних")
 
             if not row:
                 return {
@@ -52,6 +73,12 @@ class AuthManager:
                     'email': email,
                     'role_name': role
                 }
+                # Процедура повертає токен сесії окремим стовпцем; без нього сесія перевіряється за станом користувача
+                self.session_token = row[columns.index('session_token')] if 'session_token' in columns else None
+                self.invalidate_permissions()
+                self.get_permissions()
+                self.touch()
+                self._validated_at = time.monotonic()
 
                 print(f"✅ Успішний вхід. Роль: {role}")
                 return {
@@ -71,23 +98,22 @@ class AuthManager:
             import traceback
             traceback.print_exc()
 
-            try:
-                self.conn.rollback()
-            except:
-                pass
-
             return {
                 'success': False,
                 'message': f'Помилка системи: {str(e)}'
             }
 
     def logout(self) -> bool:
+        self.invalidate_permissions()
+        self._session_expires_at = 0.0
+        self._validated_at = 0.0
         if not self.session_token:
+            self.current_user = None
             return False
 
         try:
-            self.cursor.execute("EXEC sp_Logout ?", (self.session_token,))
-            self.conn.commit()
+            with self.pool.cursor(commit=True) as cursor:
+                cursor.execute("EXEC sp_Logout ?", (self.session_token,))
 
             self.current_user = None
             self.session_token = None
@@ -98,10 +124,14 @@ class AuthManager:
 
     def validate_session(self, session_token: str) -> bool:
         try:
-            self.cursor.execute("EXEC sp_ValidateSession ?", (session_token,))
-            result = self.cursor.fetchone()
+            with self.pool.cursor() as cursor:
+                cursor.execute("EXEC sp_ValidateSession ?", (session_token,))
+                result = cursor.fetchone()
 
             if result and result[5] == 1:
+                if not self.current_user or self.current_user['user_id'] != result[0] \
+                        or self.current_user['role_name'] != result[3]:
+                    self.invalidate_permissions()
                 self.current_user = {
                     'user_id': result[0],
                     'username': result[1],
@@ -109,37 +139,95 @@ class AuthManager:
                     'role_name': result[3]
                 }
                 self.session_token = session_token
+                self.touch()
+                self._validated_at = time.monotonic()
                 return True
             return False
 
         except:
             return False
 
-    def has_permission(self, permission_name: str) -> bool:
-        if not self.current_user:
-            return False
-
+    def _validate_user(self) -> bool:
+        # Сесія без токена: користувач має лишатися активним і не заблокованим
         try:
-            query = "SELECT dbo.fn_UserHasPermission(?, ?)"
-            self.cursor.execute(query, (self.current_user['user_id'], permission_name))
-            result = self.cursor.fetchone()
+            with self.pool.cursor() as cursor:
+                cursor.execute("SELECT is_active, is_locked FROM Users WHERE id = ?",
+                               (self.current_user['user_id'],))
+                row = cursor.fetchone()
+        except Exception as e:
+            print(f"Помилка перевірки сесії: {e}")
+            return False
 
-            return result[0] == 1 if result else False
-        except:
+        if not row or not row[0] or row[1]:
             return False
+        # Роль могла змінитись - дозволи перечитуються з сервера
+        self.invalidate_permissions()
+        self.touch()
+        self._validated_at = time.monotonic()
+        return True
 
-    def get_user_permissions(self) -> List[str]:
+    def touch(self):
+        self._session_expires_at = time.monotonic() + AppConfig.SESSION_TIMEOUT_MINUTES * 60
+
+    def session_seconds_left(self) -> float:
+        return max(0.0, self._session_expires_at - time.monotonic())
+
+    def check_session(self) -> bool:
+        """Перевірка сесії перед дією; успішна перевірка подовжує сесію. Зазвичай лише порівнює час
+        у пам'яті; до сервера звертається, якщо він не підтверджував сесію SESSION_REVALIDATE_MINUTES."""
         if not self.current_user:
-            return []
+            return False
+
+        if self.session_seconds_left() <= 0:
+            return False
 
+        if time.monotonic() - self._validated_at >= AppConfig.SESSION_REVALIDATE_MINUTES * 60:
+            if self.session_token:
+                return self.validate_session(self.session_token)
+            return self._validate_user()
+
+        self.touch()
+        return True
+
+    def has_permission(self, permission_name: str) -> bool:
+        return permission_name in self.get_permissions()
+
+    def get_permissions(self) -> FrozenSet[str]:
+        user = self.current_user
+        if not user:
+            return frozenset()
+
+        with self._permissions_lock:
+            if self._permissions is not None and \
+                    time.monotonic() - self._permissions_loaded_at < AppConfig.PERMISSIONS_CACHE_SECONDS:
+                return self._permissions
+
+            permissions = self._fetch_permissions(user['user_id'])
+            # Після помилки БД не кешуємо порожній набір, щоб наступна перевірка спробувала знову
+            if permissions is None:
+                return frozenset()
+            if self.current_user is user:
+                self._permissions = permissions
+                self._permissions_loaded_at = time.monotonic()
+            return permissions
+
+    def invalidate_permissions(self):
+        # Викликається при вході, виході та зміні ролі
+        with self._permissions_lock:
+            self._permissions = None
+
+    def _fetch_permissions(self, user_id) -> Optional[FrozenSet[str]]:
         try:
             query = "SELECT permission_name FROM dbo.fn_GetUserPermissions(?)"
-            self.cursor.execute(query, (self.current_user['user_id'],))
+            with self.pool.cursor() as cursor:
+                cursor.execute(query, (user_id,))
+                return frozenset(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            print(f"Помилка завантаження дозволів: {e}")
+            return None
 
-            permissions = [row[0] for row in self.cursor.fetchall()]
-            return permissions
-        except:
-            return []
+    def get_user_permissions(self) -> List[str]:
+        return sorted(self.get_permissions())
 
     def log_action(self, action_type: str, table_name: str,
                    record_id: int = None, old_value: str = None,
@@ -148,22 +236,18 @@ class AuthManager:
         if not self.current_user:
             return
 
-        try:
-            self.cursor.execute(
-                "EXEC sp_LogAction ?, ?, ?, ?, ?, ?, ?",
-                (
-                    self.current_user['user_id'],
-                    action_type,
-                    table_name,
-                    record_id,
-                    old_value,
-                    new_value,
-                    ip_address
-                )
-            )
-            self.conn.commit()
-        except Exception as e:
-            print(f"Помилка логування: {e}")
+        self.audit.log(
+            self.current_user['user_id'],
+            action_type,
+            table_name,
+            record_id,
+            old_value,
+            new_value,
+            ip_address
+        )
+
+    def close(self):
+        self.audit.close()
 
     def is_authenticated(self) -> bool:
         return self.current_user is not None
@@ -181,9 +265,8 @@ class AuthManager:
 
 class UserManager:
 
-    def __init__(self, db_connection, auth_manager: AuthManager):
-        self.conn = db_connection
-        self.cursor = db_connection.cursor()
+    def __init__(self, db_pool, auth_manager: AuthManager):
+        self.pool = db_pool
         self.auth = auth_manager
 
     def create_user(self, username: str, password: str, email: str,
@@ -191,23 +274,23 @@ class UserManager:
         try:
             self.auth.require_permission('users.create')
 
-            new_user_id = self.cursor.var(pyodbc.SQL_INTEGER)
-
-            self.cursor.execute(
-                "EXEC sp_CreateUser ?, ?, ?, ?, ?, ?, ?",
-                (
-                    username,
-                    password,
-                    email,
-                    full_name,
-                    role_name,
-                    self.auth.current_user['user_id'],
-                    new_user_id
+            with self.pool.cursor(commit=True) as cursor:
+                new_user_id = cursor.var(pyodbc.SQL_INTEGER)
+
+                cursor.execute(
+                    "EXEC sp_CreateUser ?, ?, ?, ?, ?, ?, ?",
+                    (
+                        username,
+                        password,
+                        email,
+                        full_name,
+                        role_name,
+                        self.auth.current_user['user_id'],
+                        new_user_id
+                    )
                 )
-            )
 
-            result = self.cursor.fetchone()
-            self.conn.commit()
+                result = cursor.fetchone()
 
             self.auth.log_action(
                 'CREATE',
@@ -228,35 +311,42 @@ class UserManager:
         except Exception as e:
             return {'success': False, 'message': f'Помилка: {str(e)}'}
 
-    def get_all_users(self) -> List[Dict]:
-        try:
-            self.auth.require_permission('users.view')
-
-            query = """
-                SELECT 
+    USER_COLUMNS = """
+                SELECT
                     id, username, email, full_name, role_display_name,
                     is_active, is_locked, last_login, created_at
-                FROM vw_UserDetails
-                ORDER BY created_at DESC
-            """
+                FROM vw_UserDetails"""
+
+    # Значення фільтра статусу в AdminPanel
+    USER_STATUSES = {
+        'active': " AND is_active = 1 AND is_locked = 0",
+        'inactive': " AND is_active = 0",
+        'locked': " AND is_locked = 1",
+    }
+
+    @staticmethod
+    def _user_dict(row) -> Dict:
+        return {
+            'id': row[0],
+            'username': row[1],
+            'email': row[2],
+            'full_name': row[3],
+            'role': row[4],
+            'is_active': row[5],
+            'is_locked': row[6],
+            'last_login': row[7],
+            'created_at': row[8]
+        }
 
-            self.cursor.execute(query)
+    def get_all_users(self) -> List[Dict]:
+        try:
+            self.auth.require_permission('users.view')
 
-            users = []
-            for row in self.cursor.fetchall():
-                users.append({
-                    'id': row[0],
-                    'username': row[1],
-                    'email': row[2],
-                    'full_name': row[3],
-                    'role': row[4],
-                    'is_active': row[5],
-                    'is_locked': row[6],
-                    'last_login': row[7],
-                    'created_at': row[8]
-                })
+            with self.pool.cursor() as cursor:
+                cursor.execute(self.USER_COLUMNS + " ORDER BY created_at DESC")
+                rows = cursor.fetchall()
 
-            return users
+            return [self._user_dict(row) for row in rows]
 
         except PermissionError:
             return []
@@ -264,15 +354,99 @@ class UserManager:
             print(f"Помилка отримання користувачів: {e}")
             return []
 
+    def get_users_page(self, search: str = "", role: str = None, status: str = None, last_login_from=None,
+                       last_login_to=None, page_size: int = 100, after=None, with_total: bool = None) -> Dict:
+        """Сторінка користувачів від новіших до старіших за (created_at, id).
+
+        after - курсор next_cursor з попередньої сторінки. Кількість рахується лише для першої
+        сторінки: якщо вона не вміщує всіх, то без фільтрів це оцінка з метаданих таблиці Users
+        (total_is_estimate), з фільтрами - COUNT за тими самими умовами.
+        Повертає {'rows': [dict], 'next_cursor': (created_at, id) або None, 'total': int або None,
+        'total_is_estimate': bool}.
+        """
+        page = {'rows': [], 'next_cursor': None, 'total': None, 'total_is_estimate': False}
+        try:
+            self.auth.require_permission('users.view')
+
+            where = " WHERE 1 = 1"
+            params = []
+            search = (search or "").strip()
+            if search:
+                pattern = f"%{search}%"
+                where += " AND (username LIKE ? OR email LIKE ? OR full_name LIKE ?)"
+                params.extend([pattern, pattern, pattern])
+            if role:
+                where += " AND role_display_name = ?"
+                params.append(role)
+            if status:
+                where += self.USER_STATUSES[status]
+            if last_login_from:
+                where += " AND last_login >= ?"
+                params.append(datetime(last_login_from.year, last_login_from.month, last_login_from.day))
+            if last_login_to:
+                # Напіввідкритий інтервал, щоб день last_login_to увійшов повністю
+                where += " AND last_login < ?"
+                params.append(datetime(last_login_to.year, last_login_to.month, last_login_to.day)
+                              + timedelta(days=1))
+
+            if with_total is None:
+                with_total = after is None
+
+            page_where = where
+            page_params = list(params)
+            if after is not None:
+                created_at, last_id = after
+                page_where += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+                page_params.extend([created_at, created_at, last_id])
+
+            query = (self.USER_COLUMNS + page_where
+                     + " ORDER BY created_at DESC, id DESC OFFSET 0 ROWS FETCH NEXT ? ROWS ONLY")
+            page_params.append(page_size + 1)
+
+            with self.pool.cursor() as cursor:
+                cursor.execute(query, page_params)
+                rows = cursor.fetchall()
+
+                if with_total and len(rows) <= page_size and after is None:
+                    page['total'] = len(rows)
+                elif with_total:
+                    filtered = bool(search or role or status or last_login_from or last_login_to)
+                    if not filtered:
+                        # Повний COUNT по великій таблиці дорогий, а для лічильника досить оцінки
+                        cursor.execute(
+                            """
+                            SELECT SUM(rows)
+                            FROM sys.partitions
+                            WHERE object_id = OBJECT_ID('dbo.Users') AND index_id IN (0, 1)
+                            """
+                        )
+                        page['total'] = cursor.fetchone()[0]
+                        page['total_is_estimate'] = page['total'] is not None
+                    if page['total'] is None:
+                        cursor.execute("SELECT COUNT(*) FROM vw_UserDetails" + where, params)
+                        page['total'] = cursor.fetchone()[0]
+
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                page['next_cursor'] = (rows[-1][8], rows[-1][0])
+            page['rows'] = [self._user_dict(row) for row in rows]
+            return page
+
+        except PermissionError:
+            return page
+        except Exception as e:
+            print(f"Помилка отримання користувачів: {e}")
+            return page
+
     def block_user(self, user_id: int, reason: str = None) -> bool:
         try:
             self.auth.require_permission('users.block')
 
-            self.cursor.execute(
-                "UPDATE Users SET is_locked = 1 WHERE id = ?",
-                (user_id,)
-            )
-            self.conn.commit()
+            with self.pool.cursor(commit=True) as cursor:
+                cursor.execute(
+                    "UPDATE Users SET is_locked = 1 WHERE id = ?",
+                    (user_id,)
+                )
 
             self.auth.log_action(
                 'UPDATE',
@@ -293,11 +467,11 @@ class UserManager:
         try:
             self.auth.require_permission('users.block')
 
-            self.cursor.execute(
-                "UPDATE Users SET is_locked = 0, failed_login_attempts = 0 WHERE id = ?",
-                (user_id,)
-            )
-            self.conn.commit()
+            with self.pool.cursor(commit=True) as cursor:
+                cursor.execute(
+                    "UPDATE Users SET is_locked = 0, failed_login_attempts = 0 WHERE id = ?",
+                    (user_id,)
+                )
 
             self.auth.log_action('UPDATE', 'Users', user_id, 'is_locked: 1', 'is_locked: 0')
 
@@ -313,8 +487,8 @@ class UserManager:
             if user_id == self.auth.current_user['user_id']:
                 return False
 
-            self.cursor.execute("DELETE FROM Users WHERE id = ?", (user_id,))
-            self.conn.commit()
+            with self.pool.cursor(commit=True) as cursor:
+                cursor.execute("DELETE FROM Users WHERE id = ?", (user_id,))
 
             self.auth.log_action('DELETE', 'Users', user_id)
 
@@ -326,9 +500,8 @@ class UserManager:
 
 class RoleManager:
 
-    def __init__(self, db_connection, auth_manager: AuthManager):
-        self.conn = db_connection
-        self.cursor = db_connection.cursor()
+    def __init__(self, db_pool, auth_manager: AuthManager):
+        self.pool = db_pool
         self.auth = auth_manager
 
     def get_all_roles(self) -> List[Dict]:
@@ -339,10 +512,12 @@ class RoleManager:
                 ORDER BY id
             """
 
-            self.cursor.execute(query)
+            with self.pool.cursor() as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
 
             roles = []
-            for row in self.cursor.fetchall():
+            for row in rows:
                 roles.append({
                     'id': row[0],
                     'role_name': row[1],
@@ -366,10 +541,12 @@ class RoleManager:
                 WHERE rp.role_id = ?
             """
 
-            self.cursor.execute(query, (role_id,))
+            with self.pool.cursor() as cursor:
+                cursor.execute(query, (role_id,))
+                rows = cursor.fetchall()
 
             permissions = []
-            for row in self.cursor.fetchall():
+            for row in rows:
                 permissions.append({
                     'name': row[0],
                     'display_name': row[1],
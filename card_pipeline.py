@@ -0,0 +1,123 @@
+import queue
+import threading
+from collections import deque
+
+_STOP = object()
+
+
+class CardPipeline:
+    """Фонова підготовка карток і відкладений запис оцінок.
+
+    Продюсер тримає буфер з наступних `buffer_size` карток, а єдиний потік-записувач
+    зберігає оцінки в тому порядку, в якому їх поставив користувач. close() лише подає сигнал
+    зупинки: сесію завершує записувач, коли допише оцінки.
+    """
+
+    def __init__(self, db_manager, mode='flashcard', category_id=None, buffer_size=5):
+        self.db = db_manager
+        self.mode = mode
+        self.category_id = category_id
+        self.buffer_size = buffer_size
+
+        self.session_id = None
+        self.exhausted = False
+        self._session_started = threading.Event()
+
+        self._buffer = deque()
+        self._buffered_ids = set()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._closed = False
+
+        self._writes = queue.Queue()
+        self._producer = threading.Thread(target=self._produce, daemon=True)
+        self._writer = threading.Thread(target=self._write, daemon=True)
+
+    def start(self):
+        self._producer.start()
+        self._writer.start()
+        return self
+
+    def take(self):
+        with self._cond:
+            if not self._buffer:
+                return None
+            card = self._buffer.popleft()
+            self._buffered_ids.discard(card[0])
+            self._cond.notify_all()
+            return card
+
+    def rate(self, word_id, knows):
+        # Черга повторень оновлюється одразу, а запис у БД - у фоні
+        self.db.schedule_rating(word_id, knows)
+        self._writes.put((word_id, knows))
+
+    def flush(self):
+        self._writes.join()
+        self.db.flush_interactions()
+
+    def close(self):
+        # Викликається з потоку Tk, тож нічого не чекаємо
+        if self._closed:
+            return
+        self._closed = True
+
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+        self._writes.put(_STOP)
+
+    def _produce(self):
+        try:
+            try:
+                self.session_id = self.db.start_session(self.mode)
+            finally:
+                self._session_started.set()
+
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._stopped or len(self._buffer) < self.buffer_size)
+                    if self._stopped:
+                        return
+
+                card = self.db.get_next_word_for_learning(self.mode, self.category_id)
+
+                with self._cond:
+                    if card is None:
+                        self.exhausted = True
+                        self._cond.notify_all()
+                        return
+
+                    # Колода менша за буфер: чекаємо, поки цю картку покажуть
+                    self._cond.wait_for(lambda: self._stopped or card[0] not in self._buffered_ids)
+                    if self._stopped:
+                        return
+
+                    self._buffer.append(card)
+                    self._buffered_ids.add(card[0])
+                    self._cond.notify_all()
+
+        except Exception as e:
+            print(f"Помилка підготовки карток: {e}")
+            with self._cond:
+                self.exhausted = True
+                self._cond.notify_all()
+
+    def _write(self):
+        while True:
+            item = self._writes.get()
+            try:
+                if item is _STOP:
+                    break
+                word_id, knows = item
+                self.db.update_word_knowledge(word_id, knows, self.mode, reschedule=False)
+            except Exception as e:
+                print(f"Помилка збереження оцінки: {e}")
+            finally:
+                self._writes.task_done()
+
+        # Сесію завершуємо лише після того, як продюсер її відкрив, а всі оцінки записані
+        self._session_started.wait()
+        if self.session_id is not None:
+            self.db.end_session(self.session_id)
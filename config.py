@@ -1,6 +1,14 @@
 import os
+import re
 from enum import Enum
 
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def app_path(path):
+    # Відносні шляхи рахуються від каталогу програми, а не від поточного каталогу процесу
+    return os.path.join(APP_DIR, os.path.expanduser(path))
+
 
 class UserRole(Enum):
     ADMIN = "admin"
@@ -10,6 +18,10 @@ class UserRole(Enum):
 
 
 class DatabaseConfig:
+    # "sqlserver" - спільна БД на сервері, "sqlite" - локальна БД для одного користувача
+    BACKEND = os.environ.get("LEARNEASY_BACKEND", "sqlserver")
+    SQLITE_PATH = app_path(os.environ.get("LEARNEASY_SQLITE_PATH", "learneasy.db"))
+
     SERVER = "localhost\\SQLEXPRESS"
     DATABASE = "LearnEasy"
 
@@ -20,6 +32,36 @@ class DatabaseConfig:
         f'Trusted_Connection=yes;'
     )
 
+    POOL_MAX_SIZE = 5
+    POOL_MAX_IDLE_SECONDS = 300
+    POOL_ACQUIRE_TIMEOUT_SECONDS = 30
+
+    # Журнал оцінок: пакетний запис у БД за розміром або часом. Без явного шляху файл лежить
+    # поруч із БД (дивись journal_path)
+    JOURNAL_PATH = os.environ.get("LEARNEASY_JOURNAL_PATH")
+    JOURNAL_MAX_BATCH = 50
+    JOURNAL_FLUSH_SECONDS = 5
+
+    # Журнал аудиту: черга в пам'яті, а поки БД недоступна - файл (у кожного процесу свій, дивись AuditQueue)
+    AUDIT_SPILL_PATH = app_path(os.environ.get("LEARNEASY_AUDIT_SPILL_PATH", "audit.spill"))
+    AUDIT_QUEUE_SIZE = 1000
+    AUDIT_MAX_BATCH = 100
+    AUDIT_FLUSH_SECONDS = 2
+    AUDIT_PUT_TIMEOUT_SECONDS = 0.5
+
+    # Як часто лічильники статистики звіряються з БД
+    COUNTERS_RECONCILE_SECONDS = 300
+
+    @staticmethod
+    def journal_path(backend, sqlite_path):
+        """Базовий шлях журналу оцінок для БД: у SQLite - біля файлу БД, для сервера - у каталозі програми."""
+        if DatabaseConfig.JOURNAL_PATH:
+            return app_path(DatabaseConfig.JOURNAL_PATH)
+        if backend == "sqlite":
+            return os.path.splitext(app_path(sqlite_path))[0] + ".journal"
+        server_name = re.sub(r"\W+", "_", f"{DatabaseConfig.SERVER}_{DatabaseConfig.DATABASE}")
+        return app_path(f"{server_name}.journal")
+
     @staticmethod
     def get_connection_string(username: str = None, password: str = None, use_trusted: bool = True):
 
@@ -35,12 +77,24 @@ class DatabaseConfig:
             )
 
 
+class ReportConfig:
+    # Пакетна генерація звітів без GUI (report_cli.py)
+    OUTPUT_DIR = os.environ.get("LEARNEASY_REPORTS_DIR", "reports")
+    FORMATS = ("docx", "xlsx")
+    MAX_WORKERS = None
+
+
 class AppConfig:
 
     APP_NAME = "Learn Easy"
     VERSION = "2.0.0"
 
     SESSION_TIMEOUT_MINUTES = 30
+    # Як часто сесія перевіряється на сервері, незалежно від активності користувача
+    SESSION_REVALIDATE_MINUTES = 5
+
+    # Скільки секунд дозволи користувача беруться з пам'яті без звернення до БД
+    PERMISSIONS_CACHE_SECONDS = 300
 
     DEFAULT_POPUP_INTERVAL_MINUTES = 5
 
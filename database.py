@@ -1,64 +1,118 @@
-import pyodbc
 from tkinter import messagebox
 from config import DatabaseConfig
-import random
-from datetime import datetime
+from db_backends import create_dialect
+from db_pool import ConnectionPool
+from scheduler import SpacedRepetitionScheduler
+from interaction_journal import InteractionJournal
+from word_index import WordIndex
+from word_counters import WordCounters
+import threading
+from datetime import datetime, timedelta
 import time
 
 
+class ImportInterruptedError(Exception):
+    def __init__(self, imported, error):
+        super().__init__(f"{error}\nДо помилки збережено слів: {imported}")
+        self.imported = imported
+
+
 class DatabaseManager:
     def __init__(self):
-        self.conn = None
-        self.cursor = None
+        self.pool = None
+        self.dialect = None
         self.connection_string = None
+        self.journal = None
+        self._schedulers = {}
+        self._schedulers_lock = threading.Lock()
+        self._word_index = None
+        self._word_index_lock = threading.Lock()
+        self._counters = None
+        self._counters_loaded_at = 0
+        self._counters_lock = threading.Lock()
+        self._reconciling = False
+
+    def open(self, username: str = None, password: str = None, use_trusted: bool = True, journal: bool = True,
+             backend: str = None, sqlite_path: str = None):
+        """Підключається без діалогів, тож може виконуватись поза потоком Tk; помилки прокидає далі.
+
+        backend і sqlite_path за замовчуванням беруться з DatabaseConfig."""
+        if use_trusted:
+            self.connection_string = DatabaseConfig.ADMIN_CONNECTION_STRING
+        else:
+            self.connection_string = DatabaseConfig.get_connection_string(
+                username=username,
+                password=password,
+                use_trusted=False
+            )
 
-    def connect(self, username: str = None, password: str = None, use_trusted: bool = True):
-        try:
-            if use_trusted:
-                self.connection_string = DatabaseConfig.ADMIN_CONNECTION_STRING
-            else:
-                self.connection_string = DatabaseConfig.get_connection_string(
-                    username=username,
-                    password=password,
-                    use_trusted=False
-                )
-
-            self.conn = pyodbc.connect(self.connection_string)
-            self.cursor = self.conn.cursor()
-
-            print(f"✅ Підключено до БД як: {username if username else 'Windows User'}")
-            return True
+        backend = backend or DatabaseConfig.BACKEND
+        sqlite_path = sqlite_path or DatabaseConfig.SQLITE_PATH
+        self.dialect = create_dialect(backend, connection_string=self.connection_string, sqlite_path=sqlite_path)
 
-        except pyodbc.Error as e:
-            error_msg = str(e)
+        try:
+            self.pool = ConnectionPool(
+                self.dialect.connect,
+                max_size=DatabaseConfig.POOL_MAX_SIZE,
+                max_idle_seconds=DatabaseConfig.POOL_MAX_IDLE_SECONDS,
+                acquire_timeout=DatabaseConfig.POOL_ACQUIRE_TIMEOUT_SECONDS
+            )
+
+            # Перше з'єднання відкриваємо одразу, щоб помилки входу з'явились тут
+            with self.pool.connection() as conn:
+                self.dialect.initialize(conn)
+
+            # Фоновим завданням без оцінок журнал не потрібен
+            if journal:
+                self.journal = InteractionJournal(
+                    self,
+                    journal_path=DatabaseConfig.journal_path(backend, sqlite_path),
+                    max_batch=DatabaseConfig.JOURNAL_MAX_BATCH,
+                    flush_interval=DatabaseConfig.JOURNAL_FLUSH_SECONDS
+                ).start()
+        except Exception:
+            self.close()
+            raise
 
-            if "Login failed" in error_msg:
-                messagebox.showerror(
-                    "Помилка входу",
-                    f"Невірні облікові дані:\n{username}\n\nПеревірте ім'я користувача та пароль."
-                )
-            elif "Cannot open database" in error_msg:
-                messagebox.showerror(
-                    "Помилка БД",
-                    f"Не вдалося відкрити базу даних LearnEasy.\n\nПеревірте права доступу."
-                )
-            else:
-                messagebox.showerror(
-                    "Помилка підключення",
-                    f"Не вдалося підключитися до БД:\n{error_msg}"
-                )
+        print(f"✅ Підключено до БД як: {username if username else 'Windows User'}")
+        return True
 
+    def connect(self, username: str = None, password: str = None, use_trusted: bool = True):
+        try:
+            return self.open(username, password, use_trusted)
+        except self.dialect.connection_errors as e:
+            self.show_connection_error(e, username)
             return False
 
+    def show_connection_error(self, error, username=None):
+        error_msg = str(error)
+
+        if "Login failed" in error_msg:
+            messagebox.showerror(
+                "Помилка входу",
+                f"Невірні облікові дані:\n{username}\n\nПеревірте ім'я користувача та пароль."
+            )
+        elif "Cannot open database" in error_msg:
+            messagebox.showerror(
+                "Помилка БД",
+                f"Не вдалося відкрити базу даних LearnEasy.\n\nПеревірте права доступу."
+            )
+        else:
+            messagebox.showerror(
+                "Помилка підключення",
+                f"Не вдалося підключитися до БД:\n{error_msg}"
+            )
+
     def reconnect_with_credentials(self, username: str, password: str):
-        if self.conn:
+        if self.pool:
             self.close()
 
         return self.connect(username=username, password=password, use_trusted=False)
 
-    def get_all_words(self, search_term="", category="Всі", sort_by="word", include_archived=False, start_date=None,
-                      end_date=None):
-        query = """
+    def get_cursor(self, commit=False):
+        return self.pool.cursor(commit=commit)
+
+    WORD_COLUMNS = """
                 SELECT w.id, \
                        w.word, \
                        w.translation, \
@@ -77,6 +131,18 @@ class DatabaseManager:
                          LEFT JOIN Categories c ON w.category_id = c.id
                 WHERE 1 = 1 \
                 """
+
+    # Ключ сортування для пагінації: (вираз, напрям, індекс значення в рядку); w.id завершує порядок
+    PAGE_SORT_KEYS = {
+        "word": ("w.word", "ASC", 1),
+        "translation": ("w.translation", "ASC", 2),
+        "knowledge_level": ("w.knowledge_level", "DESC", 4),
+        "category": ("COALESCE(c.name, '')", "ASC", 5),
+        "difficulty": ("w.difficulty_level", "DESC", 10)
+    }
+
+    def _words_filter(self, search_term="", category="Всі", include_archived=False, start_date=None, end_date=None):
+        query = ""
         params = []
         if not include_archived:
             query += " AND w.is_archived = 0"
@@ -88,20 +154,33 @@ class DatabaseManager:
             params.append(category)
 
         # Фільтрація за датами додання слова
+        date_query, date_params = self._date_range('w.created_at', start_date, end_date)
+        query += date_query
+        params.extend(date_params)
+        return query, params
+
+    @staticmethod
+    def _day_start(value):
+        if hasattr(value, 'year'):
+            return datetime(value.year, value.month, value.day)
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d")
+
+    def _date_range(self, column, start_date=None, end_date=None):
+        # Напіввідкритий інтервал [start, end + 1 день) по самому стовпцю - без CAST, щоб працював індекс
+        query = ""
+        params = []
         if start_date:
-            query += " AND CAST(w.created_at AS DATE) >= ?"
-            # Конвертуємо datetime.date у рядок у форматі YYYY-MM-DD
-            if hasattr(start_date, 'strftime'):
-                params.append(start_date.strftime("%Y-%m-%d"))
-            else:
-                params.append(str(start_date))
+            query += f" AND {column} >= ?"
+            params.append(self._day_start(start_date))
         if end_date:
-            query += " AND CAST(w.created_at AS DATE) <= ?"
-            # Конвертуємо datetime.date у рядок у форматі YYYY-MM-DD
-            if hasattr(end_date, 'strftime'):
-                params.append(end_date.strftime("%Y-%m-%d"))
-            else:
-                params.append(str(end_date))
+            query += f" AND {column} < ?"
+            params.append(self._day_start(end_date) + timedelta(days=1))
+        return query, params
+
+    def get_all_words(self, search_term="", category="Всі", sort_by="word", include_archived=False, start_date=None,
+                      end_date=None):
+        where, params = self._words_filter(search_term, category, include_archived, start_date, end_date)
+        query = self.WORD_COLUMNS + where
 
         sort_mapping = {
             "word": "w.word",
@@ -111,8 +190,249 @@ class DatabaseManager:
             "difficulty": "w.difficulty_level DESC"
         }
         query += f" ORDER BY {sort_mapping.get(sort_by, 'w.word')}"
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def get_words_page(self, search_term="", category="Всі", sort_by="word", include_archived=False, start_date=None,
+                       end_date=None, page_size=100, after=None, with_total=None):
+        """Одна сторінка слів у порядку sort_by.
+
+        after - курсор з попередньої сторінки (next_cursor). Загальна кількість рахується лише для
+        першої сторінки (або якщо явно передано with_total=True).
+        Повертає {'rows': [...], 'next_cursor': (значення, id) або None, 'total': int або None}.
+        """
+        expression, direction, value_index = self.PAGE_SORT_KEYS.get(sort_by, self.PAGE_SORT_KEYS["word"])
+        where, params = self._words_filter(search_term, category, include_archived, start_date, end_date)
+        if with_total is None:
+            with_total = after is None
+
+        page_where = where
+        page_params = list(params)
+        if after is not None:
+            sort_value, last_id = after
+            comparison = ">" if direction == "ASC" else "<"
+            page_where += f" AND ({expression} {comparison} ? OR ({expression} = ? AND w.id > ?))"
+            page_params.extend([sort_value, sort_value, last_id])
+
+        query = (self.WORD_COLUMNS + page_where
+                 + f" ORDER BY {expression} {direction}, w.id" + self.dialect.limit())
+        page_params.append(page_size + 1)
+
+        with self.get_cursor() as cursor:
+            cursor.execute(query, page_params)
+            rows = cursor.fetchall()
+
+            total = None
+            if with_total:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM Words w LEFT JOIN Categories c ON w.category_id = c.id WHERE 1 = 1" + where,
+                    params
+                )
+                total = cursor.fetchone()[0]
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            sort_value = last[value_index]
+            next_cursor = (sort_value if sort_value is not None else "", last[0])
+
+        return {'rows': rows, 'next_cursor': next_cursor, 'total': total}
+
+    def iter_all_words(self, page_size=500, **filters):
+        after = None
+        while True:
+            page = self.get_words_page(page_size=page_size, after=after, with_total=False, **filters)
+            yield from page['rows']
+            after = page['next_cursor']
+            if after is None:
+                return
+
+    # Повний набір полів слова для перенесення між екземплярами; категорія - за назвою
+    TRANSFER_COLUMNS = [
+        "word", "translation", "transcription", "example_sentence", "example_translation", "category",
+        "difficulty_level", "knowledge_level", "times_shown", "times_correct", "times_wrong",
+        "is_favorite", "is_archived", "last_shown", "created_at"
+    ]
+
+    def iter_transfer_rows(self, page_size=5000):
+        """Усі слова, включно з архівними, у порядку TRANSFER_COLUMNS; читаються сторінками за id."""
+        query = f"""
+                SELECT w.id, w.word, w.translation, w.transcription, w.example_sentence,
+                       w.example_translation, c.name, w.difficulty_level, w.knowledge_level,
+                       w.times_shown, w.times_correct, w.times_wrong, w.is_favorite, w.is_archived,
+                       w.last_shown, w.created_at
+                FROM Words w
+                         LEFT JOIN Categories c ON w.category_id = c.id
+                WHERE w.id > ?
+                ORDER BY w.id{self.dialect.limit()}
+                """
+        after = 0
+        while True:
+            with self.get_cursor() as cursor:
+                cursor.execute(query, (after, page_size))
+                rows = cursor.fetchall()
+            for row in rows:
+                yield tuple(row[1:])
+            if len(rows) < page_size:
+                return
+            after = rows[-1][0]
+
+    def import_words(self, rows, batch_size=1000):
+        """Імпорт слів з файлу перенесення: rows - dict за TRANSFER_COLUMNS. Дивись bulk_add_words."""
+        return self.bulk_add_words(rows, batch_size=batch_size)
+
+    def bulk_add_words(self, records, batch_size=500):
+        """Додає багато слів за одну операцію.
+
+        records - dict з ключами за TRANSFER_COLUMNS: word і translation обов'язкові, решта - за потреби;
+        замість назви category можна передати category_id; рядок файлу, який не вдалося прочитати,
+        передається винятком, що описує помилку. Пари (слово, переклад), що вже є в базі чи
+        повторюються у records, пропускаються. Повертає {'added', 'duplicates', 'errors'}, де errors -
+        список (номер запису, повідомлення) для записів, які не пройшли перевірку або їх не прийняла БД.
+        Якщо обірвався зв'язок з БД, кидає ImportInterruptedError з кількістю вже збережених слів.
+        """
+        query = """
+                INSERT INTO Words (word, translation, transcription, example_sentence, example_translation,
+                                   category_id, difficulty_level, knowledge_level, times_shown, times_correct,
+                                   times_wrong, is_favorite, is_archived, last_shown, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) \
+                """
+        categories = self._load_category_ids()
+        with self.get_cursor() as cursor:
+            cursor.execute("SELECT word, translation FROM Words")
+            existing = {self._pair_key(word, translation) for word, translation in cursor.fetchall()}
+
+        result = {'added': 0, 'duplicates': 0, 'errors': []}
+        batch = []
+        try:
+            for number, record in enumerate(records, 1):
+                if isinstance(record, Exception):
+                    result['errors'].append((number, f"Некоректний запис: {record}"))
+                    continue
+                try:
+                    values = self._transfer_values(record)
+                except (KeyError, TypeError, ValueError, AttributeError) as e:
+                    result['errors'].append((number, f"Некоректний запис: {e}"))
+                    continue
+
+                key = self._pair_key(values[0], values[1])
+                if key in existing:
+                    result['duplicates'] += 1
+                    continue
+
+                # Категорію шукаємо чи створюємо лише для слова, яке справді буде додано
+                category_id = record.get('category_id')
+                if category_id is None:
+                    try:
+                        category_id = self._category_id(record.get('category'), categories)
+                    except self.dialect.row_errors as e:
+                        result['errors'].append((number, f"Категорія: {e}"))
+                        continue
+                existing.add(key)
+
+                batch.append((number, values[:5] + (category_id,) + values[5:]))
+                if len(batch) >= batch_size:
+                    self._insert_batch(query, batch, result)
+                    batch = []
+            if batch:
+                self._insert_batch(query, batch, result)
+        except self.dialect.connection_errors as e:
+            raise ImportInterruptedError(result['added'], e) from e
+        finally:
+            if result['added']:
+                self._invalidate_word_caches()
+        return result
+
+    def _insert_batch(self, query, batch, result):
+        try:
+            with self.get_cursor(commit=True) as cursor:
+                self.dialect.executemany(cursor, query, [values for _, values in batch])
+            result['added'] += len(batch)
+            return
+        except self.dialect.connection_errors as e:
+            print(f"Помилка пакетної вставки, повтор по одному рядку: {e}")
+
+        # Пачка відкотилась цілком - вставляємо по рядку, щоб знайти, які саме записи не проходять.
+        # Інші помилки (зв'язок з БД) прокидаються далі: решту пачки все одно не записати
+        for number, values in batch:
+            try:
+                with self.get_cursor(commit=True) as cursor:
+                    cursor.execute(query, values)
+                result['added'] += 1
+            except self.dialect.row_errors as e:
+                result['errors'].append((number, str(e)))
+
+    @staticmethod
+    def _pair_key(word, translation):
+        return (word or "").strip().casefold(), (translation or "").strip().casefold()
+
+    def _load_category_ids(self):
+        with self.get_cursor() as cursor:
+            cursor.execute("SELECT id, name FROM Categories")
+            return {name: category_id for category_id, name in cursor.fetchall()}
+
+    def _category_id(self, name, categories):
+        # Категорії, яких ще немає, створюються - назва з файлу чи курсу не повинна губитись
+        if not name:
+            return None
+        category_id = categories.get(name)
+        if category_id is None:
+            with self.get_cursor(commit=True) as cursor:
+                category_id = self.dialect.insert_returning_id(
+                    cursor, "INSERT INTO Categories (name) VALUES (?)", (name,)
+                )
+            categories[name] = category_id
+        return category_id
+
+    def _invalidate_word_caches(self):
+        # Після масової вставки дешевше перебудувати кеші при наступному зверненні, ніж оновлювати по слову
+        self.invalidate_schedulers()
+        self._word_index = None
+        self._counters = None
+
+    def _transfer_values(self, row):
+        # Поля запису в порядку INSERT, крім category_id - його визначають після перевірки на дублікат
+        word = (row['word'] or "").strip()
+        translation = (row['translation'] or "").strip()
+        if not word or not translation:
+            raise ValueError("слово та переклад обов'язкові")
+
+        difficulty = int(row.get('difficulty_level') or 1)
+        if not 1 <= difficulty <= 5:
+            raise ValueError(f"складність має бути від 1 до 5, отримано {difficulty}")
+
+        return (
+            word,
+            translation,
+            row.get("transcription") or None,
+            row.get("example_sentence") or None,
+            row.get("example_translation") or None,
+            difficulty,
+            int(row.get("knowledge_level") or 0),
+            int(row.get("times_shown") or 0),
+            int(row.get("times_correct") or 0),
+            int(row.get("times_wrong") or 0),
+            1 if self._flag(row.get("is_favorite")) else 0,
+            1 if self._flag(row.get("is_archived")) else 0,
+            self._timestamp(row.get("last_shown")),
+            self._timestamp(row.get("created_at")) or datetime.now()
+        )
+
+    @staticmethod
+    def _flag(value):
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "так")
+        return bool(value)
+
+    @staticmethod
+    def _timestamp(value):
+        if not value:
+            return None
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
 
     def get_word_by_id(self, word_id):
         query = """
@@ -127,8 +447,9 @@ class DatabaseManager:
                 FROM Words w
                 WHERE w.id = ? \
                 """
-        self.cursor.execute(query, (word_id,))
-        return self.cursor.fetchone()
+        with self.get_cursor() as cursor:
+            cursor.execute(query, (word_id,))
+            return cursor.fetchone()
 
     def update_word(self, word_id, word, translation, category_id, transcription="", example="", example_trans="",
                     difficulty=1):
@@ -143,9 +464,14 @@ class DatabaseManager:
                     difficulty_level    = ?
                 WHERE id = ? \
                 """
-        self.cursor.execute(query, (word, translation, transcription, example, example_trans, category_id, difficulty,
-                                    word_id))
-        self.conn.commit()
+        with self.get_cursor(commit=True) as cursor:
+            cursor.execute(query, (word, translation, transcription, example, example_trans, category_id, difficulty,
+                                   word_id))
+        self.invalidate_schedulers()
+        if self._word_index is not None:
+            self._word_index.put(word_id, word, translation, transcription, example, example_trans)
+        if self._counters is not None:
+            self._counters.put(word_id, category_id=category_id, difficulty=difficulty)
 
     def add_word(self, word, translation, category_id, transcription="", example="", example_trans="", difficulty=1):
         query = """
@@ -153,275 +479,323 @@ class DatabaseManager:
                                    example_translation, category_id, difficulty_level)
                 VALUES (?, ?, ?, ?, ?, ?, ?) \
                 """
-        self.cursor.execute(query, (word, translation, transcription, example, example_trans, category_id, difficulty))
-        self.conn.commit()
+        with self.get_cursor(commit=True) as cursor:
+            word_id = self.dialect.insert_returning_id(
+                cursor, query, (word, translation, transcription, example, example_trans, category_id, difficulty)
+            )
+        self.invalidate_schedulers()
+        if self._word_index is not None:
+            self._word_index.put(word_id, word, translation, transcription, example, example_trans)
+        if self._counters is not None:
+            self._counters.put(word_id, category_id, 0, difficulty, False, False)
+        return word_id
+
+    def update_word_knowledge(self, word_id, knows, mode_name='popup', reschedule=True):
+        if self.journal:
+            self.journal.record(word_id, mode_name, knows)
+        else:
+            self.record_interactions([(word_id, mode_name, knows)])
+        if self._counters is not None:
+            self._counters.rate(word_id, knows)
+        if reschedule:
+            self.schedule_rating(word_id, knows)
 
-    def update_word_knowledge(self, word_id, knows, mode_name='popup'):
+    def record_interactions(self, rows):
         try:
-            self.cursor.execute("EXEC sp_RecordInteraction ?, ?, ?", (word_id, mode_name, knows))
-            self.conn.commit()
+            with self.get_cursor(commit=True) as cursor:
+                self.dialect.record_interactions(cursor, rows)
         except:
-            if knows:
-                query = """
-                        UPDATE Words
-                        SET knowledge_level = knowledge_level + 1,
-                            times_shown     = times_shown + 1,
-                            times_correct   = times_correct + 1,
-                            last_shown      = GETDATE()
-                        WHERE id = ? \
-                        """
-            else:
-                query = """
-                        UPDATE Words
-                        SET knowledge_level = CASE WHEN knowledge_level > 0 THEN knowledge_level - 1 ELSE 0 END,
-                            times_shown     = times_shown + 1,
-                            times_wrong     = times_wrong + 1,
-                            last_shown      = GETDATE()
-                        WHERE id = ? \
-                        """
-            self.cursor.execute(query, (word_id,))
-            self.conn.commit()
+            known_query = f"""
+                    UPDATE Words
+                    SET knowledge_level = knowledge_level + 1,
+                        times_shown     = times_shown + 1,
+                        times_correct   = times_correct + 1,
+                        last_shown      = {self.dialect.now()}
+                    WHERE id = ? \
+                    """
+            forgotten_query = f"""
+                    UPDATE Words
+                    SET knowledge_level = CASE WHEN knowledge_level > 0 THEN knowledge_level - 1 ELSE 0 END,
+                        times_shown     = times_shown + 1,
+                        times_wrong     = times_wrong + 1,
+                        last_shown      = {self.dialect.now()}
+                    WHERE id = ? \
+                    """
+            with self.get_cursor(commit=True) as cursor:
+                for word_id, mode_name, knows in rows:
+                    cursor.execute(known_query if knows else forgotten_query, (word_id,))
+
+    def flush_interactions(self):
+        if self.journal:
+            self.journal.flush()
 
     def get_categories(self):
-        self.cursor.execute("SELECT id, name, color_hex FROM Categories WHERE is_active = 1")
-        return self.cursor.fetchall()
+        with self.get_cursor() as cursor:
+            cursor.execute("SELECT id, name, color_hex FROM Categories WHERE is_active = 1")
+            return cursor.fetchall()
 
     def get_next_word_for_learning(self, mode='flashcard', category_id=None):
+        return self.get_scheduler(category_id).next_card()
 
-        if random.random() < 0.75:
-            query = """
-                    SELECT TOP 1 w.id, w.word, \
-                           w.translation, \
-                           w.transcription,
-                           w.example_sentence, \
-                           w.example_translation, \
-                           w.knowledge_level
-                    FROM Words w
-                    WHERE w.is_archived = 0 \
-                      AND w.knowledge_level = 0 \
-                    """
-            if category_id:
-                query += " AND w.category_id = ?"
-                self.cursor.execute(query + " ORDER BY NEWID()", (category_id,))
-            else:
-                self.cursor.execute(query + " ORDER BY NEWID()")
-            result = self.cursor.fetchone()
-            if result:
-                return result
-
-        if random.random() < 0.85:
-            query = """
-                    SELECT TOP 1 w.id, w.word, \
-                           w.translation, \
-                           w.transcription,
-                           w.example_sentence, \
-                           w.example_translation, \
-                           w.knowledge_level,
-                           w.times_wrong, \
-                           w.times_correct
-                    FROM Words w
-                    WHERE w.is_archived = 0 \
-                      AND w.knowledge_level BETWEEN 1 AND 4
-                      AND (w.last_shown IS NULL OR w.last_shown < DATEADD(minute, -30, GETDATE())) \
-                    """
-            if category_id:
-                query += " AND w.category_id = ?"
-                self.cursor.execute(query + " ORDER BY w.times_wrong DESC, NEWID()", (category_id,))
-            else:
-                self.cursor.execute(query + " ORDER BY w.times_wrong DESC, NEWID()")
-            result = self.cursor.fetchone()
-            if result:
-                return result
-
-        query = """
-                SELECT TOP 1 w.id, w.word, \
-                       w.translation, \
-                       w.transcription,
-                       w.example_sentence, \
-                       w.example_translation, \
-                       w.knowledge_level
-                FROM Words w
-                WHERE w.is_archived = 0 \
-                  AND w.knowledge_level >= 5
-                  AND (w.last_shown IS NULL OR w.last_shown < DATEADD(day, -1, GETDATE())) \
-                """
-        if category_id:
-            query += " AND w.category_id = ?"
-            self.cursor.execute(query + " ORDER BY w.last_shown ASC, NEWID()", (category_id,))
-        else:
-            self.cursor.execute(query + " ORDER BY w.last_shown ASC, NEWID()")
-        result = self.cursor.fetchone()
-        if result:
-            return result
+    def get_scheduler(self, category_id=None):
+        with self._schedulers_lock:
+            scheduler = self._schedulers.get(category_id)
+        if scheduler is not None:
+            return scheduler
 
+        scheduler = SpacedRepetitionScheduler()
         query = """
-                SELECT TOP 1 w.id, w.word, \
+                SELECT w.id, w.word, \
                        w.translation, \
                        w.transcription,
                        w.example_sentence, \
                        w.example_translation, \
-                       w.knowledge_level
+                       w.knowledge_level,
+                       w.times_correct, \
+                       w.times_wrong, \
+                       w.last_shown
                 FROM Words w
                 WHERE w.is_archived = 0 \
                 """
-        if category_id:
-            query += " AND w.category_id = ?"
-            self.cursor.execute(query + " ORDER BY NEWID()", (category_id,))
-        else:
-            self.cursor.execute(query + " ORDER BY NEWID()")
-        return self.cursor.fetchone()
+        with self.get_cursor() as cursor:
+            if category_id:
+                cursor.execute(query + " AND w.category_id = ?", (category_id,))
+            else:
+                cursor.execute(query)
+            scheduler.load(cursor)
+
+        with self._schedulers_lock:
+            return self._schedulers.setdefault(category_id, scheduler)
+
+    def invalidate_schedulers(self):
+        with self._schedulers_lock:
+            self._schedulers.clear()
+
+    def schedule_rating(self, word_id, knows):
+        with self._schedulers_lock:
+            schedulers = list(self._schedulers.values())
+        for scheduler in schedulers:
+            scheduler.record(word_id, knows)
+
+    def _unschedule(self, word_id):
+        with self._schedulers_lock:
+            schedulers = list(self._schedulers.values())
+        for scheduler in schedulers:
+            scheduler.remove(word_id)
+        if self._word_index is not None:
+            self._word_index.remove(word_id)
+
+    def get_word_index(self):
+        with self._word_index_lock:
+            if self._word_index is None:
+                index = WordIndex()
+                with self.get_cursor() as cursor:
+                    cursor.execute(
+                        "SELECT id, word, translation, transcription, example_sentence, example_translation "
+                        "FROM Words WHERE is_archived = 0"
+                    )
+                    index.load(cursor)
+                self._word_index = index
+            return self._word_index
 
     def get_statistics(self):
+        return self.get_counters().totals()
+
+    def get_counters(self):
+        with self._counters_lock:
+            if self._counters is None:
+                counters = WordCounters()
+                self._load_counters(counters)
+                self._counters = counters
+                self._counters_loaded_at = time.monotonic()
+            elif not self._reconciling and \
+                    time.monotonic() - self._counters_loaded_at > DatabaseConfig.COUNTERS_RECONCILE_SECONDS:
+                self._reconciling = True
+                threading.Thread(target=self.reconcile_counters, daemon=True).start()
+            return self._counters
+
+    def _load_counters(self, counters):
+        with self.get_cursor() as cursor:
+            cursor.execute(
+                "SELECT id, category_id, knowledge_level, difficulty_level, is_archived, is_favorite FROM Words"
+            )
+            counters.load(cursor)
+
+    def reconcile_counters(self):
+        # Перерахунок з БД виправляє розбіжності (зокрема після змін з інших клієнтів)
         try:
-            self.cursor.execute("SELECT * FROM vw_Dashboard")
-            row = self.cursor.fetchone()
-            if row:
-                return {
-                    'total_words': row[0],
-                    'learned_words': row[1],
-                    'learning_words': row[2],
-                    'new_words': row[3],
-                    'favorite_words': row[4],
-                    'progress_percentage': row[10] if len(row) > 10 else 0
-                }
-        except:
-            pass
-        stats = {}
-        self.cursor.execute("SELECT COUNT(*) FROM Words WHERE is_archived = 0")
-        stats['total_words'] = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM Words WHERE knowledge_level >= 5 AND is_archived = 0")
-        stats['learned_words'] = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM Words WHERE knowledge_level BETWEEN 1 AND 4 AND is_archived = 0")
-        stats['learning_words'] = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM Words WHERE knowledge_level = 0 AND is_archived = 0")
-        stats['new_words'] = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM Words WHERE is_favorite = 1")
-        stats['favorite_words'] = self.cursor.fetchone()[0]
-        if stats['total_words'] > 0:
-            stats['progress_percentage'] = (stats['learned_words'] / stats['total_words']) * 100
-        else:
-            stats['progress_percentage'] = 0
-        return stats
+            self.flush_interactions()
+            fresh = WordCounters()
+            self._load_counters(fresh)
+
+            with self._counters_lock:
+                if self._counters is not None and self._counters.snapshot() != fresh.snapshot():
+                    print("Лічильники статистики розійшлися з БД - виправлено")
+                self._counters = fresh
+                self._counters_loaded_at = time.monotonic()
+        except Exception as e:
+            print(f"Помилка звірки лічильників статистики: {e}")
+        finally:
+            self._reconciling = False
 
     def toggle_favorite(self, word_id):
         query = "UPDATE Words SET is_favorite = CASE WHEN is_favorite = 1 THEN 0 ELSE 1 END WHERE id = ?"
-        self.cursor.execute(query, (word_id,))
-        self.conn.commit()
+        with self.get_cursor(commit=True) as cursor:
+            cursor.execute(query, (word_id,))
+        if self._counters is not None:
+            self._counters.toggle_favorite(word_id)
 
     def delete_word(self, word_id):
-        self.cursor.execute("DELETE FROM Words WHERE id = ?", (word_id,))
-        self.conn.commit()
+        with self.get_cursor(commit=True) as cursor:
+            cursor.execute("DELETE FROM Words WHERE id = ?", (word_id,))
+        self._unschedule(word_id)
+        if self._counters is not None:
+            self._counters.remove(word_id)
 
     def archive_word(self, word_id):
         query = "UPDATE Words SET is_archived = 1 WHERE id = ?"
-        self.cursor.execute(query, (word_id,))
-        self.conn.commit()
+        with self.get_cursor(commit=True) as cursor:
+            cursor.execute(query, (word_id,))
+        self._unschedule(word_id)
+        if self._counters is not None:
+            self._counters.put(word_id, archived=True)
 
     def start_session(self, mode_name):
+        # Нова сесія - свіжа черга повторень, тому спершу зберігаємо всі оцінки
+        self.flush_interactions()
+        self.invalidate_schedulers()
         try:
-            self.cursor.execute("EXEC sp_StartSession ?", (mode_name,))
-            row = self.cursor.fetchone()
-            return row[0] if row else None
+            with self.get_cursor(commit=True) as cursor:
+                return self.dialect.start_session(cursor, mode_name)
         except:
             return None
 
     def end_session(self, session_id):
+        self.flush_interactions()
         try:
-            self.cursor.execute("EXEC sp_EndSession ?", (session_id,))
-            self.conn.commit()
+            with self.get_cursor(commit=True) as cursor:
+                self.dialect.end_session(cursor, session_id)
         except:
             pass
 
     def close(self):
         try:
-            if self.conn and hasattr(self.conn, 'closed') and not self.conn.closed:
-                self.conn.close()
+            if self.journal:
+                self.journal.close()
+        except:
+            pass
+        finally:
+            self.journal = None
+            self._word_index = None
+            self._counters = None
+
+        try:
+            if self.pool:
+                self.pool.close_all()
         except:
             pass
         finally:
-            self.conn = None
-            self.cursor = None
+            self.pool = None
+
+    AUDIT_ACTIONS = ["CREATE", "UPDATE", "DELETE", "LOGIN", "LOGOUT"]
+    AUDIT_TABLES = ["Users", "Words", "System"]
+
+    def get_audit_page(self, username=None, action_type=None, table_name=None, start_date=None, end_date=None,
+                       page_size=100, after=None):
+        """Сторінка журналу аудиту від новіших записів до старіших.
+
+        after - курсор (action_time, id) з попередньої сторінки. Кожен фільтр звужує діапазон
+        одного з індексів AUDIT_INDEXES, тож запит не залежить від розміру таблиці.
+        Повертає {'rows': [(id, час, користувач, дія, таблиця, деталі, IP), ...], 'next_cursor': ...}.
+        """
+        where = " WHERE 1 = 1"
+        params = []
+        if username:
+            where += " AND al.user_id = (SELECT id FROM Users WHERE username = ?)"
+            params.append(username)
+        if action_type:
+            where += " AND al.action_type = ?"
+            params.append(action_type)
+        if table_name:
+            where += " AND al.table_name = ?"
+            params.append(table_name)
+
+        date_query, date_params = self._date_range('al.action_time', start_date, end_date)
+        where += date_query
+        params.extend(date_params)
+
+        if after is not None:
+            action_time, last_id = after
+            where += " AND (al.action_time < ? OR (al.action_time = ? AND al.id < ?))"
+            params.extend([action_time, action_time, last_id])
+
+        query = ("""
+                SELECT al.id, al.action_time, u.username,
+                       al.action_type,
+                       al.table_name,
+                       al.new_value,
+                       al.ip_address
+                FROM AuditLog al
+                         LEFT JOIN Users u ON al.user_id = u.id""" + where
+                 + " ORDER BY al.action_time DESC, al.id DESC" + self.dialect.limit())
+        params.append(page_size + 1)
+
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = (rows[-1][1], rows[-1][0])
+
+        return {'rows': rows, 'next_cursor': next_cursor}
 
     def get_words_statistics(self, start_date=None, end_date=None):
-        query = """
-                SELECT CAST(w.last_shown AS DATE) as study_date, \
+        study_date = self.dialect.date('w.last_shown')
+        query = f"""
+                SELECT {study_date} as study_date, \
                        COUNT(*)                   as words_count
                 FROM Words w
                 WHERE w.is_archived = 0 \
                 """
-        params = []
-
-        if start_date:
-            query += " AND CAST(w.last_shown AS DATE) >= ?"
-            if hasattr(start_date, 'strftime'):
-                params.append(start_date.strftime("%Y-%m-%d"))
-            else:
-                params.append(str(start_date))
-        if end_date:
-            query += " AND CAST(w.last_shown AS DATE) <= ?"
-            if hasattr(end_date, 'strftime'):
-                params.append(end_date.strftime("%Y-%m-%d"))
-            else:
-                params.append(str(end_date))
+        date_query, params = self._date_range('w.last_shown', start_date, end_date)
+        query += date_query
 
-        query += " GROUP BY CAST(w.last_shown AS DATE) ORDER BY study_date"
+        query += f" GROUP BY {study_date} ORDER BY study_date"
 
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
 
     def get_words_by_difficulty(self):
         try:
-            query = """
-                    SELECT w.difficulty_level, \
-                           COUNT(*) as count,
-                    SUM(CASE WHEN w.knowledge_level >= 5 THEN 1 ELSE 0 END) as learned
-                    FROM Words w
-                    WHERE w.is_archived = 0
-                    GROUP BY w.difficulty_level
-                    ORDER BY w.difficulty_level \
-                    """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            return results if results else []
+            return self.get_counters().by_difficulty()
         except Exception as e:
             print(f"Помилка в get_words_by_difficulty: {e}")
             return []
 
     def get_knowledge_level_distribution(self):
         try:
-            query = """
-                    SELECT w.knowledge_level, \
-                           COUNT(*) as count
-                    FROM Words w
-                    WHERE w.is_archived = 0
-                    GROUP BY w.knowledge_level
-                    ORDER BY w.knowledge_level \
-                    """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            return results if results else []
+            return self.get_counters().level_distribution()
         except Exception as e:
             print(f"Помилка в get_knowledge_level_distribution: {e}")
             return []
 
     def get_category_statistics(self):
         try:
-            query = """
-                SELECT 
-                    ISNULL(c.name, 'Без категорії') as name,
-                    COUNT(w.id) as total,
-                    SUM(CASE WHEN w.knowledge_level >= 5 THEN 1 ELSE 0 END) as learned,
-                    SUM(CASE WHEN w.knowledge_level BETWEEN 1 AND 4 THEN 1 ELSE 0 END) as learning,
-                    SUM(CASE WHEN w.knowledge_level = 0 THEN 1 ELSE 0 END) as new_words
-                FROM Words w
-                LEFT JOIN Categories c ON w.category_id = c.id
-                WHERE w.is_archived = 0
-                GROUP BY c.name, c.id
-                ORDER BY c.name
-            """
-            self.cursor.execute(query)
-            results = self.cursor.fetchall()
-            return results if results else []
+            by_category = self.get_counters().by_category()
+            with self.get_cursor() as cursor:
+                cursor.execute("SELECT id, name FROM Categories")
+                names = dict(cursor.fetchall())
+
+            results = [
+                (names.get(category_id) or 'Без категорії', *counts)
+                for category_id, counts in by_category.items()
+            ]
+            # Як і ORDER BY c.name: слова без категорії першими
+            results.sort(key=lambda row: (row[0] != 'Без категорії', row[0]))
+            return results
         except Exception as e:
             print(f"Помилка в get_category_statistics: {e}")
             return []
@@ -429,42 +803,39 @@ class DatabaseManager:
     def get_daily_statistics(self, days=30):
         """Отримати щоденну статистику з кращою обробкою помилок"""
         try:
-            # Перевіряємо, чи існує таблиця Interactions
-            self.cursor.execute("""
-                                SELECT COUNT(*)
-                                FROM INFORMATION_SCHEMA.TABLES
-                                WHERE TABLE_NAME = 'Interactions'
-                                """)
-            has_interactions = self.cursor.fetchone()[0] > 0
-
-            if has_interactions:
-                query = """
-                        SELECT CAST(i.interaction_date AS DATE)                  as study_date,
-                               SUM(CASE WHEN i.is_correct = 1 THEN 1 ELSE 0 END) as correct_answers,
-                               COUNT(*)                                          as total_interactions
-                        FROM Interactions i
-                        WHERE i.interaction_date >= DATEADD(day, -?, GETDATE())
-                        GROUP BY CAST(i.interaction_date AS DATE)
-                        ORDER BY study_date \
-                        """
-                self.cursor.execute(query, (days,))
-            else:
-                # Альтернативний запит для статистики з таблиці Words
-                query = """
-                        SELECT CAST(COALESCE(w.last_shown, w.created_at) AS DATE)                 as study_date, \
-                               SUM(CASE WHEN w.times_correct > 0 THEN w.times_correct ELSE 0 END) as correct_answers, \
-                               SUM(COALESCE(w.times_correct, 0) + COALESCE(w.times_wrong, 0))     as total_interactions
-                        FROM Words w
-                        WHERE w.is_archived = 0
-                          AND (w.last_shown IS NOT NULL OR w.created_at IS NOT NULL)
-                          AND (COALESCE(w.last_shown, w.created_at) >= DATEADD(day, -?, GETDATE())
-                            OR w.times_correct > 0 OR w.times_wrong > 0)
-                        GROUP BY CAST(COALESCE(w.last_shown, w.created_at) AS DATE)
-                        ORDER BY study_date \
-                        """
-                self.cursor.execute(query, (days,))
-
-            results = self.cursor.fetchall()
+            d = self.dialect
+            with self.get_cursor() as cursor:
+                # Перевіряємо, чи існує таблиця Interactions
+                has_interactions = d.table_exists(cursor, 'Interactions')
+
+                if has_interactions:
+                    query = f"""
+                            SELECT {d.date('i.interaction_date')}                  as study_date,
+                                   SUM(CASE WHEN i.is_correct = 1 THEN 1 ELSE 0 END) as correct_answers,
+                                   COUNT(*)                                          as total_interactions
+                            FROM Interactions i
+                            WHERE i.interaction_date >= {d.now_minus('day', '?')}
+                            GROUP BY {d.date('i.interaction_date')}
+                            ORDER BY study_date \
+                            """
+                    cursor.execute(query, (days,))
+                else:
+                    # Альтернативний запит для статистики з таблиці Words
+                    query = f"""
+                            SELECT {d.date('COALESCE(w.last_shown, w.created_at)')}                 as study_date, \
+                                   SUM(CASE WHEN w.times_correct > 0 THEN w.times_correct ELSE 0 END) as correct_answers, \
+                                   SUM(COALESCE(w.times_correct, 0) + COALESCE(w.times_wrong, 0))     as total_interactions
+                            FROM Words w
+                            WHERE w.is_archived = 0
+                              AND (w.last_shown IS NOT NULL OR w.created_at IS NOT NULL)
+                              AND (COALESCE(w.last_shown, w.created_at) >= {d.now_minus('day', '?')}
+                                OR w.times_correct > 0 OR w.times_wrong > 0)
+                            GROUP BY {d.date('COALESCE(w.last_shown, w.created_at)')}
+                            ORDER BY study_date \
+                            """
+                    cursor.execute(query, (days,))
+
+                results = cursor.fetchall()
 
             # Фільтруємо None значення і переконуємося, що дати коректні
             filtered_results = []
@@ -481,84 +852,100 @@ class DatabaseManager:
             return []
 
     def get_words_added_by_date(self, start_date=None, end_date=None):
-        query = """
-                SELECT CAST(w.created_at AS DATE) as added_date, \
+        added_date = self.dialect.date('w.created_at')
+        query = f"""
+                SELECT {added_date} as added_date, \
                        COUNT(*)                   as words_count
                 FROM Words w
                 WHERE w.is_archived = 0 \
                 """
-        params = []
-
-        if start_date:
-            query += " AND CAST(w.created_at AS DATE) >= ?"
-            if hasattr(start_date, 'strftime'):
-                params.append(start_date.strftime("%Y-%m-%d"))
-            else:
-                params.append(str(start_date))
-        if end_date:
-            query += " AND CAST(w.created_at AS DATE) <= ?"
-            if hasattr(end_date, 'strftime'):
-                params.append(end_date.strftime("%Y-%m-%d"))
-            else:
-                params.append(str(end_date))
+        date_query, params = self._date_range('w.created_at', start_date, end_date)
+        query += date_query
 
-        query += " GROUP BY CAST(w.created_at AS DATE) ORDER BY added_date"
+        query += f" GROUP BY {added_date} ORDER BY added_date"
 
-        self.cursor.execute(query, params)
-        return self.cursor.fetchall()
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
 
     def get_learning_progress(self, days=30):
+        query = f"""
+                SELECT {self.dialect.date('w.last_shown')} as learned_date, \
+                       COUNT(*)                   as words_count
+                FROM Words w
+                WHERE w.is_archived = 0 \
+                  AND w.knowledge_level >= 5
+                  AND w.last_shown IS NOT NULL
+                GROUP BY {self.dialect.date('w.last_shown')} \
+                """
+        with self.get_cursor() as cursor:
+            cursor.execute(query)
+            rows = cursor.fetchall()
+
+        learned_by_date = {}
+        for learned_date, count in rows:
+            if isinstance(learned_date, str):
+                learned_date = datetime.strptime(learned_date[:10], "%Y-%m-%d").date()
+            elif isinstance(learned_date, datetime):
+                learned_date = learned_date.date()
+            learned_by_date[learned_date] = count
+
+        # Накопичувальна кількість вивчених слів на кінець кожного дня
+        today = datetime.now().date()
+        first_day = today - timedelta(days=days - 1)
+        learned_count = sum(count for day, count in learned_by_date.items() if day < first_day)
+
+        progress = []
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            learned_count += learned_by_date.get(day, 0)
+            progress.append((day, learned_count))
+        return progress
+
+    def get_words_by_ids(self, word_ids, chunk_size=500):
         query = """
-                SELECT CAST(DATEADD(day, -ROW_NUMBER() OVER (ORDER BY GETDATE()), CAST(GETDATE() AS DATE)) AS DATE) as date,
-                (SELECT COUNT(*) FROM Words WHERE knowledge_level >= 5 AND is_archived = 0
-                 AND CAST(last_shown AS DATE) <= CAST(DATEADD(day, -ROW_NUMBER() OVER (ORDER BY GETDATE()), CAST(GETDATE() AS DATE)) AS DATE)) as learned_count
-                FROM (SELECT TOP ? 1 as n FROM (SELECT 1 UNION ALL SELECT 1) a CROSS JOIN (SELECT 1 UNION ALL SELECT 1) b) numbers
-                ORDER BY date \
+                SELECT w.id, \
+                       w.word, \
+                       w.translation, \
+                       w.transcription, \
+                       w.knowledge_level,
+                       c.name  as category, \
+                       w.times_shown, \
+                       w.times_correct, \
+                       w.times_wrong,
+                       w.is_favorite, \
+                       w.difficulty_level, \
+                       w.example_sentence, \
+                       w.example_translation,
+                       w.category_id
+                FROM Words w
+                         LEFT JOIN Categories c ON w.category_id = c.id
+                WHERE w.is_archived = 0 \
                 """
-        self.cursor.execute(query, (days,))
-        return self.cursor.fetchall()
-
-    def search_words_smart(self, search_term=""):
+        rows = {}
+        with self.get_cursor() as cursor:
+            for start in range(0, len(word_ids), chunk_size):
+                chunk = word_ids[start:start + chunk_size]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(query + f" AND w.id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    rows[row[0]] = row
+        return rows
+
+    def search_words_smart(self, search_term="", previous=()):
+        """previous - результат попереднього пошуку: знайдені в ньому рядки не читаються з БД повторно.
+        Відбір і ранжування завжди робить індекс, бо нечіткий збіг для довшого запиту може
+        не бути збігом для коротшого, і навпаки."""
         if not search_term or search_term.strip() == "":
             return []
 
         try:
-            query = """
-                    SELECT w.id, \
-                           w.word, \
-                           w.translation, \
-                           w.transcription, \
-                           w.knowledge_level,
-                           c.name  as category, \
-                           w.times_shown, \
-                           w.times_correct, \
-                           w.times_wrong,
-                           w.is_favorite, \
-                           w.difficulty_level, \
-                           w.example_sentence, \
-                           w.example_translation,
-                           w.category_id,
-                           CASE
-                               WHEN w.word LIKE ? THEN 'HIGHLIGHT_STRONG'
-                               WHEN w.translation LIKE ? THEN 'HIGHLIGHT_MEDIUM'
-                               ELSE 'HIGHLIGHT_LIGHT'
-                               END as highlight_type
-                    FROM Words w
-                             LEFT JOIN Categories c ON w.category_id = c.id
-                    WHERE w.is_archived = 0
-                      AND (w.word LIKE ? OR w.translation LIKE ?)
-                    ORDER BY CASE \
-                                 WHEN w.word LIKE ? THEN 1 \
-                                 WHEN w.translation LIKE ? THEN 2 \
-                                 ELSE 3 \
-                                 END, \
-                             w.word
-                    """
-            search_pattern = f'%{search_term}%'
-            self.cursor.execute(query, (search_pattern, search_pattern, search_pattern,
-                                        search_pattern, search_pattern, search_pattern))
-            results = self.cursor.fetchall()
-            return results
+            hits = self.get_word_index().search(search_term)
+            rows = {row[0]: row[:14] for row in previous}
+            missing = [word_id for word_id, _ in hits if word_id not in rows]
+            if missing:
+                rows.update(self.get_words_by_ids(missing))
+            return [tuple(rows[word_id]) + (rank,) for word_id, rank in hits if word_id in rows]
         except Exception as e:
             print(f"Помилка в search_words_smart: {e}")
             return self.get_all_words(search_term, "Всі", "word")
\ No newline at end of file
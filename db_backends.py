@@ -0,0 +1,327 @@
+import sqlite3
+from datetime import date, datetime
+
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
+
+
+# Індекси під фільтри за архівом/датами/рівнем та з'єднання з категоріями: (назва, стовпці, INCLUDE)
+WORD_INDEXES = [
+    ("IX_Words_archived_created", "is_archived, created_at", "knowledge_level"),
+    ("IX_Words_archived_last_shown", "is_archived, last_shown", "knowledge_level"),
+    ("IX_Words_archived_level", "is_archived, knowledge_level", "is_favorite, category_id"),
+    ("IX_Words_category", "category_id", "is_archived, knowledge_level"),
+]
+
+# Журнал аудиту гортається від новіших записів за (action_time, id), з фільтрами або без
+AUDIT_INDEXES = [
+    ("IX_AuditLog_time", "action_time, id", "user_id, action_type, table_name"),
+    ("IX_AuditLog_user_time", "user_id, action_time, id", "action_type, table_name"),
+    ("IX_AuditLog_action_time", "action_type, action_time, id", "user_id, table_name"),
+    ("IX_AuditLog_table_time", "table_name, action_time, id", "user_id, action_type"),
+]
+
+# Список користувачів гортається за (created_at, id) і фільтрується за останнім входом
+USER_INDEXES = [
+    ("IX_Users_created", "created_at, id", "username, is_active, is_locked, last_login"),
+    ("IX_Users_last_login", "last_login", "is_active, is_locked, created_at"),
+]
+
+TABLE_INDEXES = [("Words", WORD_INDEXES), ("AuditLog", AUDIT_INDEXES), ("Users", USER_INDEXES)]
+
+
+class SqlServerDialect:
+    name = "sqlserver"
+
+    def __init__(self, connection_string):
+        self.connection_string = connection_string
+        self.connection_errors = (pyodbc.Error,) if pyodbc else ()
+        # Помилки, спричинені самим записом (обмеження, обрізання рядка), а не з'єднанням
+        self.row_errors = (pyodbc.IntegrityError, pyodbc.DataError) if pyodbc else ()
+
+    def connect(self):
+        return pyodbc.connect(self.connection_string)
+
+    def initialize(self, conn):
+        # Схема, процедури та індекси розгортаються на сервері окремо (tools/migrate_indexes.py),
+        # тож відкриття з'єднання не виконує DDL
+        pass
+
+    def create_indexes(self, conn):
+        """Створює відсутні індекси TABLE_INDEXES. Повертає [(назва, створено)]."""
+        results = []
+        cursor = conn.cursor()
+        for table, indexes in TABLE_INDEXES:
+            for name, columns, include in indexes:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sys.indexes WHERE name = ? AND object_id = OBJECT_ID(?)",
+                    (name, f"dbo.{table}")
+                )
+                if cursor.fetchone()[0]:
+                    results.append((name, False))
+                    continue
+                cursor.execute(f"CREATE NONCLUSTERED INDEX {name} ON dbo.{table} ({columns}) INCLUDE ({include})")
+                conn.commit()
+                results.append((name, True))
+        cursor.close()
+        return results
+
+    def limit(self, placeholder="?"):
+        return f" OFFSET 0 ROWS FETCH NEXT {placeholder} ROWS ONLY"
+
+    def now(self):
+        return "GETDATE()"
+
+    def now_minus(self, unit, amount):
+        return f"DATEADD({unit}, -{amount}, GETDATE())"
+
+    def date(self, expression):
+        return f"CAST({expression} AS DATE)"
+
+    def table_exists(self, cursor, table_name):
+        cursor.execute(
+            "SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME = ?",
+            (table_name,)
+        )
+        return cursor.fetchone()[0] > 0
+
+    def insert_returning_id(self, cursor, query, params):
+        # SCOPE_IDENTITY у тому ж пакеті, щоб не отримати id, створений тригером
+        cursor.execute(f"SET NOCOUNT ON; {query}; SELECT CAST(SCOPE_IDENTITY() AS INT)", params)
+        return cursor.fetchone()[0]
+
+    def executemany(self, cursor, query, rows):
+        # Параметри передаються одним масивом замість окремого запиту на кожен рядок
+        cursor.fast_executemany = True
+        cursor.executemany(query, rows)
+
+    def record_interaction(self, cursor, word_id, mode_name, knows):
+        cursor.execute("EXEC sp_RecordInteraction ?, ?, ?", (word_id, mode_name, knows))
+
+    def record_interactions(self, cursor, rows):
+        cursor.executemany("EXEC sp_RecordInteraction ?, ?, ?", rows)
+
+    def log_actions(self, cursor, rows):
+        # Журнал аудиту є лише на сервері; час дії і решту полів AuditLog заповнює процедура
+        cursor.executemany("EXEC sp_LogAction ?, ?, ?, ?, ?, ?, ?", rows)
+
+    def start_session(self, cursor, mode_name):
+        cursor.execute("EXEC sp_StartSession ?", (mode_name,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def end_session(self, cursor, session_id):
+        cursor.execute("EXEC sp_EndSession ?", (session_id,))
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Categories (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    name        TEXT NOT NULL UNIQUE,
+    color_hex   TEXT DEFAULT '#3B82F6',
+    is_active   INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS Words (
+    id                  INTEGER PRIMARY KEY AUTOINCREMENT,
+    word                TEXT NOT NULL,
+    translation         TEXT NOT NULL,
+    transcription       TEXT,
+    example_sentence    TEXT,
+    example_translation TEXT,
+    category_id         INTEGER REFERENCES Categories (id),
+    difficulty_level    INTEGER NOT NULL DEFAULT 1,
+    knowledge_level     INTEGER NOT NULL DEFAULT 0,
+    times_shown         INTEGER NOT NULL DEFAULT 0,
+    times_correct       INTEGER NOT NULL DEFAULT 0,
+    times_wrong         INTEGER NOT NULL DEFAULT 0,
+    is_favorite         INTEGER NOT NULL DEFAULT 0,
+    is_archived         INTEGER NOT NULL DEFAULT 0,
+    last_shown          DATETIME,
+    created_at          DATETIME NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE TABLE IF NOT EXISTS StudySessions (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    mode_name   TEXT NOT NULL,
+    started_at  DATETIME NOT NULL DEFAULT (datetime('now', 'localtime')),
+    ended_at    DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS Interactions (
+    id                INTEGER PRIMARY KEY AUTOINCREMENT,
+    word_id           INTEGER NOT NULL REFERENCES Words (id) ON DELETE CASCADE,
+    mode_name         TEXT,
+    is_correct        INTEGER NOT NULL,
+    interaction_date  DATETIME NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE INDEX IF NOT EXISTS IX_Interactions_date ON Interactions (interaction_date);
+
+CREATE VIEW IF NOT EXISTS vw_Dashboard AS
+SELECT
+    SUM(CASE WHEN is_archived = 0 THEN 1 ELSE 0 END) AS total_words,
+    SUM(CASE WHEN is_archived = 0 AND knowledge_level >= 5 THEN 1 ELSE 0 END) AS learned_words,
+    SUM(CASE WHEN is_archived = 0 AND knowledge_level BETWEEN 1 AND 4 THEN 1 ELSE 0 END) AS learning_words,
+    SUM(CASE WHEN is_archived = 0 AND knowledge_level = 0 THEN 1 ELSE 0 END) AS new_words,
+    SUM(CASE WHEN is_favorite = 1 THEN 1 ELSE 0 END) AS favorite_words,
+    SUM(CASE WHEN is_archived = 1 THEN 1 ELSE 0 END) AS archived_words,
+    SUM(times_shown) AS total_shown,
+    SUM(times_correct) AS total_correct,
+    SUM(times_wrong) AS total_wrong,
+    (SELECT COUNT(*) FROM Categories WHERE is_active = 1) AS categories_count,
+    CASE
+        WHEN SUM(CASE WHEN is_archived = 0 THEN 1 ELSE 0 END) > 0
+        THEN 100.0 * SUM(CASE WHEN is_archived = 0 AND knowledge_level >= 5 THEN 1 ELSE 0 END)
+             / SUM(CASE WHEN is_archived = 0 THEN 1 ELSE 0 END)
+        ELSE 0
+    END AS progress_percentage
+FROM Words;
+"""
+
+
+class SqliteDialect:
+    name = "sqlite"
+    connection_errors = (sqlite3.Error,)
+    row_errors = (sqlite3.IntegrityError, sqlite3.DataError)
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES
+        )
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        return conn
+
+    def initialize(self, conn):
+        # Локальна БД створюється програмою, тож разом зі схемою - і її індекси
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(SQLITE_SCHEMA)
+        self.create_indexes(conn)
+
+    def create_indexes(self, conn):
+        """Створює відсутні індекси TABLE_INDEXES. Повертає [(назва, створено)]."""
+        results = []
+        cursor = conn.cursor()
+        for table, indexes in TABLE_INDEXES:
+            # Локальна БД може не мати таблиць адміністрування
+            if not self.table_exists(cursor, table):
+                continue
+            for name, columns, _ in indexes:
+                cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name = ?", (name,))
+                if cursor.fetchone()[0]:
+                    results.append((name, False))
+                    continue
+                cursor.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+                results.append((name, True))
+        cursor.close()
+        conn.commit()
+        return results
+
+    def limit(self, placeholder="?"):
+        return f" LIMIT {placeholder}"
+
+    def now(self):
+        return "datetime('now', 'localtime')"
+
+    def now_minus(self, unit, amount):
+        return f"datetime('now', 'localtime', '-' || {amount} || ' {unit}s')"
+
+    def date(self, expression):
+        return f"date({expression})"
+
+    def table_exists(self, cursor, table_name):
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table_name,)
+        )
+        return cursor.fetchone()[0] > 0
+
+    def insert_returning_id(self, cursor, query, params):
+        cursor.execute(query, params)
+        return cursor.lastrowid
+
+    def executemany(self, cursor, query, rows):
+        cursor.executemany(query, rows)
+
+    def record_interaction(self, cursor, word_id, mode_name, knows):
+        cursor.execute(
+            "INSERT INTO Interactions (word_id, mode_name, is_correct) VALUES (?, ?, ?)",
+            (word_id, mode_name, 1 if knows else 0)
+        )
+        if knows:
+            cursor.execute(
+                """
+                UPDATE Words
+                SET knowledge_level = knowledge_level + 1,
+                    times_shown     = times_shown + 1,
+                    times_correct   = times_correct + 1,
+                    last_shown      = datetime('now', 'localtime')
+                WHERE id = ?
+                """,
+                (word_id,)
+            )
+        else:
+            cursor.execute(
+                """
+                UPDATE Words
+                SET knowledge_level = CASE WHEN knowledge_level > 0 THEN knowledge_level - 1 ELSE 0 END,
+                    times_shown     = times_shown + 1,
+                    times_wrong     = times_wrong + 1,
+                    last_shown      = datetime('now', 'localtime')
+                WHERE id = ?
+                """,
+                (word_id,)
+            )
+
+    def record_interactions(self, cursor, rows):
+        # Порядок важливий: рівень знання не опускається нижче нуля
+        for word_id, mode_name, knows in rows:
+            self.record_interaction(cursor, word_id, mode_name, knows)
+
+    def start_session(self, cursor, mode_name):
+        cursor.execute("INSERT INTO StudySessions (mode_name) VALUES (?)", (mode_name,))
+        return cursor.lastrowid
+
+    def end_session(self, cursor, session_id):
+        cursor.execute(
+            "UPDATE StudySessions SET ended_at = datetime('now', 'localtime') WHERE id = ?",
+            (session_id,)
+        )
+
+
+def _adapt_datetime(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _convert_datetime(value):
+    text = value.decode()
+    # fromisoformat написаний на C і значно швидший за strptime, що помітно при масовому читанні
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return text
+
+
+sqlite3.register_adapter(datetime, _adapt_datetime)
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter("DATETIME", _convert_datetime)
+
+
+def create_dialect(backend, connection_string=None, sqlite_path=None):
+    if backend == "sqlite":
+        return SqliteDialect(sqlite_path)
+    return SqlServerDialect(connection_string)
@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+class ConnectionPool:
+    """Обмежений пул з'єднань: кожен потік отримує власне з'єднання.
+
+    `connect` - будь-яка фабрика DB-API з'єднань (pyodbc.connect, sqlite3.connect),
+    тому пул можна перевірити локально без SQL Server.
+    """
+
+    def __init__(self, connect, max_size=5, max_idle_seconds=300, health_check_after_seconds=30,
+                 health_check_query="SELECT 1", acquire_timeout=30):
+        self._connect = connect
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_after_seconds = health_check_after_seconds
+        self.health_check_query = health_check_query
+        self.acquire_timeout = acquire_timeout
+
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._local = threading.local()
+        self._closed = False
+
+    @contextmanager
+    def connection(self):
+        # Повторний вхід у тому ж потоці використовує вже видане з'єднання
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._release(conn)
+
+    @contextmanager
+    def cursor(self, commit=False):
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                if commit:
+                    conn.commit()
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise
+            finally:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+
+    def _acquire(self):
+        if self._closed:
+            raise PoolTimeoutError("Пул з'єднань закрито")
+
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolTimeoutError(
+                f"Немає вільних з'єднань протягом {self.acquire_timeout} с (максимум {self.max_size})"
+            )
+
+        try:
+            while True:
+                with self._lock:
+                    item = self._idle.pop() if self._idle else None
+
+                if item is None:
+                    return self._connect()
+
+                conn, released_at = item
+                idle_for = time.monotonic() - released_at
+
+                if idle_for > self.max_idle_seconds:
+                    self._discard(conn)
+                    continue
+
+                if idle_for > self.health_check_after_seconds and not self._is_healthy(conn):
+                    self._discard(conn)
+                    continue
+
+                return conn
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, conn):
+        try:
+            # Не залишаємо відкритих транзакцій між видачами з'єднання
+            conn.rollback()
+            healthy = True
+        except Exception:
+            healthy = False
+
+        try:
+            if healthy and not self._closed:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+            else:
+                self._discard(conn)
+        finally:
+            self._slots.release()
+
+        self.evict_idle()
+
+    def _is_healthy(self, conn):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(self.health_check_query)
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def evict_idle(self):
+        now = time.monotonic()
+        expired = []
+
+        with self._lock:
+            # Найстаріші з'єднання знаходяться зліва
+            while self._idle and now - self._idle[0][1] > self.max_idle_seconds:
+                expired.append(self._idle.popleft()[0])
+
+        for conn in expired:
+            self._discard(conn)
+
+        return len(expired)
+
+    def idle_count(self):
+        with self._lock:
+            return len(self._idle)
+
+    def close_all(self):
+        self._closed = True
+
+        with self._lock:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+
+        for conn in idle:
+            self._discard(conn)
@@ -0,0 +1,55 @@
+import os
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import fcntl
+
+# Скільки копій програми можуть одночасно мати власний локальний файл (журнал оцінок, аудит)
+MAX_SLOTS = 16
+
+
+def try_lock(f):
+    try:
+        if msvcrt:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def slot_path(base_path, slot):
+    return base_path if slot == 0 else f"{base_path}.{slot}"
+
+
+def claim_slot(base_path):
+    """Займає вільний файл `<base_path>`, `<base_path>.1`, ... Повертає (шлях, файл блокування),
+    блокування тримається, поки файл блокування відкритий; (None, None) - якщо всі зайняті."""
+    os.makedirs(os.path.dirname(os.path.abspath(base_path)), exist_ok=True)
+    for slot in range(MAX_SLOTS):
+        path = slot_path(base_path, slot)
+        lock_file = open(path + ".lock", "a+")
+        if try_lock(lock_file):
+            return path, lock_file
+        lock_file.close()
+    return None, None
+
+
+def orphaned_slots(base_path, own_path):
+    """Незайняті файли, що лишились після аварії інших процесів: [(шлях, файл блокування)].
+    Поки блокування тримаються, інший процес їх не займе."""
+    orphaned = []
+    for slot in range(MAX_SLOTS):
+        path = slot_path(base_path, slot)
+        if path == own_path or not os.path.exists(path):
+            continue
+        lock_file = open(path + ".lock", "a+")
+        if not try_lock(lock_file):
+            lock_file.close()
+            continue
+        orphaned.append((path, lock_file))
+    return orphaned
@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+
+from file_slots import MAX_SLOTS, claim_slot, orphaned_slots
+
+
+class InteractionJournal:
+    """Буфер оцінок карток із пакетним записом у БД.
+
+    Оцінки накопичуються в пам'яті та дописуються у локальний файл (на випадок
+    аварійного завершення), а в БД потрапляють однією транзакцією - коли набереться
+    `max_batch` записів або мине `flush_interval` секунд.
+
+    journal_path - базова назва файлу. Кожен процес займає вільний файл `<journal_path>`,
+    `<journal_path>.1`, ... і тримає блокування на `<файл>.lock`, поки журнал відкритий;
+    незайняті файли, що лишились після аварії інших процесів, переносяться у свій.
+    """
+
+    def __init__(self, db_manager, journal_path=None, max_batch=50, flush_interval=5.0):
+        self.db = db_manager
+        self.base_path = journal_path
+        self.journal_path = None
+        self._lock_file = None
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = None
+
+    def start(self):
+        if self.base_path:
+            self._claim_journal()
+        self._recover()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def record(self, word_id, mode_name, knows):
+        entry = (word_id, mode_name, bool(knows))
+
+        with self._lock:
+            self._pending.append(entry)
+            if self.journal_path:
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+            size = len(self._pending)
+
+        if size >= self.max_batch:
+            self._wakeup.set()
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+
+            if not batch:
+                return 0
+
+            try:
+                self.db.record_interactions(batch)
+            except Exception as e:
+                print(f"Помилка запису журналу оцінок: {e}")
+                # Повертаємо записи в чергу, щоб не втратити їх
+                with self._lock:
+                    self._pending = batch + self._pending
+                return 0
+
+            with self._lock:
+                self._rewrite_journal()
+            return len(batch)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(self.flush_interval + 5)
+        self.flush()
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            self.flush()
+
+    def _claim_journal(self):
+        self.journal_path, self._lock_file = claim_slot(self.base_path)
+        if not self.journal_path:
+            print(f"Усі {MAX_SLOTS} файлів журналу оцінок зайняті, оцінки зберігаються лише в пам'яті")
+
+    def _recover(self):
+        if not self.journal_path:
+            return
+
+        recovered = self._read_journal(self.journal_path)
+
+        orphaned = orphaned_slots(self.base_path, self.journal_path)
+        for path, _ in orphaned:
+            recovered.extend(self._read_journal(path))
+
+        if recovered:
+            print(f"Відновлено {len(recovered)} незбережених оцінок з журналу")
+            with self._lock:
+                self._pending = recovered + self._pending
+                # Чужі записи спершу потрапляють у свій файл, а вже потім чужі файли видаляються;
+                # заодно зникає обірваний останній рядок, щоб нові записи не дописувались до нього
+                self._rewrite_journal()
+
+        for path, lock_file in orphaned:
+            os.remove(path)
+            lock_file.close()
+
+    @staticmethod
+    def _read_journal(path):
+        if not os.path.exists(path):
+            return []
+
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    word_id, mode_name, knows = json.loads(line)
+                    entries.append((word_id, mode_name, knows))
+                except ValueError:
+                    # Обірваний останній рядок після аварії
+                    continue
+        return entries
+
+    def _rewrite_journal(self):
+        # Викликається під self._lock: у файлі лишаються тільки незбережені записи
+        if not self.journal_path:
+            return
+        if not self._pending:
+            open(self.journal_path, "w", encoding="utf-8").close()
+            return
+        with open(self.journal_path, "w", encoding="utf-8") as f:
+            for entry in self._pending:
+                f.write(json.dumps(entry) + "\n")
@@ -4,14 +4,16 @@ import sys
 
 from database import DatabaseManager
 from auth import AuthManager, UserManager, RoleManager
-from login_window import LoginWindow
+from login_window import LoginWindow, QuickLoginDialog
 from admin_panel import AdminPanel
-from DataExporter import DataExporter
+from query_executor import QueryExecutor
+from ui.audit_rows import AuditHeaderRow, AuditRow
+from ui.virtual_list import VirtualList
+from ui.word_rows import LabelRow
 
 from windows.flashcard_window import FlashcardWindow
 from windows.edit_word_window import EditWordWindow
 from windows.popup_window import PopupWindow
-from windows.statistics_window import StatisticsWindow
 
 from datetime import datetime, timedelta
 import threading
@@ -19,25 +21,57 @@ import time
 
 
 class LearnEasyWithAuth(ctk.CTk):
+    AUDIT_PAGE_SIZE = 100
 
     def __init__(self):
         super().__init__()
 
         self.db = DatabaseManager()
+        self.auth = None
+        self.user_manager = None
+        self.role_manager = None
+        self.query_executor = QueryExecutor(self)
+        self._exporter = None
+
+        self.popup_enabled = False
+        self.popup_interval = 300
+        self.popup_thread = None
+
+        # Вікно показуємо одразу, а з'єднання з БД відкриваємо у фоні; вхід - після підключення
+        self.title("Learn Easy")
+        self.connecting_label = ctk.CTkLabel(
+            self,
+            text="⏳ Підключення до бази даних...",
+            font=ctk.CTkFont(size=18),
+            text_color="#94A3B8"
+        )
+        self.connecting_label.pack(expand=True, padx=40, pady=40)
 
-        if not self.db.connect(use_trusted=True):
-            messagebox.showerror("Помилка", "Не вдалося підключитися до бази даних")
-            self.destroy()
-            sys.exit(1)
+        self.query_executor.submit(self.db.open, on_done=self.on_connected, on_error=self.on_connect_failed)
 
-        self.auth = AuthManager(self.db.conn)
-        self.user_manager = UserManager(self.db.conn, self.auth)
-        self.role_manager = RoleManager(self.db.conn, self.auth)
+    @property
+    def exporter(self):
+        if self._exporter is None:
+            from DataExporter import DataExporter
+            self._exporter = DataExporter(self.db)
+        return self._exporter
 
-        self.withdraw()
+    def on_connected(self, _):
+        self.connecting_label.destroy()
 
+        self.auth = AuthManager(self.db.pool, self.db.dialect)
+        self.user_manager = UserManager(self.db.pool, self.auth)
+        self.role_manager = RoleManager(self.db.pool, self.auth)
+
+        self.withdraw()
         self.show_login()
 
+    def on_connect_failed(self, error):
+        self.db.show_connection_error(error)
+        self.query_executor.shutdown()
+        self.destroy()
+        sys.exit(1)
+
     def show_login(self):
         login_window = LoginWindow(
             self.auth,
@@ -166,7 +200,7 @@ class LearnEasyWithAuth(ctk.CTk):
         btn = ctk.CTkButton(
             self.sidebar,
             text=text,
-            command=command,
+            command=lambda: self.run_in_session(command),
             height=50,
             font=ctk.CTkFont(size=15),
             fg_color="transparent",
@@ -177,6 +211,31 @@ class LearnEasyWithAuth(ctk.CTk):
         btn.pack(pady=5, padx=15, fill="x")
         self.menu_buttons.append(btn)
 
+    def run_in_session(self, command):
+        if self.ensure_session():
+            command()
+
+    def ensure_session(self) -> bool:
+        if self.auth.check_session():
+            return True
+
+        user = self.auth.get_current_user()
+        user_id = user['user_id'] if user else None
+
+        dialog = QuickLoginDialog(self, self.auth)
+        self.wait_window(dialog)
+
+        if not dialog.result:
+            self.end_session()
+            return False
+
+        user = self.auth.get_current_user()
+        if user['user_id'] != user_id:
+            # Увійшов інший користувач - меню має відповідати його ролі
+            self.create_interface(user)
+            return False
+        return True
+
     def highlight_menu_button(self, index: int):
         for i, btn in enumerate(self.menu_buttons):
             if i == index:
@@ -185,6 +244,7 @@ class LearnEasyWithAuth(ctk.CTk):
                 btn.configure(fg_color="transparent")
 
     def clear_main_container(self):
+        self.query_executor.cancel()
         for widget in self.main_container.winfo_children():
             widget.destroy()
 
@@ -215,9 +275,51 @@ class LearnEasyWithAuth(ctk.CTk):
         date_label.pack(side="right")
 
         # Статистика
-        stats = self.db.get_statistics()
+        stats_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+        stats_frame.pack(fill="x")
+        self.query_executor.submit(
+            self.db.get_statistics,
+            on_done=lambda stats: self.show_dashboard_stats(stats_frame, stats),
+            owner=stats_frame,
+            placeholder=stats_frame
+        )
 
-        cards_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+        # Швидкі дії
+        actions_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+        actions_frame.pack(fill="x", pady=20)
+
+        ctk.CTkLabel(
+            actions_frame,
+            text="Швидкі дії",
+            font=ctk.CTkFont(size=22, weight="bold")
+        ).pack(anchor="w", pady=(0, 15))
+
+        actions_buttons = ctk.CTkFrame(actions_frame, fg_color="transparent")
+        actions_buttons.pack(fill="x")
+
+        ctk.CTkButton(
+            actions_buttons,
+            text="🃏 Почати навчання",
+            command=lambda: self.run_in_session(self.show_flashcards),
+            height=60,
+            font=ctk.CTkFont(size=18, weight="bold"),
+            fg_color="#8B5CF6",
+            hover_color="#7C3AED"
+        ).pack(side="left", padx=10, fill="x", expand=True)
+
+        if self.auth.has_permission('words.create'):
+            ctk.CTkButton(
+                actions_buttons,
+                text="➕ Додати слова",
+                command=lambda: self.run_in_session(self.show_add_word),
+                height=60,
+                font=ctk.CTkFont(size=18, weight="bold"),
+                fg_color="#F59E0B",
+                hover_color="#D97706"
+            ).pack(side="left", padx=10, fill="x", expand=True)
+
+    def show_dashboard_stats(self, parent, stats):
+        cards_frame = ctk.CTkFrame(parent, fg_color="transparent")
         cards_frame.pack(fill="x", pady=20)
 
         cards_data = [
@@ -235,7 +337,7 @@ class LearnEasyWithAuth(ctk.CTk):
         cards_frame.grid_columnconfigure(1, weight=1)
 
         # Прогрес
-        progress_frame = ctk.CTkFrame(scroll_frame, fg_color="#1E293B", corner_radius=15)
+        progress_frame = ctk.CTkFrame(parent, fg_color="#1E293B", corner_radius=15)
         progress_frame.pack(fill="x", pady=30, padx=10)
 
         ctk.CTkLabel(
@@ -256,40 +358,6 @@ class LearnEasyWithAuth(ctk.CTk):
             text_color="#64748B"
         ).pack(pady=(5, 30))
 
-        # Швидкі дії
-        actions_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
-        actions_frame.pack(fill="x", pady=20)
-
-        ctk.CTkLabel(
-            actions_frame,
-            text="Швидкі дії",
-            font=ctk.CTkFont(size=22, weight="bold")
-        ).pack(anchor="w", pady=(0, 15))
-
-        actions_buttons = ctk.CTkFrame(actions_frame, fg_color="transparent")
-        actions_buttons.pack(fill="x")
-
-        ctk.CTkButton(
-            actions_buttons,
-            text="🃏 Почати навчання",
-            command=self.show_flashcards,
-            height=60,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            fg_color="#8B5CF6",
-            hover_color="#7C3AED"
-        ).pack(side="left", padx=10, fill="x", expand=True)
-
-        if self.auth.has_permission('words.create'):
-            ctk.CTkButton(
-                actions_buttons,
-                text="➕ Додати слова",
-                command=self.show_add_word,
-                height=60,
-                font=ctk.CTkFont(size=18, weight="bold"),
-                fg_color="#F59E0B",
-                hover_color="#D97706"
-            ).pack(side="left", padx=10, fill="x", expand=True)
-
     def create_stat_card(self, parent, title, value, color, icon):
         card = ctk.CTkFrame(parent, fg_color=color, corner_radius=15, height=150)
 
@@ -350,8 +418,8 @@ class LearnEasyWithAuth(ctk.CTk):
                 self.highlight_menu_button(i)
                 break
 
-        stats_window = StatisticsWindow(self.main_container, self.db)
-        stats_window.exporter = self.exporter
+        from windows.statistics_window import StatisticsWindow
+        StatisticsWindow(self.main_container, self.db)
 
     def show_add_word(self):
         self.clear_main_container()
@@ -392,17 +460,25 @@ class LearnEasyWithAuth(ctk.CTk):
             anchor="w"
         ).pack(side="left")
 
-        categories = self.db.get_categories()
-        cat_names = [cat[1] for cat in categories]
-        cat_var = ctk.StringVar(value=cat_names[0] if cat_names else "")
+        categories = []
+        cat_var = ctk.StringVar(value="")
 
-        ctk.CTkOptionMenu(
+        cat_menu = ctk.CTkOptionMenu(
             cat_frame,
-            values=cat_names,
+            values=[""],
             variable=cat_var,
             width=400,
             height=40
-        ).pack(side="left", padx=20)
+        )
+        cat_menu.pack(side="left", padx=20)
+
+        def show_categories(result):
+            categories[:] = result
+            cat_names = [cat[1] for cat in categories]
+            cat_menu.configure(values=cat_names or [""])
+            cat_var.set(cat_names[0] if cat_names else "")
+
+        self.query_executor.submit(self.db.get_categories, on_done=show_categories, owner=cat_menu)
 
         diff_frame = ctk.CTkFrame(form, fg_color="transparent")
         diff_frame.pack(fill="x", padx=40, pady=15)
@@ -452,7 +528,7 @@ class LearnEasyWithAuth(ctk.CTk):
         ctk.CTkButton(
             form,
             text="➕ Додати слово",
-            command=add_word,
+            command=lambda: self.run_in_session(add_word),
             width=400,
             height=55,
             font=ctk.CTkFont(size=18, weight="bold"),
@@ -529,7 +605,7 @@ class LearnEasyWithAuth(ctk.CTk):
         popup_switch = ctk.CTkSwitch(
             switch_frame,
             text="",
-            command=self.toggle_popups,
+            command=lambda: self.run_in_session(self.toggle_popups),
             onvalue=True,
             offvalue=False
         )
@@ -575,7 +651,7 @@ class LearnEasyWithAuth(ctk.CTk):
         ctk.CTkButton(
             popup_frame,
             text="💾 Зберегти",
-            command=save_settings,
+            command=lambda: self.run_in_session(save_settings),
             width=200,
             height=45,
             fg_color="#3B82F6",
@@ -623,7 +699,8 @@ class LearnEasyWithAuth(ctk.CTk):
             self.main_container,
             self.auth,
             self.user_manager,
-            self.role_manager
+            self.role_manager,
+            self.run_in_session
         )
         admin_panel.pack(fill="both", expand=True)
 
@@ -645,97 +722,132 @@ class LearnEasyWithAuth(ctk.CTk):
         )
         title.pack(pady=(0, 20))
 
-        try:
-            query = """
-                    SELECT TOP 100
-                    al.action_time, u.username,
-                           al.action_type,
-                           al.table_name,
-                           al.new_value,
-                           al.ip_address
-                    FROM AuditLog al
-                             LEFT JOIN Users u ON al.user_id = u.id
-                    ORDER BY al.action_time DESC \
-                    """
-            self.db.cursor.execute(query)
-            logs = self.db.cursor.fetchall()
-
-            if logs:
-                headers_frame = ctk.CTkFrame(container, fg_color="#334155", height=50)
-                headers_frame.pack(fill="x", pady=(0, 5))
-                headers_frame.pack_propagate(False)
-
-                headers = ["Час", "Користувач", "Дія", "Таблиця", "Деталі", "IP"]
-                widths = [150, 120, 100, 100, 300, 120]
-
-                for header, width in zip(headers, widths):
-                    ctk.CTkLabel(
-                        headers_frame,
-                        text=header,
-                        font=ctk.CTkFont(size=13, weight="bold"),
-                        width=width
-                    ).pack(side="left", padx=10, pady=10)
-
-                logs_frame = ctk.CTkScrollableFrame(container, fg_color="#1E293B")
-                logs_frame.pack(fill="both", expand=True, pady=5)
-
-                for log in logs:
-                    row = ctk.CTkFrame(logs_frame, fg_color="#1E293B", height=50)
-                    row.pack(fill="x", pady=2)
-                    row.pack_propagate(False)
-
-                    time_str = log[0].strftime("%d.%m.%Y %H:%M") if log[0] else "-"
-
-                    ctk.CTkLabel(row, text=time_str, width=150, anchor="w").pack(side="left", padx=10)
-                    ctk.CTkLabel(row, text=log[1] or "-", width=120, anchor="w").pack(side="left", padx=10)
-
-                    action_colors = {
-                        'CREATE': '#10B981',
-                        'UPDATE': '#F59E0B',
-                        'DELETE': '#EF4444',
-                        'LOGIN': '#3B82F6',
-                        'LOGOUT': '#64748B'
-                    }
-                    action_color = action_colors.get(log[2], '#94A3B8')
-
-                    ctk.CTkLabel(
-                        row,
-                        text=log[2] or "-",
-                        width=100,
-                        anchor="w",
-                        text_color=action_color
-                    ).pack(side="left", padx=10)
-
-                    ctk.CTkLabel(row, text=log[3] or "-", width=100, anchor="w").pack(side="left", padx=10)
-
-                    details = log[4] or "-"
-                    if len(details) > 40:
-                        details = details[:37] + "..."
-
-                    ctk.CTkLabel(
-                        row,
-                        text=details,
-                        width=300,
-                        anchor="w",
-                        text_color="#94A3B8"
-                    ).pack(side="left", padx=10)
-
-                    ctk.CTkLabel(row, text=log[5] or "-", width=120, anchor="w").pack(side="left", padx=10)
-            else:
-                ctk.CTkLabel(
-                    container,
-                    text="Немає записів у журналі",
-                    text_color="#94A3B8",
-                    font=ctk.CTkFont(size=14)
-                ).pack(pady=50)
-
-        except Exception as e:
-            ctk.CTkLabel(
-                container,
-                text=f"Помилка завантаження логів: {str(e)}",
-                text_color="#EF4444",
-                font=ctk.CTkFont(size=14)
-            ).pack(pady=30)
+        filters_frame = ctk.CTkFrame(container, fg_color="#1E293B", corner_radius=10)
+        filters_frame.pack(fill="x", pady=(0, 10))
+
+        self.audit_user_entry = ctk.CTkEntry(filters_frame, placeholder_text="Користувач", width=160)
+        self.audit_user_entry.pack(side="left", padx=10, pady=10)
+        self.audit_user_entry.bind("<Return>", lambda e: self.load_audit_log())
+
+        self.audit_action_var = ctk.StringVar(value="Всі дії")
+        ctk.CTkOptionMenu(
+            filters_frame,
+            variable=self.audit_action_var,
+            values=["Всі дії"] + self.db.AUDIT_ACTIONS,
+            command=lambda _: self.run_in_session(self.load_audit_log),
+            width=130
+        ).pack(side="left", padx=5, pady=10)
+
+        self.audit_table_var = ctk.StringVar(value="Всі таблиці")
+        ctk.CTkOptionMenu(
+            filters_frame,
+            variable=self.audit_table_var,
+            values=["Всі таблиці"] + self.db.AUDIT_TABLES,
+            command=lambda _: self.run_in_session(self.load_audit_log),
+            width=130
+        ).pack(side="left", padx=5, pady=10)
+
+        self.audit_from_entry = ctk.CTkEntry(filters_frame, placeholder_text="З (дд.мм.рррр)", width=130)
+        self.audit_from_entry.pack(side="left", padx=5, pady=10)
+
+        self.audit_to_entry = ctk.CTkEntry(filters_frame, placeholder_text="По (дд.мм.рррр)", width=130)
+        self.audit_to_entry.pack(side="left", padx=5, pady=10)
+
+        ctk.CTkButton(
+            filters_frame,
+            text="🔍 Знайти",
+            command=lambda: self.run_in_session(self.load_audit_log),
+            width=100
+        ).pack(side="left", padx=10, pady=10)
+
+        self.audit_list = VirtualList(container, {
+            "header": (55, AuditHeaderRow),
+            "log": (54, AuditRow),
+            "message": (130, lambda parent: LabelRow(
+                parent, 130, ctk.CTkFont(size=14), "#94A3B8", anchor="center", pady=50)),
+        }, on_end_reached=self.load_more_audit, fg_color="#1E293B")
+        self.audit_list.pack(fill="both", expand=True, pady=5)
+
+        self.audit_filters = {}
+        self.audit_next_cursor = None
+        self.load_audit_log()
+
+    def read_audit_filters(self):
+        dates = []
+        for entry in (self.audit_from_entry, self.audit_to_entry):
+            text = entry.get().strip()
+            if not text:
+                dates.append(None)
+                continue
+            try:
+                dates.append(datetime.strptime(text, "%d.%m.%Y"))
+            except ValueError:
+                messagebox.showwarning("Помилка", f"Невірна дата: {text}\nВикористовуйте формат дд.мм.рррр")
+                return None
+
+        action = self.audit_action_var.get()
+        table = self.audit_table_var.get()
+        return dict(
+            username=self.audit_user_entry.get().strip() or None,
+            action_type=action if action in self.db.AUDIT_ACTIONS else None,
+            table_name=table if table in self.db.AUDIT_TABLES else None,
+            start_date=dates[0],
+            end_date=dates[1]
+        )
+
+    def load_audit_log(self):
+        filters = self.read_audit_filters()
+        if filters is None:
+            return
+
+        self.query_executor.cancel(scope="audit")
+        self.audit_filters = filters
+        self.audit_next_cursor = None
+        self.audit_list.set_items([("message", "⏳ Завантаження...")])
+
+        self.query_executor.submit(
+            self.fetch_audit_page,
+            on_done=self.show_audit_page,
+            on_error=self.show_audit_error,
+            owner=self.audit_list,
+            scope="audit",
+            **filters
+        )
+
+    def fetch_audit_page(self, after=None, **filters):
+        if after is None:
+            # Щойно виконані дії ще можуть чекати в черзі аудиту
+            self.auth.audit.flush()
+        return self.db.get_audit_page(page_size=self.AUDIT_PAGE_SIZE, after=after, **filters)
+
+    def show_audit_page(self, page):
+        self.audit_next_cursor = page['next_cursor']
+        if not page['rows']:
+            self.audit_list.set_items([("message", "Немає записів у журналі")])
+            return
+
+        self.audit_list.set_items([("header", None)] + [("log", log) for log in page['rows']])
+
+    def load_more_audit(self):
+        if self.audit_next_cursor is None:
+            return
+
+        cursor, self.audit_next_cursor = self.audit_next_cursor, None
+        self.query_executor.submit(
+            self.fetch_audit_page,
+            after=cursor,
+            on_done=self.append_audit_page,
+            owner=self.audit_list,
+            scope="audit",
+            **self.audit_filters
+        )
+
+    def append_audit_page(self, page):
+        self.audit_next_cursor = page['next_cursor']
+        self.audit_list.append_items([("log", log) for log in page['rows']])
+
+    def show_audit_error(self, error):
+        self.audit_list.set_items([("message", f"Помилка завантаження логів: {str(error)}")])
 
     def show_welcome_message(self, user_data: dict):
         permissions = self.auth.get_user_permissions()
@@ -752,23 +864,27 @@ class LearnEasyWithAuth(ctk.CTk):
     def logout(self):
         if messagebox.askyesno("Вихід", "Ви впевнені що хочете вийти?"):
             self.auth.log_action('LOGOUT', 'System', None, None, None)
+            self.end_session()
 
-            self.popup_enabled = False
-            if self.popup_thread and self.popup_thread.is_alive():
-                self.popup_thread.join(timeout=1.0)
+    def end_session(self):
+        self.query_executor.cancel()
+
+        self.popup_enabled = False
+        if self.popup_thread and self.popup_thread.is_alive():
+            self.popup_thread.join(timeout=1.0)
 
-            self.auth.logout()
+        self.auth.logout()
 
-            self.withdraw()
+        self.withdraw()
 
-            for widget in self.winfo_children():
-                widget.destroy()
+        for widget in self.winfo_children():
+            widget.destroy()
 
-            self.show_login()
+        self.show_login()
 
     def on_closing(self):
         if messagebox.askyesno("Вихід", "Закрити додаток?"):
-            if self.auth.is_authenticated():
+            if self.auth and self.auth.is_authenticated():
                 self.auth.log_action('LOGOUT', 'System', None, None, 'Application closed')
                 self.auth.logout()
 
@@ -776,6 +892,10 @@ class LearnEasyWithAuth(ctk.CTk):
             if self.popup_thread and self.popup_thread.is_alive():
                 self.popup_thread.join(timeout=1.0)
 
+            # Експорт чи імпорт, що ще триває, зупиняється й дочікується до закриття з'єднань
+            self.query_executor.shutdown()
+            if self.auth:
+                self.auth.close()
             self.db.close()
             self.destroy()
             sys.exit(0)
@@ -0,0 +1,216 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import customtkinter as ctk
+
+
+class QueryTimeoutError(Exception):
+    pass
+
+
+class QueryCancelledError(Exception):
+    pass
+
+
+class QueryTask:
+    def __init__(self, on_done, on_error, owner, placeholder, deadline, scope, on_progress=None, persistent=False):
+        self.future = None
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.owner = owner
+        self.placeholder = placeholder
+        self.deadline = deadline
+        self.scope = scope
+        self.persistent = persistent
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+
+class QueryExecutor:
+    """Виконує запити до БД у пулі потоків і повертає результати в потік Tk.
+
+    Готові задачі збираються в черзі, яку потік Tk вичитує через after(), тож віджети
+    ніколи не змінюються з робочих потоків. Задачі можна скасувати за scope, а результат
+    задачі, чий owner уже знищено або яка перевищила timeout, відкидається.
+
+    Довгі операції (persistent=True, з on_progress) отримують аргумент progress(done, total): він
+    лише кладе подію в ту саму чергу, а після скасування кидає QueryCancelledError, тож задача
+    зупиняється на найближчому звіті. cancel() без scope такі задачі не зачіпає.
+    """
+
+    POLL_MS = 30
+
+    def __init__(self, root, max_workers=4, timeout=30):
+        self.root = root
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-query")
+        self._finished = queue.Queue()
+        self._pending = set()
+        self._poll_id = None
+
+    def submit(self, fn, *args, on_done=None, on_error=None, owner=None, placeholder=None, timeout=None,
+               scope=None, on_progress=None, persistent=False, **kwargs):
+        timeout = self.timeout if timeout is None else timeout
+        task = QueryTask(
+            on_done, on_error, owner,
+            self._show_placeholder(placeholder) if placeholder is not None else None,
+            time.monotonic() + timeout if timeout else None,
+            scope, on_progress, persistent
+        )
+        if on_progress is not None:
+            kwargs['progress'] = lambda *progress: self._report(task, progress)
+
+        self._pending.add(task)
+        task.future = self._pool.submit(fn, *args, **kwargs)
+        task.future.add_done_callback(lambda _: self._finished.put((task, None)))
+        self._schedule_poll()
+        return task
+
+    def cancel(self, scope=None):
+        for task in list(self._pending):
+            if scope is None and task.persistent:
+                continue
+            if scope is None or task.scope == scope:
+                self._discard(task)
+                task.cancel()
+
+    def shutdown(self, wait_persistent=True):
+        """Скасовує всі задачі. Тривалі операції зупиняються на найближчому звіті про прогрес, і
+        якщо wait_persistent, виклик чекає на це - щоб після нього можна було закрити з'єднання з БД."""
+        persistent = [task.future for task in self._pending if task.persistent]
+        for task in list(self._pending):
+            self._discard(task)
+            task.cancel()
+
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+        if wait_persistent and persistent:
+            wait(persistent)
+            for future in persistent:
+                if not future.cancelled() and future.exception() is not None:
+                    print(f"Фонову операцію перервано: {future.exception()}")
+
+    def _report(self, task, progress):
+        # Викликається з робочого потоку, тому лише черга - жодних звернень до Tk
+        if task.cancelled.is_set():
+            raise QueryCancelledError("Операцію скасовано")
+        self._finished.put((task, progress))
+
+    def _schedule_poll(self):
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.POLL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_id = None
+
+        while True:
+            try:
+                task, progress = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            if progress is None:
+                self._complete(task)
+            else:
+                self._progress(task, progress)
+
+        now = time.monotonic()
+        for task in list(self._pending):
+            if task.deadline is not None and now > task.deadline:
+                # Потік не перервати, тож просто ігноруємо запізнілий результат
+                self._discard(task)
+                task.cancel()
+                self._fail(task, QueryTimeoutError("Час очікування відповіді від БД вичерпано"))
+
+        if self._pending:
+            self._schedule_poll()
+
+    def _complete(self, task):
+        if task not in self._pending:
+            return
+        self._discard(task)
+
+        if task.owner is not None and not self._exists(task.owner):
+            return
+
+        error = task.future.exception()
+        if error is not None:
+            self._fail(task, error)
+            return
+
+        if task.on_done:
+            try:
+                task.on_done(task.future.result())
+            except Exception as e:
+                print(f"Помилка відображення даних: {e}")
+
+    def _progress(self, task, progress):
+        if task not in self._pending:
+            return
+        if task.owner is not None and not self._exists(task.owner):
+            return
+        try:
+            task.on_progress(*progress)
+        except Exception as e:
+            print(f"Помилка відображення прогресу: {e}")
+
+    def _fail(self, task, error):
+        print(f"Помилка завантаження даних: {error}")
+        if task.owner is not None and not self._exists(task.owner):
+            return
+
+        if task.on_error:
+            task.on_error(error)
+        elif task.placeholder is not None and self._exists(task.placeholder[0]):
+            ctk.CTkLabel(
+                task.placeholder[0],
+                text="⚠️ Не вдалося завантажити дані",
+                font=ctk.CTkFont(size=14),
+                text_color="#EF4444"
+            ).pack(pady=30)
+
+    def _discard(self, task):
+        self._pending.discard(task)
+        if task.placeholder is not None:
+            label = task.placeholder[1]
+            if self._exists(label):
+                label.destroy()
+
+    def _show_placeholder(self, parent):
+        label = ctk.CTkLabel(
+            parent,
+            text="⏳ Завантаження...",
+            font=ctk.CTkFont(size=16),
+            text_color="#94A3B8"
+        )
+        label.pack(pady=50)
+        return parent, label
+
+    @staticmethod
+    def _exists(widget):
+        try:
+            return bool(widget.winfo_exists())
+        except Exception:
+            return False
+
+
+def get_executor(widget):
+    """Спільний виконавець запитів для головного вікна, якому належить widget."""
+    root = widget.nametowidget(".")
+    executor = getattr(root, "query_executor", None)
+    if executor is None:
+        executor = QueryExecutor(root)
+        root.query_executor = executor
+    return executor
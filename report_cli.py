@@ -0,0 +1,116 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from config import DatabaseConfig, ReportConfig
+
+
+def load_jobs(path):
+    """Список завдань зі звітами: кожне - окрема БД (локальна SQLite користувача або логін на сервері).
+
+    [{"name": "olha", "backend": "sqlite", "sqlite_path": "olha.db"},
+     {"name": "school", "backend": "sqlserver", "username": "teacher", "password_env": "LE_TEACHER_PWD"}]
+    """
+    if not path:
+        return [{"name": "default"}]
+    with open(path, encoding="utf-8") as f:
+        jobs = json.load(f)
+    for job in jobs:
+        if "name" not in job:
+            raise ValueError(f"Завдання без назви: {job}")
+    return jobs
+
+
+def run_job(job, output_dir, formats):
+    """Виконується в окремому процесі: підключається до БД завдання і будує з одного знімка всі формати."""
+    from database import DatabaseManager
+    from DataExporter import DataExporter
+
+    # Процеси пулу виконують кілька завдань поспіль, тож налаштування передаються явно, а не через DatabaseConfig
+    backend = job.get("backend", DatabaseConfig.BACKEND)
+    sqlite_path = job.get("sqlite_path", None if "backend" in job else DatabaseConfig.SQLITE_PATH)
+    if backend == "sqlite":
+        # SQLite створила б порожню БД, і звіт вийшов би "успішним"
+        if not sqlite_path:
+            raise ValueError("Для завдання з SQLite не вказано sqlite_path")
+        if not os.path.exists(sqlite_path):
+            raise FileNotFoundError(f"Файл БД не знайдено: {sqlite_path}")
+
+    username = job.get("username")
+    password = os.environ.get(job["password_env"]) if job.get("password_env") else None
+
+    db = DatabaseManager()
+    db.open(username=username, password=password, use_trusted=username is None, journal=False,
+            backend=backend, sqlite_path=sqlite_path)
+    try:
+        directory = os.path.join(output_dir, job["name"])
+        os.makedirs(directory, exist_ok=True)
+        return DataExporter(db).build_reports(directory, formats=job.get("formats", formats))
+    finally:
+        db.close()
+
+
+def run_all(jobs, output_dir, formats, workers=None):
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job, output_dir, formats): job["name"] for job in jobs}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                for path in future.result():
+                    print(f"✅ {name}: {path}")
+            except Exception as e:
+                failed += 1
+                print(f"Помилка звіту для {name}: {e}")
+    return failed
+
+
+def next_run(now, every_minutes=None, at=None):
+    if every_minutes:
+        return now + timedelta(minutes=every_minutes)
+
+    candidates = []
+    for value in at:
+        hour, minute = map(int, value.split(":"))
+        run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if run <= now:
+            run += timedelta(days=1)
+        candidates.append(run)
+    return min(candidates)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генерація звітів LearnEasy без GUI")
+    parser.add_argument("--jobs", help="JSON-файл зі списком БД для звітів (за замовчуванням - поточна БД)")
+    parser.add_argument("--output", default=ReportConfig.OUTPUT_DIR, help="Каталог для звітів")
+    parser.add_argument("--formats", nargs="+", default=list(ReportConfig.FORMATS),
+                        choices=["docx", "xlsx", "json"])
+    parser.add_argument("--workers", type=int, default=ReportConfig.MAX_WORKERS,
+                        help="Кількість робочих процесів (за замовчуванням - кількість ядер)")
+    schedule = parser.add_mutually_exclusive_group()
+    schedule.add_argument("--every", type=int, metavar="MINUTES", help="Повторювати кожні N хвилин")
+    schedule.add_argument("--at", nargs="+", metavar="HH:MM", help="Щоденний розклад")
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.jobs)
+
+    if not args.every and not args.at:
+        return 1 if run_all(jobs, args.output, args.formats, args.workers) else 0
+
+    if args.every:
+        # За інтервалом перший запуск - одразу
+        run_all(jobs, args.output, args.formats, args.workers)
+
+    while True:
+        run_at = next_run(datetime.now(), args.every, args.at)
+        print(f"Наступний запуск: {run_at.strftime('%d.%m.%Y %H:%M')}")
+        time.sleep(max(0.0, (run_at - datetime.now()).total_seconds()))
+        run_all(jobs, args.output, args.formats, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta
+
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+
+# Оцінки в термінах SM-2: "Знаю" = 5, "Не знаю" = 2
+QUALITY_KNOWN = 5
+QUALITY_FORGOTTEN = 2
+
+LEARNING_STEP = timedelta(minutes=10)
+LEARNING_INTERVAL = timedelta(minutes=30)
+REVIEW_INTERVAL = timedelta(days=1)
+MAX_INTERVAL = timedelta(days=365)
+LEARNED_LEVEL = 5
+
+
+def ease_delta(quality):
+    return 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+
+
+def interval_for(knowledge_level, ease):
+    # Рівні 1-4 повторюються в межах дня, з 5-го - щонайменше раз на добу
+    if knowledge_level <= 0:
+        return LEARNING_STEP
+    if knowledge_level < LEARNED_LEVEL:
+        return LEARNING_INTERVAL * (ease ** (knowledge_level - 1))
+    exponent = knowledge_level - LEARNED_LEVEL
+    if exponent * ease > 64:
+        return MAX_INTERVAL
+    return min(MAX_INTERVAL, REVIEW_INTERVAL * (ease ** exponent))
+
+
+class CardState:
+    __slots__ = ("card", "knowledge_level", "ease", "due", "seq")
+
+    def __init__(self, card, knowledge_level, ease, due):
+        self.card = card
+        self.knowledge_level = knowledge_level
+        self.ease = ease
+        self.due = due
+        self.seq = None
+
+
+class SpacedRepetitionScheduler:
+    """Черга карток, впорядкована за часом наступного повторення (SM-2).
+
+    Завантажується один раз на сесію; вибір наступної картки та оцінка
+    працюють у пам'яті за O(log n).
+    """
+
+    def __init__(self, now=datetime.now):
+        self._now = now
+        self._heap = []
+        self._states = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def load(self, rows):
+        """rows: (id, word, translation, transcription, example_sentence, example_translation,
+        knowledge_level, times_correct, times_wrong, last_shown)"""
+        now = self._now()
+        heap = []
+        states = {}
+
+        for row in rows:
+            card = tuple(row[:7])
+            knowledge_level = row[6] or 0
+            times_correct = row[7] or 0
+            times_wrong = row[8] or 0
+            last_shown = row[9]
+
+            ease = max(MIN_EASE, DEFAULT_EASE
+                       + times_correct * ease_delta(QUALITY_KNOWN)
+                       + times_wrong * ease_delta(QUALITY_FORGOTTEN))
+
+            if isinstance(last_shown, datetime):
+                due = last_shown + interval_for(knowledge_level, ease)
+            else:
+                due = now
+
+            state = CardState(card, knowledge_level, ease, due)
+            state.seq = next(self._counter)
+            states[card[0]] = state
+            heap.append((due, state.seq, card[0]))
+
+        heapq.heapify(heap)
+
+        with self._lock:
+            self._heap = heap
+            self._states = states
+
+    def __len__(self):
+        return len(self._states)
+
+    def __contains__(self, word_id):
+        return word_id in self._states
+
+    def _push(self, state):
+        state.seq = next(self._counter)
+        heapq.heappush(self._heap, (state.due, state.seq, state.card[0]))
+
+        # Періодично прибираємо застарілі записи, щоб купа не росла без меж
+        if len(self._heap) > 2 * len(self._states) + 64:
+            self._heap = [(s.due, s.seq, word_id) for word_id, s in self._states.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_valid(self):
+        while self._heap:
+            due, seq, word_id = heapq.heappop(self._heap)
+            state = self._states.get(word_id)
+            # Застарілі записи (після переоцінки або видалення) пропускаємо
+            if state is not None and state.seq == seq:
+                return state
+        return None
+
+    def next_card(self):
+        with self._lock:
+            state = self._pop_valid()
+            if state is None:
+                return None
+
+            # Якщо картку не оцінять, вона повернеться після короткої паузи
+            state.due = max(state.due, self._now()) + LEARNING_STEP
+            self._push(state)
+            return state.card
+
+    def record(self, word_id, knows):
+        with self._lock:
+            state = self._states.get(word_id)
+            if state is None:
+                return
+
+            if knows:
+                state.knowledge_level += 1
+                state.ease = max(MIN_EASE, state.ease + ease_delta(QUALITY_KNOWN))
+            else:
+                state.knowledge_level = max(0, state.knowledge_level - 1)
+                state.ease = max(MIN_EASE, state.ease + ease_delta(QUALITY_FORGOTTEN))
+
+            state.card = state.card[:6] + (state.knowledge_level,)
+            state.due = self._now() + interval_for(state.knowledge_level, state.ease)
+            self._push(state)
+
+    def remove(self, word_id):
+        with self._lock:
+            self._states.pop(word_id, None)
@@ -0,0 +1,143 @@
+"""Перевірка планів запитів з фільтрами за датами слів.
+
+Діапазони за created_at і last_shown мають іти пошуком по індексах WORD_INDEXES. Скрипт бере SQL,
+який будує DatabaseManager, і показує для нього EXPLAIN QUERY PLAN (SQLite) або SHOWPLAN_XML
+(SQL Server). Код виходу 1, якщо хоч в одному плані Words сканується або читається по індексу,
+в ключі якого немає стовпця дати - це те саме сканування, лише звужене до неархівних слів.
+На сервері індекси мають бути створені tools/migrate_indexes.py.
+
+    python tools/check_query_plans.py
+    python tools/check_query_plans.py --backend sqlite --sqlite-path learneasy.db
+"""
+import argparse
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DatabaseConfig
+from database import DatabaseManager
+from db_backends import WORD_INDEXES
+
+SHOWPLAN_NS = {"p": "http://schemas.microsoft.com/sqlserver/2004/07/showplan"}
+SCAN_OPERATORS = ("Table Scan", "Clustered Index Scan", "Index Scan")
+
+
+def predicates(start, end):
+    return [
+        ("get_all_words", "created_at", lambda db: db.get_all_words(start_date=start, end_date=end)),
+        ("get_words_page", "created_at", lambda db: db.get_words_page(start_date=start, end_date=end)),
+        ("get_words_statistics", "last_shown", lambda db: db.get_words_statistics(start, end)),
+        ("get_words_added_by_date", "created_at", lambda db: db.get_words_added_by_date(start, end)),
+    ]
+
+
+class RecordingCursor:
+    """Запам'ятовує запити замість виконання - так перевіряється той самий SQL, що й у програмі."""
+
+    def __init__(self, queries):
+        self.queries = queries
+
+    def execute(self, query, params=()):
+        self.queries.append((query, list(params)))
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return (0,)
+
+
+def recorded_queries(db, call):
+    queries = []
+
+    @contextmanager
+    def recording_cursor(commit=False):
+        yield RecordingCursor(queries)
+
+    db.get_cursor = recording_cursor
+    try:
+        call(db)
+    finally:
+        del db.get_cursor
+    return queries
+
+
+def sqlite_plan(cursor, query, params, column):
+    cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+    plan = [row[-1] for row in cursor.fetchall()]
+    # Обмеження пошуку SQLite пише в дужках: (is_archived=? AND created_at>? AND created_at<?)
+    scans = [step for step in plan if re.match(r"(SCAN|SEARCH) (TABLE )?(Words|w)\b", step)
+             and not re.search(rf"\b{column}[<>]", step)]
+    return plan, scans
+
+
+def sqlserver_plan(cursor, query, params, column):
+    # З SHOWPLAN_XML запит не виконується - сервер повертає лише план
+    cursor.execute("SET SHOWPLAN_XML ON")
+    try:
+        cursor.execute(query, params)
+        root = ET.fromstring(cursor.fetchone()[0])
+    finally:
+        cursor.execute("SET SHOWPLAN_XML OFF")
+
+    index_keys = {name: [key.strip() for key in keys.split(",")] for name, keys, _ in WORD_INDEXES}
+    plan, scans = [], []
+    for operator in root.iter(f"{{{SHOWPLAN_NS['p']}}}RelOp"):
+        access = operator.find("p:IndexScan", SHOWPLAN_NS)
+        if access is None:
+            access = operator.find("p:TableScan", SHOWPLAN_NS)
+        if access is None:
+            continue
+        target = access.find("p:Object", SHOWPLAN_NS)
+        index = (target.get("Index") or "").strip("[]")
+        step = f"{operator.get('PhysicalOp')} {target.get('Table')} {index}".strip()
+        plan.append(step)
+
+        # Key Lookup дочитує рядки, вже знайдені пошуком по індексу
+        if target.get("Table") != "[Words]" or access.get("Lookup") in ("1", "true"):
+            continue
+        if operator.get("PhysicalOp") in SCAN_OPERATORS or column not in index_keys.get(index, []):
+            scans.append(step)
+    return plan, scans
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Плани запитів LearnEasy з фільтрами за датами")
+    parser.add_argument("--backend", choices=["sqlserver", "sqlite"], default=DatabaseConfig.BACKEND)
+    parser.add_argument("--sqlite-path", default=DatabaseConfig.SQLITE_PATH)
+    parser.add_argument("--days", type=int, default=30, help="Довжина діапазону дат у запитах")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager()
+    db.open(journal=False, backend=args.backend, sqlite_path=args.sqlite_path)
+    explain = sqlite_plan if db.dialect.name == "sqlite" else sqlserver_plan
+
+    end = date.today()
+    failed = 0
+    try:
+        for name, column, call in predicates(end - timedelta(days=args.days), end):
+            queries = recorded_queries(db, call)
+            for number, (query, params) in enumerate(queries, 1):
+                with db.get_cursor() as cursor:
+                    plan, scans = explain(cursor, query, params, column)
+
+                label = f"{name} ({column})" + (f" #{number}" if len(queries) > 1 else "")
+                print(f"{'СКАНУВАННЯ' if scans else 'OK'}  {label}")
+                for step in plan:
+                    print(f"    {step}")
+                failed += bool(scans)
+    finally:
+        db.close()
+
+    if failed:
+        print(f"Запитів без пошуку по індексу за датою: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
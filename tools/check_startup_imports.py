@@ -0,0 +1,92 @@
+"""Перевірка холодного старту: що імпортується до появи першого вікна.
+
+Імпортує точки входу (main.py, main_admin.py) в окремому процесі з `python -X importtime` і
+показує найдовші імпорти. Код виходу 1, якщо завантажилась хоч одна з важких бібліотек, потрібних
+лише для експорту чи графіків, або сумарний час перевищив --budget-ms.
+
+    python tools/check_startup_imports.py
+    python tools/check_startup_imports.py --budget-ms 800
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_MODULES = ("main", "main_admin")
+# Завантажуються лише при експорті (DataExporter) чи відкритті статистики
+DEFERRED_PACKAGES = ("docx", "openpyxl", "matplotlib", "pyarrow")
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_times(module):
+    """Рядки -X importtime у порядку виводу: (глибина, назва, власний час мкс, сумарний час мкс)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not IMPORT_LINE.match(line)]
+        raise RuntimeError(f"Не вдалося імпортувати {module}:\n" + "\n".join(errors))
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            entries.append((len(indent) // 2, name, int(own), int(cumulative)))
+    return entries
+
+
+def import_chain(entries, position):
+    # importtime виводить модуль перед тим, хто його імпортував, і з більшим відступом
+    depth, name, _, _ = entries[position]
+    chain = [name]
+    for parent_depth, parent, _, _ in entries[position + 1:]:
+        if parent_depth < depth:
+            chain.append(parent)
+            depth = parent_depth
+    return " <- ".join(chain)
+
+
+def check(module, budget_ms, top):
+    entries = import_times(module)
+    total_ms = sum(cumulative for depth, _, _, cumulative in entries if depth == 0) / 1000
+    print(f"{module}: {total_ms:.0f} мс")
+
+    for depth, name, own, cumulative in sorted(entries, key=lambda entry: -entry[3])[:top]:
+        print(f"    {cumulative / 1000:8.1f} мс  {name}")
+
+    failed = False
+    for position, (depth, name, _, _) in enumerate(entries):
+        if name in DEFERRED_PACKAGES:
+            print(f"    ЗАВАНТАЖЕНО ДО ВІКНА: {import_chain(entries, position)}")
+            failed = True
+
+    if budget_ms and total_ms > budget_ms:
+        print(f"    Перевищено бюджет старту: {total_ms:.0f} мс > {budget_ms} мс")
+        failed = True
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Імпорти LearnEasy до першого вікна")
+    parser.add_argument("--budget-ms", type=int, default=0, help="Бюджет сумарного часу імпорту (0 - без межі)")
+    parser.add_argument("--top", type=int, default=10, help="Скільки найдовших імпортів показати")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in ENTRY_MODULES:
+        try:
+            failed |= check(module, args.budget_ms, args.top)
+        except RuntimeError as e:
+            print(e)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
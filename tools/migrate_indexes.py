@@ -0,0 +1,54 @@
+"""Одноразова міграція: індекси WORD_INDEXES, AUDIT_INDEXES і USER_INDEXES.
+
+Програма під час входу DDL не виконує, тож на сервері індекси створює адміністратор цим скриптом -
+після розгортання схеми та після оновлень, що додають індекси. Наявні індекси не змінюються.
+Потрібні права на CREATE INDEX; без --username підключення через Windows.
+Код виходу 1, якщо хоч один індекс створити не вдалося.
+
+    python tools/migrate_indexes.py
+    python tools/migrate_indexes.py --username admin --password ...
+    python tools/migrate_indexes.py --backend sqlite --sqlite-path learneasy.db
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DatabaseConfig
+from db_backends import create_dialect
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Індекси БД LearnEasy")
+    parser.add_argument("--backend", choices=["sqlserver", "sqlite"], default=DatabaseConfig.BACKEND)
+    parser.add_argument("--sqlite-path", default=DatabaseConfig.SQLITE_PATH)
+    parser.add_argument("--username", help="Логін SQL Server (без нього - вхід Windows)")
+    parser.add_argument("--password", default="")
+    args = parser.parse_args(argv)
+
+    connection_string = DatabaseConfig.get_connection_string(
+        username=args.username,
+        password=args.password,
+        use_trusted=not args.username
+    )
+    dialect = create_dialect(args.backend, connection_string=connection_string, sqlite_path=args.sqlite_path)
+
+    try:
+        conn = dialect.connect()
+        try:
+            results = dialect.create_indexes(conn)
+        finally:
+            conn.close()
+    except dialect.connection_errors as e:
+        print(f"Помилка створення індексів: {e}")
+        return 1
+
+    for name, created in results:
+        print(f"{'СТВОРЕНО' if created else 'вже є   '}  {name}")
+    print(f"Створено індексів: {sum(created for _, created in results)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import customtkinter as ctk
+
+ACTION_COLORS = {
+    'CREATE': '#10B981',
+    'UPDATE': '#F59E0B',
+    'DELETE': '#EF4444',
+    'LOGIN': '#3B82F6',
+    'LOGOUT': '#64748B'
+}
+
+AUDIT_COLUMNS = [("Час", 150), ("Користувач", 120), ("Дія", 100), ("Таблиця", 100), ("Деталі", 300), ("IP", 120)]
+
+
+class AuditHeaderRow(ctk.CTkFrame):
+    def __init__(self, parent):
+        super().__init__(parent, fg_color="#334155", height=50)
+        self.pack_propagate(False)
+
+        for header, width in AUDIT_COLUMNS:
+            ctk.CTkLabel(
+                self,
+                text=header,
+                font=ctk.CTkFont(size=13, weight="bold"),
+                width=width
+            ).pack(side="left", padx=10, pady=10)
+
+    def show(self, data):
+        pass
+
+
+class AuditRow(ctk.CTkFrame):
+    def __init__(self, parent):
+        super().__init__(parent, fg_color="#1E293B", height=50)
+        self.pack_propagate(False)
+
+        self.labels = []
+        for _, width in AUDIT_COLUMNS:
+            label = ctk.CTkLabel(self, text="", width=width, anchor="w")
+            label.pack(side="left", padx=10)
+            self.labels.append(label)
+        self.labels[4].configure(text_color="#94A3B8")
+
+    def show(self, log):
+        _, action_time, username, action_type, table_name, details, ip_address = log
+
+        details = details or "-"
+        if len(details) > 40:
+            details = details[:37] + "..."
+
+        time_label, user_label, action_label, table_label, details_label, ip_label = self.labels
+        time_label.configure(text=action_time.strftime("%d.%m.%Y %H:%M") if action_time else "-")
+        user_label.configure(text=username or "-")
+        action_label.configure(text=action_type or "-", text_color=ACTION_COLORS.get(action_type, '#94A3B8'))
+        table_label.configure(text=table_name or "-")
+        details_label.configure(text=details)
+        ip_label.configure(text=ip_address or "-")
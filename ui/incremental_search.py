@@ -0,0 +1,65 @@
+from query_executor import get_executor
+
+
+class IncrementalSearch:
+    """Пошук із затримкою після введення, що виконується поза потоком Tk.
+
+    Запити йдуть через спільний QueryExecutor: результат приходить у потоці Tk, новий запит
+    скасовує попередній, а зміна екрана - обидва. Якщо новий запит продовжує попередній,
+    search отримує другим аргументом попередній результат, щоб не читати ті самі рядки знову.
+    """
+
+    def __init__(self, widget, search, on_results, delay_ms=250, owner=None, scope="search"):
+        self.widget = widget
+        self.search = search
+        self.on_results = on_results
+        self.delay_ms = delay_ms
+        self.owner = owner
+        self.scope = scope
+        self.executor = get_executor(widget)
+
+        self._after_id = None
+        self._last_term = None
+        self._last_results = None
+
+    def submit(self, term, delay_ms=None):
+        self._cancel_timer()
+        delay = self.delay_ms if delay_ms is None else delay_ms
+        self._after_id = self.widget.after(delay, lambda: self._start(term))
+
+    def cancel(self):
+        self._cancel_timer()
+        self.executor.cancel(scope=self.scope)
+
+    def invalidate(self):
+        self._last_term = None
+        self._last_results = None
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _start(self, term):
+        self._after_id = None
+        self.executor.cancel(scope=self.scope)
+
+        args = (term,)
+        if self._last_term and self._last_results \
+                and term.strip().casefold().startswith(self._last_term.strip().casefold()):
+            args = (term, self._last_results)
+
+        self.executor.submit(
+            self.search, *args,
+            on_done=lambda results: self._deliver(term, results),
+            owner=self.owner,
+            scope=self.scope
+        )
+
+    def _deliver(self, term, results):
+        self._last_term = term
+        self._last_results = results
+        self.on_results(term, results)
@@ -7,11 +7,14 @@ import random
 import calendar
 from dateutil.relativedelta import relativedelta
 
-from DataExporter import DataExporter
 from database import DatabaseManager
+from query_executor import QueryExecutor
 from windows.edit_word_window import EditWordWindow
 from windows.flashcard_window import FlashcardWindow
 from windows.popup_window import PopupWindow
+from ui.incremental_search import IncrementalSearch
+from ui.virtual_list import VirtualList
+from ui.word_rows import DIFFICULTY_NAMES, LabelRow, SearchResultRow, TableHeaderRow, WordRow
 
 
 class DatePickerFrame(ctk.CTkFrame):
@@ -118,14 +121,13 @@ class DropdownDatePicker:
 
 
 class MainApp(ctk.CTk):
+    WORDS_PAGE_SIZE = 200
+
     def __init__(self):
         super().__init__()
         self.db = DatabaseManager()
-        if not self.db.connect():
-            self.destroy()
-            return
-
-        self.exporter = DataExporter(self.db)
+        self._exporter = None
+        self.query_executor = QueryExecutor(self)
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -137,13 +139,43 @@ class MainApp(ctk.CTk):
 
         self.date_filter_start = None
         self.date_filter_end = None
-
-        self.create_widgets()
+        self.word_search = None
+        self.words_next_cursor = None
+        self.words_page_filters = {}
+
+        # Вікно показуємо одразу, а з'єднання з БД відкриваємо у фоні
+        self.connecting_label = ctk.CTkLabel(
+            self,
+            text="⏳ Підключення до бази даних...",
+            font=ctk.CTkFont(size=18),
+            text_color="#94A3B8"
+        )
+        self.connecting_label.pack(expand=True)
 
         self.after(50, lambda: self.state('zoomed'))
 
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        self.query_executor.submit(self.db.open, on_done=self.on_connected, on_error=self.on_connect_failed)
+
+    @property
+    def exporter(self):
+        # Експорт тягне за собою docx та openpyxl, тож модуль імпортується лише при першому експорті
+        if self._exporter is None:
+            from DataExporter import DataExporter
+            self._exporter = DataExporter(self.db)
+        return self._exporter
+
+    def on_connected(self, _):
+        self.connecting_label.destroy()
+        self.create_widgets()
+
+    def on_connect_failed(self, error):
+        self.db.show_connection_error(error)
+        # Експорт чи імпорт, що ще триває, зупиняється й дочікується до закриття з'єднань
+        self.query_executor.shutdown()
+        self.destroy()
+
     def create_widgets(self):
         self.sidebar = ctk.CTkFrame(self, width=220, corner_radius=0, fg_color="#1E293B")
         self.sidebar.pack(side="left", fill="y")
@@ -183,6 +215,8 @@ class MainApp(ctk.CTk):
         self.show_dashboard()
 
     def clear_main_container(self):
+        # Дані для попереднього екрана вже не потрібні
+        self.query_executor.cancel()
         for widget in self.main_container.winfo_children():
             widget.destroy()
 
@@ -213,8 +247,44 @@ class MainApp(ctk.CTk):
             text_color="#64748B"
         )
         date_label.pack(side="right")
-        stats = self.db.get_statistics()
-        cards_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+        stats_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+        stats_frame.pack(fill="x")
+        self.query_executor.submit(
+            self.db.get_statistics,
+            on_done=lambda stats: self.show_dashboard_stats(stats_frame, stats),
+            owner=stats_frame,
+            placeholder=stats_frame
+        )
+        actions_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
+        actions_frame.pack(fill="x", pady=20)
+        ctk.CTkLabel(
+            actions_frame,
+            text="Швидкі дії",
+            font=ctk.CTkFont(size=22, weight="bold")
+        ).pack(anchor="w", pady=(0, 15))
+        actions_buttons = ctk.CTkFrame(actions_frame, fg_color="transparent")
+        actions_buttons.pack(fill="x")
+        ctk.CTkButton(
+            actions_buttons,
+            text="🃏 Почати навчання",
+            command=self.show_flashcards,
+            height=60,
+            font=ctk.CTkFont(size=18, weight="bold"),
+            fg_color="#8B5CF6",
+            hover_color="#7C3AED"
+        ).pack(side="left", padx=10, fill="x", expand=True)
+        ctk.CTkButton(
+            actions_buttons,
+            text="➕ Додати слова",
+            command=self.show_add_word,
+            height=60,
+            font=ctk.CTkFont(size=18, weight="bold"),
+            fg_color="#F59E0B",
+            hover_color="#D97706"
+        ).pack(side="left", padx=10, fill="x", expand=True)
+
+    def show_dashboard_stats(self, parent, stats):
+        cards_frame = ctk.CTkFrame(parent, fg_color="transparent")
         cards_frame.pack(fill="x", pady=20)
         cards_data = [
             ("Всього слів", stats['total_words'], "#3B82F6", "📚"),
@@ -227,7 +297,7 @@ class MainApp(ctk.CTk):
             card.grid(row=i // 2, column=i % 2, padx=15, pady=15, sticky="nsew")
         cards_frame.grid_columnconfigure(0, weight=1)
         cards_frame.grid_columnconfigure(1, weight=1)
-        progress_frame = ctk.CTkFrame(scroll_frame, fg_color="#1E293B", corner_radius=15)
+        progress_frame = ctk.CTkFrame(parent, fg_color="#1E293B", corner_radius=15)
         progress_frame.pack(fill="x", pady=30, padx=10)
         progress_label = ctk.CTkLabel(
             progress_frame,
@@ -246,33 +316,6 @@ class MainApp(ctk.CTk):
             text_color="#64748B"
         )
         percentage_label.pack(pady=(5, 30))
-        actions_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
-        actions_frame.pack(fill="x", pady=20)
-        ctk.CTkLabel(
-            actions_frame,
-            text="Швидкі дії",
-            font=ctk.CTkFont(size=22, weight="bold")
-        ).pack(anchor="w", pady=(0, 15))
-        actions_buttons = ctk.CTkFrame(actions_frame, fg_color="transparent")
-        actions_buttons.pack(fill="x")
-        ctk.CTkButton(
-            actions_buttons,
-            text="🃏 Почати навчання",
-            command=self.show_flashcards,
-            height=60,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            fg_color="#8B5CF6",
-            hover_color="#7C3AED"
-        ).pack(side="left", padx=10, fill="x", expand=True)
-        ctk.CTkButton(
-            actions_buttons,
-            text="➕ Додати слова",
-            command=self.show_add_word,
-            height=60,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            fg_color="#F59E0B",
-            hover_color="#D97706"
-        ).pack(side="left", padx=10, fill="x", expand=True)
 
     def create_stat_card(self, parent, title, value, color, icon):
         card = ctk.CTkFrame(parent, fg_color=color, corner_radius=15, height=150)
@@ -306,8 +349,7 @@ class MainApp(ctk.CTk):
         self.clear_main_container()
         self.highlight_menu_button(3)
         from windows.statistics_window import StatisticsWindow
-        stats_window = StatisticsWindow(self.main_container, self.db)
-        stats_window.exporter = self.exporter
+        StatisticsWindow(self.main_container, self.db)
 
     def show_words(self):
         self.clear_main_container()
@@ -332,22 +374,26 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(search_frame, text="🔍 Пошук:").pack(side="left", padx=(0, 10))
         self.search_entry = ctk.CTkEntry(search_frame, width=250, height=35)
         self.search_entry.pack(side="left")
-        self.search_entry.bind("<KeyRelease>", lambda e: self.load_words())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.on_search_changed())
 
         cat_frame = ctk.CTkFrame(filter_row1, fg_color="transparent")
         cat_frame.pack(side="left", padx=15)
         ctk.CTkLabel(cat_frame, text="📁 Категорія:").pack(side="left", padx=(0, 10))
-        categories = ["Всі"] + [cat[1] for cat in self.db.get_categories()]
         self.category_var = ctk.StringVar(value="Всі")
         self.category_menu = ctk.CTkOptionMenu(
             cat_frame,
-            values=categories,
+            values=["Всі"],
             variable=self.category_var,
             width=180,
             height=35,
             command=lambda x: self.load_words()
         )
         self.category_menu.pack(side="left")
+        self.query_executor.submit(
+            self.db.get_categories,
+            on_done=lambda cats: self.category_menu.configure(values=["Всі"] + [cat[1] for cat in cats]),
+            owner=self.category_menu
+        )
 
         sort_frame = ctk.CTkFrame(filter_row1, fg_color="transparent")
         sort_frame.pack(side="left", padx=15)
@@ -444,25 +490,93 @@ class MainApp(ctk.CTk):
             text="📄 Word",
             width=80,
             height=35,
-            command=self.exporter.export_to_word,
+            command=lambda: self.exporter.export_to_word(),
             fg_color="#3B82F6",
             hover_color="#2563EB"
         ).pack(side="left", padx=5)
 
-        ctk.CTkButton(
+        self.excel_button = ctk.CTkButton(
             export_frame,
             text="📊 Excel",
             width=80,
             height=35,
-            command=self.exporter.export_to_excel,
+            command=self.export_to_excel,
             fg_color="#10B981",
             hover_color="#059669"
-        ).pack(side="left", padx=5)
+        )
+        self.excel_button.pack(side="left", padx=5)
 
-        self.words_scroll_frame = ctk.CTkScrollableFrame(container, fg_color="#1E293B")
-        self.words_scroll_frame.pack(fill="both", expand=True, pady=10)
+        self.data_button = ctk.CTkButton(
+            export_frame,
+            text="📦 Дані",
+            width=80,
+            height=35,
+            command=self.export_data,
+            fg_color="#8B5CF6",
+            hover_color="#7C3AED"
+        )
+        self.data_button.pack(side="left", padx=5)
+
+        self.import_button = ctk.CTkButton(
+            export_frame,
+            text="📥 Імпорт",
+            width=80,
+            height=35,
+            command=self.import_data,
+            fg_color="#64748B",
+            hover_color="#475569"
+        )
+        self.import_button.pack(side="left", padx=5)
+
+        self.words_list = VirtualList(container, {
+            "header": (55, TableHeaderRow),
+            "word": (62, lambda parent: WordRow(parent, self)),
+            "search": (86, lambda parent: SearchResultRow(parent, self)),
+            "search_title": (50, lambda parent: LabelRow(
+                parent, 50, ctk.CTkFont(size=18, weight="bold"), "#3B82F6")),
+            "group": (60, lambda parent: LabelRow(
+                parent, 60, ctk.CTkFont(size=16, weight="bold"), "#3B82F6", pady=(20, 5))),
+            "message": (130, lambda parent: LabelRow(
+                parent, 130, ctk.CTkFont(size=16), "#94A3B8", anchor="center", pady=50)),
+        }, on_end_reached=self.load_more_words, fg_color="#1E293B")
+        self.words_list.pack(fill="both", expand=True, pady=10)
+
+        if self.word_search:
+            self.word_search.cancel()
+        self.word_search = IncrementalSearch(self, self.db.search_words_smart, self.on_search_results,
+                                             owner=self.words_list, scope="words")
         self.load_words()
 
+    def export_to_excel(self):
+        self.exporter.export_to_excel(
+            parent=self,
+            on_progress=lambda done, total: self.show_button_progress(self.excel_button, "📊 Excel", done, total)
+        )
+
+    def export_data(self):
+        self.exporter.export_data(
+            self,
+            on_progress=lambda done, total: self.show_button_progress(self.data_button, "📦 Дані", done, total)
+        )
+
+    def import_data(self):
+        self.exporter.import_data(
+            self,
+            on_progress=lambda done, total: self.show_button_progress(self.import_button, "📥 Імпорт", done, total),
+            on_done=lambda: self.load_words() if self.words_list.winfo_exists() else None
+        )
+
+    def show_button_progress(self, button, text, done, total):
+        if not button.winfo_exists():
+            return
+        if total and done < total:
+            button.configure(text=f"⏳ {done * 100 // total}%")
+        elif not total and done:
+            # Кількість рядків у файлі для імпорту наперед невідома
+            button.configure(text=f"⏳ {done}")
+        else:
+            button.configure(text=text)
+
     def set_date_filter(self, days):
         if days is None:
             self.date_filter_start = None
@@ -511,230 +625,130 @@ class MainApp(ctk.CTk):
         self.end_date_picker.hide_calendar()
         self.load_words()
 
-    def load_words(self):
-        for widget in self.words_scroll_frame.winfo_children():
-            widget.destroy()
+    def on_search_changed(self):
+        search = self.search_entry.get()
+        if search == self.word_search_term:
+            return
+        self.word_search_term = search
+
+        if search.strip():
+            self.word_search.submit(search)
+        else:
+            self.word_search.cancel()
+            self.load_words()
+
+    def on_search_results(self, search_term, words):
+        if self.words_list.winfo_exists() and self.search_entry.get() == search_term:
+            self.display_smart_search_results(words, search_term)
 
+    def load_words(self, keep_position=False):
         search = self.search_entry.get() if hasattr(self, 'search_entry') else ""
+        self.word_search_term = search
+        self.query_executor.cancel(scope="words")
 
         if search and search.strip():
-            words = self.db.search_words_smart(search)
-            self.display_smart_search_results(words, search)
-        else:
-            category = self.category_var.get() if hasattr(self, 'category_var') else "Всі"
-            sort = self.sort_var.get() if hasattr(self, 'sort_var') else "word"
-            group = self.group_var.get() if hasattr(self, 'group_var') else "none"
+            # Дані могли змінитися, тому шукаємо заново, а не звужуємо старий результат
+            self.word_search.invalidate()
+            self.word_search.submit(search, delay_ms=0)
+            return
 
-            words = self.db.get_all_words(
-                search, category, sort,
+        category = self.category_var.get() if hasattr(self, 'category_var') else "Всі"
+        sort = self.sort_var.get() if hasattr(self, 'sort_var') else "word"
+        group = self.group_var.get() if hasattr(self, 'group_var') else "none"
+        first = self.words_list.first if keep_position else 0
+
+        if not keep_position:
+            self.words_list.set_items([("message", "⏳ Завантаження...")])
+
+        if group == "none":
+            # Без групування слова підвантажуються сторінками під час прокрутки
+            self.words_page_filters = dict(
+                search_term=search, category=category, sort_by=sort,
                 start_date=self.date_filter_start,
                 end_date=self.date_filter_end
             )
+            self.words_next_cursor = None
+            self.query_executor.submit(
+                self.db.get_words_page,
+                page_size=max(self.WORDS_PAGE_SIZE, first + self.WORDS_PAGE_SIZE // 2),
+                on_done=lambda page: self.show_words_page(page, first),
+                owner=self.words_list,
+                scope="words",
+                **self.words_page_filters
+            )
+        else:
+            self.words_next_cursor = None
+            self.query_executor.submit(
+                self.db.get_all_words,
+                search, category, sort,
+                start_date=self.date_filter_start,
+                end_date=self.date_filter_end,
+                on_done=lambda words: self.show_grouped_words(words, group, first),
+                owner=self.words_list,
+                scope="words"
+            )
 
-            print(f"Loaded {len(words)} words from database")
-
-            if not words:
-                no_data_label = ctk.CTkLabel(
-                    self.words_scroll_frame,
-                    text="Слова не знайдені",
-                    font=ctk.CTkFont(size=16),
-                    text_color="#94A3B8"
-                )
-                no_data_label.pack(pady=50)
-                return
-
-            if group == "none":
-                self.display_words_table(words)
-            else:
-                self.display_grouped_words(words, group)
-
-    def display_smart_search_results(self, words, search_term):
-
-        header_label = ctk.CTkLabel(
-            self.words_scroll_frame,
-            text=f"🔍 Результати пошуку за '{search_term}' ({len(words)} слів)",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color="#3B82F6"
-        )
-        header_label.pack(anchor="w", padx=10, pady=10)
+    def show_words_page(self, page, first=0):
+        words = page['rows']
+        print(f"Loaded {len(words)} of {page['total']} words from database")
+        self.words_next_cursor = page['next_cursor']
 
         if not words:
-            no_results = ctk.CTkLabel(
-                self.words_scroll_frame,
-                text="Слів не знайдено",
-                font=ctk.CTkFont(size=14),
-                text_color="#94A3B8"
-            )
-            no_results.pack(pady=30)
+            self.words_list.set_items([("message", "Слова не знайдені")])
             return
 
-        for word in words:
-            self.create_search_result_row(word, search_term)
-
-    def create_search_result_row(self, word, search_term):
-        try:
-            row = ctk.CTkFrame(self.words_scroll_frame, fg_color="#1E293B", height=80)
-            row.pack(fill="x", pady=3, padx=5)
-            row.pack_propagate(False)
-
-            word_id = word[0]
-            word_text = word[1]
-            translation = word[2]
-            knowledge_level = word[4] if len(word) > 4 else 0
-            category = word[5] if len(word) > 5 else "-"
-            times_correct = word[7] if len(word) > 7 else 0
-            times_wrong = word[8] if len(word) > 8 else 0
-            is_favorite = word[9] if len(word) > 9 else False
-            difficulty = word[10] if len(word) > 10 else 1
-            highlight_type = word[14] if len(word) > 14 else 'NO_HIGHLIGHT'
-
-            if knowledge_level >= 5:
-                status = "Вивчено"
-            elif knowledge_level > 0:
-                status = "Вивчається"
-            else:
-                status = "Нове"
-
-            highlight_colors = {
-                'HIGHLIGHT_STRONG': ('#10B981', '🎯'),
-                'HIGHLIGHT_MEDIUM': ('#3B82F6', '✓'),
-                'HIGHLIGHT_LIGHT': ('#F59E0B', '◐'),
-                'NO_HIGHLIGHT': ('#475569', '○')
-            }
-
-            color, icon = highlight_colors.get(highlight_type, ('#475569', '○'))
-
-            highlight_btn = ctk.CTkButton(
-                row,
-                text=icon,
-                width=40,
-                height=40,
-                fg_color=color,
-                hover_color=color,
-                text_color="white",
-                state="disabled"
-            )
-            highlight_btn.pack(side="left", padx=5, pady=10)
+        self.display_words_table(words)
+        if first:
+            self.words_list.scroll_to(first)
 
-            info_frame = ctk.CTkFrame(row, fg_color="transparent")
-            info_frame.pack(side="left", fill="both", expand=True, padx=10)
-
-            word_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            word_frame.pack(fill="x", pady=5)
-
-            ctk.CTkLabel(
-                word_frame,
-                text=word_text,
-                font=ctk.CTkFont(size=16, weight="bold"),
-                anchor="w"
-            ).pack(side="left", padx=5)
+    def show_grouped_words(self, words, group, first=0):
+        print(f"Loaded {len(words)} words from database")
+        if not words:
+            self.words_list.set_items([("message", "Слова не знайдені")])
+            return
 
-            ctk.CTkLabel(
-                word_frame,
-                text=f"→ {translation}",
-                font=ctk.CTkFont(size=14),
-                text_color="#94A3B8",
-                anchor="w"
-            ).pack(side="left", padx=10)
-
-            stats_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            stats_frame.pack(fill="x", pady=2)
-
-            difficulty_text = ["Легке", "Середнє", "Складне", "Дуже складне", "Експертне"][min(difficulty - 1, 4)]
-
-            stats_text = f"{category} | {status} | {difficulty_text} | ✓{times_correct} ✗{times_wrong}"
-            ctk.CTkLabel(
-                stats_frame,
-                text=stats_text,
-                font=ctk.CTkFont(size=12),
-                text_color="#64748B",
-                anchor="w"
-            ).pack(side="left", padx=5)
+        self.display_grouped_words(words, group)
+        if first:
+            self.words_list.scroll_to(first)
 
-            progress_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            progress_frame.pack(fill="x", pady=2)
-
-            progress = min(knowledge_level / 10, 1.0)
-            progress_bar = ctk.CTkProgressBar(progress_frame, width=200, height=6)
-            progress_bar.set(progress)
-            progress_bar.pack(side="left", padx=5)
-
-            progress_text = f"{knowledge_level}/10"
-            ctk.CTkLabel(
-                progress_frame,
-                text=progress_text,
-                font=ctk.CTkFont(size=11),
-                text_color="#64748B",
-                width=40
-            ).pack(side="left", padx=5)
+    def load_more_words(self):
+        if self.words_next_cursor is None:
+            return
 
-            actions_frame = ctk.CTkFrame(row, fg_color="transparent", width=120)
-            actions_frame.pack(side="right", padx=10)
-            actions_frame.pack_propagate(False)
+        cursor, self.words_next_cursor = self.words_next_cursor, None
+        self.query_executor.submit(
+            self.db.get_words_page,
+            page_size=self.WORDS_PAGE_SIZE,
+            after=cursor,
+            on_done=lambda page: self.append_words_page(page),
+            owner=self.words_list,
+            scope="words",
+            **self.words_page_filters
+        )
 
-            ctk.CTkButton(
-                actions_frame,
-                text="✏️",
-                width=35,
-                height=35,
-                command=lambda wid=word_id: self.edit_word(wid),
-                fg_color="#3B82F6",
-                hover_color="#2563EB"
-            ).pack(side="left", padx=2)
+    def append_words_page(self, page):
+        self.words_next_cursor = page['next_cursor']
+        self.words_list.append_items([("word", word) for word in page['rows']])
 
-            ctk.CTkButton(
-                actions_frame,
-                text="⭐" if is_favorite else "☆",
-                width=35,
-                height=35,
-                command=lambda wid=word_id: self.toggle_favorite(wid),
-                fg_color="#FFB800" if is_favorite else "#64748B",
-                hover_color="#FFC814"
-            ).pack(side="left", padx=2)
+    def display_smart_search_results(self, words, search_term):
+        self.words_next_cursor = None
+        items = [("search_title", f"🔍 Результати пошуку за '{search_term}' ({len(words)} слів)")]
 
-            ctk.CTkButton(
-                actions_frame,
-                text="🗑️",
-                width=35,
-                height=35,
-                command=lambda wid=word_id: self.delete_word(wid),
-                fg_color="#EF4444",
-                hover_color="#DC2626"
-            ).pack(side="left", padx=2)
+        if not words:
+            items.append(("message", "Слів не знайдено"))
+        else:
+            items.extend(("search", word) for word in words)
 
-        except Exception as e:
-            print(f"Помилка при створенні рядка пошуку: {e}")
-            print(f"Дані слова: {word}")
+        self.words_list.set_items(items)
 
     def display_words_table(self, words):
         if not words:
-            no_data_label = ctk.CTkLabel(
-                self.words_scroll_frame,
-                text="Немає слів для відображення",
-                font=ctk.CTkFont(size=16),
-                text_color="#94A3B8"
-            )
-            no_data_label.pack(pady=50)
+            self.words_list.set_items([("message", "Немає слів для відображення")])
             return
 
-        headers_frame = ctk.CTkFrame(self.words_scroll_frame, fg_color="#334155", height=50)
-        headers_frame.pack(fill="x", pady=(0, 5))
-        headers_frame.pack_propagate(False)
-
-        headers = ["⭐", "Слово", "Переклад", "Рівень", "Категорія", "Статистика", "Дії"]
-        widths = [50, 200, 200, 120, 150, 180, 120]
-
-        for header, width in zip(headers, widths):
-            label = ctk.CTkLabel(
-                headers_frame,
-                text=header,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                width=width
-            )
-            label.pack(side="left", padx=10, pady=10)
-
-        for word in words:
-            self.create_word_row(word)
+        items = [("header", None)]
+        items.extend(("word", word) for word in words)
+        self.words_list.set_items(items)
 
     def display_grouped_words(self, words, group_by):
         from itertools import groupby
@@ -742,7 +756,7 @@ class MainApp(ctk.CTk):
         group_labels = {
             "category": lambda w: w[5] or "Без категорії",
             "knowledge_level": lambda w: f"Рівень {w[4]}",
-            "difficulty": lambda w: ["Легке", "Середнє", "Складне", "Дуже складне", "Експертне"][min(w[10] - 1, 4)]
+            "difficulty": lambda w: DIFFICULTY_NAMES[min(w[10] - 1, 4)]
         }
 
         get_group = group_labels.get(group_by)
@@ -752,143 +766,27 @@ class MainApp(ctk.CTk):
 
         sorted_words = sorted(words, key=get_group)
 
+        items = []
         for group_name, group_items in groupby(sorted_words, key=get_group):
-            group_frame = ctk.CTkFrame(self.words_scroll_frame, fg_color="transparent")
-            group_frame.pack(fill="x", pady=(20, 5), padx=10)
-
-            header_label = ctk.CTkLabel(
-                group_frame,
-                text=f"▼ {group_name}",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color="#3B82F6"
-            )
-            header_label.pack(anchor="w", pady=(0, 10))
-
-            inner_frame = ctk.CTkFrame(self.words_scroll_frame, fg_color="#1E293B")
-            inner_frame.pack(fill="x", pady=(0, 10))
-
-            for word in group_items:
-                self.create_word_row(word, parent=inner_frame)
-
-    def create_word_row(self, word):
-        row = ctk.CTkFrame(self.words_scroll_frame, fg_color="#1E293B", height=60)
-        row.pack(fill="x", pady=2)
-        row.pack_propagate(False)
-
-        fav_btn = ctk.CTkButton(
-            row,
-            text="⭐" if word[9] else "☆",
-            command=lambda wid=word[0]: self.toggle_favorite(wid),
-            width=50,
-            height=35,
-            fg_color="transparent",
-            hover_color="#334155"
-        )
-        fav_btn.pack(side="left", padx=10)
-
-        word_label = ctk.CTkLabel(
-            row,
-            text=word[1],
-            width=200,
-            anchor="w",
-            font=ctk.CTkFont(size=14)
-        )
-        word_label.pack(side="left", padx=10)
-
-        translation_label = ctk.CTkLabel(
-            row,
-            text=word[2],
-            width=200,
-            anchor="w",
-            text_color="#94A3B8",
-            font=ctk.CTkFont(size=14)
-        )
-        translation_label.pack(side="left", padx=10)
-
-        level_frame = ctk.CTkFrame(row, width=120, fg_color="transparent")
-        level_frame.pack(side="left", padx=10)
-        level_frame.pack_propagate(False)
-
-        knowledge_level = word[4] if word[4] is not None else 0
-        progress = min(knowledge_level / 10, 1.0)
-
-        progress_bar = ctk.CTkProgressBar(level_frame, width=100, height=8)
-        progress_bar.set(progress)
-        progress_bar.pack(pady=5)
-
-        level_text = f"{knowledge_level}/10"
-        level_label = ctk.CTkLabel(
-            level_frame,
-            text=level_text,
-            font=ctk.CTkFont(size=12),
-            text_color="#64748B"
-        )
-        level_label.pack()
-
-        category_text = word[5] if word[5] else "-"
-        category_label = ctk.CTkLabel(
-            row,
-            text=category_text,
-            width=150,
-            anchor="w",
-            text_color="#64748B",
-            font=ctk.CTkFont(size=14)
-        )
-        category_label.pack(side="left", padx=10)
+            items.append(("group", f"▼ {group_name}"))
+            items.extend(("word", word) for word in group_items)
 
-        correct_attempts = word[7] if word[7] is not None else 0
-        wrong_attempts = word[8] if word[8] is not None else 0
-        total_attempts = correct_attempts + wrong_attempts
-        success_rate = (correct_attempts / total_attempts * 100) if total_attempts > 0 else 0
-
-        stats_text = f"✓{correct_attempts} ✗{wrong_attempts} ({success_rate:.0f}%)"
-        stats_label = ctk.CTkLabel(
-            row,
-            text=stats_text,
-            width=180,
-            anchor="w",
-            text_color="#64748B",
-            font=ctk.CTkFont(size=14)
-        )
-        stats_label.pack(side="left", padx=10)
-
-        actions_frame = ctk.CTkFrame(row, fg_color="transparent", width=120)
-        actions_frame.pack(side="right", padx=10)
-        actions_frame.pack_propagate(False)
-
-        edit_btn = ctk.CTkButton(
-            actions_frame,
-            text="✏️",
-            width=35,
-            height=35,
-            command=lambda wid=word[0]: self.edit_word(wid),
-            fg_color="#3B82F6",
-            hover_color="#2563EB"
-        )
-        edit_btn.pack(side="left", padx=2)
-
-        delete_btn = ctk.CTkButton(
-            actions_frame,
-            text="🗑️",
-            width=35,
-            height=35,
-            command=lambda wid=word[0]: self.delete_word(wid),
-            fg_color="#EF4444",
-            hover_color="#DC2626"
-        )
-        delete_btn.pack(side="left", padx=2)
+        self.words_list.set_items(items)
 
     def edit_word(self, word_id):
         EditWordWindow(self, self.db, word_id, self.load_words)
 
     def toggle_favorite(self, word_id):
         self.db.toggle_favorite(word_id)
-        self.load_words()
+        self.reload_words_keep_position()
 
     def delete_word(self, word_id):
         if messagebox.askyesno("Підтвердження", "Видалити це слово?"):
             self.db.delete_word(word_id)
-            self.load_words()
+            self.reload_words_keep_position()
+
+    def reload_words_keep_position(self):
+        self.load_words(keep_position=True)
 
     def show_add_word(self):
         self.clear_main_container()
@@ -918,16 +816,24 @@ class MainApp(ctk.CTk):
             width=200,
             anchor="w"
         ).pack(side="left")
-        categories = self.db.get_categories()
-        cat_names = [cat[1] for cat in categories]
-        cat_var = ctk.StringVar(value=cat_names[0] if cat_names else "")
-        ctk.CTkOptionMenu(
+        categories = []
+        cat_var = ctk.StringVar(value="")
+        cat_menu = ctk.CTkOptionMenu(
             cat_frame,
-            values=cat_names,
+            values=[""],
             variable=cat_var,
             width=400,
             height=40
-        ).pack(side="left", padx=20)
+        )
+        cat_menu.pack(side="left", padx=20)
+
+        def show_categories(result):
+            categories[:] = result
+            cat_names = [cat[1] for cat in categories]
+            cat_menu.configure(values=cat_names or [""])
+            cat_var.set(cat_names[0] if cat_names else "")
+
+        self.query_executor.submit(self.db.get_categories, on_done=show_categories, owner=cat_menu)
         diff_frame = ctk.CTkFrame(form, fg_color="transparent")
         diff_frame.pack(fill="x", padx=40, pady=15)
         ctk.CTkLabel(
@@ -1125,5 +1031,6 @@ class MainApp(ctk.CTk):
         self.popup_enabled = False
         if self.popup_thread and self.popup_thread.is_alive():
             self.popup_thread.join(timeout=1.0)
+        self.query_executor.shutdown()
         self.db.close()
         self.destroy()
\ No newline at end of file
@@ -0,0 +1,130 @@
+import customtkinter as ctk
+
+
+class UserRow(ctk.CTkFrame):
+    def __init__(self, parent, panel):
+        super().__init__(parent, fg_color="#1E293B", height=70)
+        self.pack_propagate(False)
+        self.panel = panel
+        self.user = None
+
+        self.id_label = ctk.CTkLabel(self, text="", width=50)
+        self.id_label.pack(side="left", padx=10)
+
+        self.username_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=150,
+            anchor="w",
+            font=ctk.CTkFont(size=13, weight="bold")
+        )
+        self.username_label.pack(side="left", padx=10)
+
+        self.email_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=200,
+            anchor="w",
+            text_color="#94A3B8"
+        )
+        self.email_label.pack(side="left", padx=10)
+
+        self.role_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=120,
+            fg_color="#3B82F6",
+            corner_radius=5
+        )
+        self.role_label.pack(side="left", padx=10, pady=15)
+
+        self.status_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=100,
+            font=ctk.CTkFont(weight="bold")
+        )
+        self.status_label.pack(side="left", padx=10)
+
+        self.last_login_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=150,
+            text_color="#64748B"
+        )
+        self.last_login_label.pack(side="left", padx=10)
+
+        actions_frame = ctk.CTkFrame(self, fg_color="transparent", width=180)
+        actions_frame.pack(side="right", padx=10)
+
+        self.edit_btn = ctk.CTkButton(
+            actions_frame,
+            text="✏️",
+            width=35,
+            height=35,
+            command=lambda: self.panel.run_in_session(lambda: self.panel.edit_user(self.user)),
+            fg_color="#3B82F6"
+        )
+        self.lock_btn = ctk.CTkButton(
+            actions_frame,
+            text="🔒",
+            width=35,
+            height=35,
+            command=lambda: self.panel.run_in_session(self.toggle_lock)
+        )
+        self.delete_btn = ctk.CTkButton(
+            actions_frame,
+            text="🗑️",
+            width=35,
+            height=35,
+            command=lambda: self.panel.run_in_session(lambda: self.panel.delete_user(self.user)),
+            fg_color="#EF4444"
+        )
+
+    def show(self, user):
+        self.user = user
+        auth = self.panel.auth
+
+        self.id_label.configure(text=str(user['id']))
+        self.username_label.configure(text=user['username'])
+        self.email_label.configure(text=user['email'] or "-")
+        self.role_label.configure(text=user['role'])
+
+        if user['is_locked']:
+            self.status_label.configure(text="🔒 Заблок.", text_color="#EF4444")
+        elif not user['is_active']:
+            self.status_label.configure(text="⏸️ Неактив.", text_color="#F59E0B")
+        else:
+            self.status_label.configure(text="✅ Активний", text_color="#10B981")
+
+        last_login = user['last_login']
+        if last_login:
+            if isinstance(last_login, str):
+                last_login_text = last_login[:16]
+            else:
+                last_login_text = last_login.strftime("%d.%m.%Y %H:%M")
+        else:
+            last_login_text = "Ніколи"
+        self.last_login_label.configure(text=last_login_text)
+
+        if user['is_locked']:
+            self.lock_btn.configure(text="🔓", fg_color="#10B981")
+        else:
+            self.lock_btn.configure(text="🔒", fg_color="#F59E0B")
+
+        visible = [
+            (self.edit_btn, auth.has_permission('users.edit')),
+            (self.lock_btn, auth.has_permission('users.block')),
+            (self.delete_btn, auth.has_permission('users.delete') and user['id'] != auth.current_user['user_id']),
+        ]
+        for button, _ in visible:
+            button.pack_forget()
+        for button, allowed in visible:
+            if allowed:
+                button.pack(side="left", padx=2)
+
+    def toggle_lock(self):
+        if self.user['is_locked']:
+            self.panel.unblock_user(self.user)
+        else:
+            self.panel.block_user(self.user)
@@ -0,0 +1,142 @@
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """Прокручуваний список, що створює віджети лише для видимих рядків.
+
+    row_types: {вид: (висота, фабрика)}. Фабрика отримує батьківський віджет і повертає
+    рядок з методом show(data); рядки одного виду перевикористовуються під час прокрутки.
+    Елементи списку - пари (вид, data). on_end_reached викликається, коли прокрутка
+    дійшла до кінця, щоб можна було дозавантажити наступну сторінку.
+    """
+
+    def __init__(self, parent, row_types, on_end_reached=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.row_types = row_types
+        self.on_end_reached = on_end_reached
+        self.items = []
+        self.first = 0
+        self._end_pending = False
+
+        self._pools = {kind: [] for kind in row_types}
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 3), pady=3)
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self.body.bind("<Configure>", lambda e: self.refresh())
+
+        # Колесо миші слухаємо через власний bindtag на віджетах списку, а не bind_all:
+        # прив'язку до тегу можна зняти разом зі списком, і знищений список не лишається в пам'яті
+        self._wheel_tag = f"{self}.wheel"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._wheel_tag, sequence, self._on_mousewheel)
+        self.bind_class(self._wheel_tag, "<Destroy>", self._on_destroy)
+        self._add_wheel_tag(self)
+
+    def set_items(self, items):
+        self.items = items
+        self.first = 0
+        self._end_pending = False
+        self.refresh()
+
+    def append_items(self, items):
+        self._end_pending = False
+        if items:
+            self.items.extend(items)
+            self.refresh()
+
+    def scroll_to(self, index):
+        self.first = max(0, min(index, self._last_first(), len(self.items) - 1))
+        self.refresh()
+
+    def _last_first(self):
+        # Найменший індекс, з якого кінець списку ще заповнює видиму область
+        viewport = self._viewport_height()
+        index = len(self.items)
+        y = 0
+        while index > 0:
+            height = self.row_types[self.items[index - 1][0]][0]
+            if y + height > viewport:
+                break
+            y += height
+            index -= 1
+        return index
+
+    def _viewport_height(self):
+        height = self.body.winfo_height() / self._get_widget_scaling()
+        return height if height > 1 else 600
+
+    def refresh(self):
+        if not self.winfo_exists():
+            return
+
+        viewport = self._viewport_height()
+        used = dict.fromkeys(self._pools, 0)
+        y = 0
+        index = self.first
+
+        while index < len(self.items) and y < viewport:
+            kind, data = self.items[index]
+            height, factory = self.row_types[kind]
+
+            pool = self._pools[kind]
+            if used[kind] == len(pool):
+                pool.append(factory(self.body))
+                self._add_wheel_tag(pool[-1])
+            row = pool[used[kind]]
+            used[kind] += 1
+
+            row.show(data)
+            row.place(x=0, y=y, relwidth=1.0)
+            y += height
+            index += 1
+
+        for kind, pool in self._pools.items():
+            for row in pool[used[kind]:]:
+                row.place_forget()
+
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.first / total, index / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+        if self.on_end_reached and total and index >= total and not self._end_pending:
+            self._end_pending = True
+            self.after_idle(self.on_end_reached)
+
+    def _on_scrollbar(self, *args):
+        total = len(self.items)
+        if not total:
+            return
+
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * total))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                row_height = min(height for height, _ in self.row_types.values())
+                step *= max(1, int(self._viewport_height() // row_height))
+            self.scroll_to(self.first + step)
+
+    def _add_wheel_tag(self, widget):
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _on_destroy(self, event):
+        if str(event.widget) != str(self):
+            return
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>", "<Destroy>"):
+            self.unbind_class(self._wheel_tag, sequence)
+
+    def _on_mousewheel(self, event):
+        if not self.winfo_exists():
+            return
+
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.first - 3)
+        else:
+            self.scroll_to(self.first + 3)
@@ -0,0 +1,298 @@
+import customtkinter as ctk
+
+DIFFICULTY_NAMES = ["Легке", "Середнє", "Складне", "Дуже складне", "Експертне"]
+
+HIGHLIGHT_COLORS = {
+    'HIGHLIGHT_STRONG': ('#10B981', '🎯'),
+    'HIGHLIGHT_MEDIUM': ('#3B82F6', '✓'),
+    'HIGHLIGHT_LIGHT': ('#F59E0B', '◐'),
+    'NO_HIGHLIGHT': ('#475569', '○')
+}
+
+
+class LabelRow(ctk.CTkFrame):
+    def __init__(self, parent, height, font, text_color, anchor="w", pady=10):
+        super().__init__(parent, fg_color="transparent", height=height)
+        self.pack_propagate(False)
+
+        self.label = ctk.CTkLabel(self, text="", font=font, text_color=text_color)
+        self.label.pack(anchor=anchor, padx=10, pady=pady)
+
+    def show(self, text):
+        self.label.configure(text=text)
+
+
+class TableHeaderRow(ctk.CTkFrame):
+    def __init__(self, parent):
+        super().__init__(parent, fg_color="#334155", height=50)
+        self.pack_propagate(False)
+
+        headers = ["⭐", "Слово", "Переклад", "Рівень", "Категорія", "Статистика", "Дії"]
+        widths = [50, 200, 200, 120, 150, 180, 120]
+
+        for header, width in zip(headers, widths):
+            label = ctk.CTkLabel(
+                self,
+                text=header,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                width=width
+            )
+            label.pack(side="left", padx=10, pady=10)
+
+    def show(self, data):
+        pass
+
+
+class WordRow(ctk.CTkFrame):
+    def __init__(self, parent, app):
+        super().__init__(parent, fg_color="#1E293B", height=60)
+        self.pack_propagate(False)
+        self.app = app
+        self.word_id = None
+
+        self.fav_btn = ctk.CTkButton(
+            self,
+            text="☆",
+            command=lambda: self.app.toggle_favorite(self.word_id),
+            width=50,
+            height=35,
+            fg_color="transparent",
+            hover_color="#334155"
+        )
+        self.fav_btn.pack(side="left", padx=10)
+
+        self.word_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=200,
+            anchor="w",
+            font=ctk.CTkFont(size=14)
+        )
+        self.word_label.pack(side="left", padx=10)
+
+        self.translation_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=200,
+            anchor="w",
+            text_color="#94A3B8",
+            font=ctk.CTkFont(size=14)
+        )
+        self.translation_label.pack(side="left", padx=10)
+
+        level_frame = ctk.CTkFrame(self, width=120, fg_color="transparent")
+        level_frame.pack(side="left", padx=10)
+        level_frame.pack_propagate(False)
+
+        self.progress_bar = ctk.CTkProgressBar(level_frame, width=100, height=8)
+        self.progress_bar.pack(pady=5)
+
+        self.level_label = ctk.CTkLabel(
+            level_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#64748B"
+        )
+        self.level_label.pack()
+
+        self.category_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=150,
+            anchor="w",
+            text_color="#64748B",
+            font=ctk.CTkFont(size=14)
+        )
+        self.category_label.pack(side="left", padx=10)
+
+        self.stats_label = ctk.CTkLabel(
+            self,
+            text="",
+            width=180,
+            anchor="w",
+            text_color="#64748B",
+            font=ctk.CTkFont(size=14)
+        )
+        self.stats_label.pack(side="left", padx=10)
+
+        actions_frame = ctk.CTkFrame(self, fg_color="transparent", width=120)
+        actions_frame.pack(side="right", padx=10)
+        actions_frame.pack_propagate(False)
+
+        ctk.CTkButton(
+            actions_frame,
+            text="✏️",
+            width=35,
+            height=35,
+            command=lambda: self.app.edit_word(self.word_id),
+            fg_color="#3B82F6",
+            hover_color="#2563EB"
+        ).pack(side="left", padx=2)
+
+        ctk.CTkButton(
+            actions_frame,
+            text="🗑️",
+            width=35,
+            height=35,
+            command=lambda: self.app.delete_word(self.word_id),
+            fg_color="#EF4444",
+            hover_color="#DC2626"
+        ).pack(side="left", padx=2)
+
+    def show(self, word):
+        self.word_id = word[0]
+
+        knowledge_level = word[4] if word[4] is not None else 0
+        correct_attempts = word[7] if word[7] is not None else 0
+        wrong_attempts = word[8] if word[8] is not None else 0
+        total_attempts = correct_attempts + wrong_attempts
+        success_rate = (correct_attempts / total_attempts * 100) if total_attempts > 0 else 0
+
+        self.fav_btn.configure(text="⭐" if word[9] else "☆")
+        self.word_label.configure(text=word[1])
+        self.translation_label.configure(text=word[2])
+        self.progress_bar.set(min(knowledge_level / 10, 1.0))
+        self.level_label.configure(text=f"{knowledge_level}/10")
+        self.category_label.configure(text=word[5] if word[5] else "-")
+        self.stats_label.configure(text=f"✓{correct_attempts} ✗{wrong_attempts} ({success_rate:.0f}%)")
+
+
+class SearchResultRow(ctk.CTkFrame):
+    def __init__(self, parent, app):
+        super().__init__(parent, fg_color="#1E293B", height=80)
+        self.pack_propagate(False)
+        self.app = app
+        self.word_id = None
+
+        self.highlight_btn = ctk.CTkButton(
+            self,
+            text="○",
+            width=40,
+            height=40,
+            text_color="white",
+            state="disabled"
+        )
+        self.highlight_btn.pack(side="left", padx=5, pady=10)
+
+        info_frame = ctk.CTkFrame(self, fg_color="transparent")
+        info_frame.pack(side="left", fill="both", expand=True, padx=10)
+
+        word_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        word_frame.pack(fill="x", pady=5)
+
+        self.word_label = ctk.CTkLabel(
+            word_frame,
+            text="",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            anchor="w"
+        )
+        self.word_label.pack(side="left", padx=5)
+
+        self.translation_label = ctk.CTkLabel(
+            word_frame,
+            text="",
+            font=ctk.CTkFont(size=14),
+            text_color="#94A3B8",
+            anchor="w"
+        )
+        self.translation_label.pack(side="left", padx=10)
+
+        stats_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        stats_frame.pack(fill="x", pady=2)
+
+        self.stats_label = ctk.CTkLabel(
+            stats_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#64748B",
+            anchor="w"
+        )
+        self.stats_label.pack(side="left", padx=5)
+
+        progress_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        progress_frame.pack(fill="x", pady=2)
+
+        self.progress_bar = ctk.CTkProgressBar(progress_frame, width=200, height=6)
+        self.progress_bar.pack(side="left", padx=5)
+
+        self.progress_label = ctk.CTkLabel(
+            progress_frame,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color="#64748B",
+            width=40
+        )
+        self.progress_label.pack(side="left", padx=5)
+
+        actions_frame = ctk.CTkFrame(self, fg_color="transparent", width=120)
+        actions_frame.pack(side="right", padx=10)
+        actions_frame.pack_propagate(False)
+
+        ctk.CTkButton(
+            actions_frame,
+            text="✏️",
+            width=35,
+            height=35,
+            command=lambda: self.app.edit_word(self.word_id),
+            fg_color="#3B82F6",
+            hover_color="#2563EB"
+        ).pack(side="left", padx=2)
+
+        self.fav_btn = ctk.CTkButton(
+            actions_frame,
+            text="☆",
+            width=35,
+            height=35,
+            command=lambda: self.app.toggle_favorite(self.word_id),
+            fg_color="#64748B",
+            hover_color="#FFC814"
+        )
+        self.fav_btn.pack(side="left", padx=2)
+
+        ctk.CTkButton(
+            actions_frame,
+            text="🗑️",
+            width=35,
+            height=35,
+            command=lambda: self.app.delete_word(self.word_id),
+            fg_color="#EF4444",
+            hover_color="#DC2626"
+        ).pack(side="left", padx=2)
+
+    def show(self, word):
+        try:
+            self.word_id = word[0]
+            knowledge_level = word[4] if len(word) > 4 else 0
+            category = word[5] if len(word) > 5 else "-"
+            times_correct = word[7] if len(word) > 7 else 0
+            times_wrong = word[8] if len(word) > 8 else 0
+            is_favorite = word[9] if len(word) > 9 else False
+            difficulty = word[10] if len(word) > 10 else 1
+            highlight_type = word[14] if len(word) > 14 else 'NO_HIGHLIGHT'
+
+            if knowledge_level >= 5:
+                status = "Вивчено"
+            elif knowledge_level > 0:
+                status = "Вивчається"
+            else:
+                status = "Нове"
+
+            color, icon = HIGHLIGHT_COLORS.get(highlight_type, ('#475569', '○'))
+            difficulty_text = DIFFICULTY_NAMES[min(difficulty - 1, 4)]
+
+            self.highlight_btn.configure(text=icon, fg_color=color, hover_color=color)
+            self.word_label.configure(text=word[1])
+            self.translation_label.configure(text=f"→ {word[2]}")
+            self.stats_label.configure(
+                text=f"{category} | {status} | {difficulty_text} | ✓{times_correct} ✗{times_wrong}"
+            )
+            self.progress_bar.set(min(knowledge_level / 10, 1.0))
+            self.progress_label.configure(text=f"{knowledge_level}/10")
+            self.fav_btn.configure(
+                text="⭐" if is_favorite else "☆",
+                fg_color="#FFB800" if is_favorite else "#64748B"
+            )
+
+        except Exception as e:
+            print(f"Помилка при створенні рядка пошуку: {e}")
+            print(f"Дані слова: {word}")
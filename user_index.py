@@ -0,0 +1,60 @@
+from word_index import fold, grams
+
+SEARCH_FIELDS = ('username', 'email', 'full_name')
+
+
+class UserIndex:
+    """Список користувачів адмін-панелі з n-грамним індексом над іменем, email та повним ім'ям.
+
+    Пошук не звертається ні до БД, ні до віджетів: кандидати - перетин списків триграм
+    запиту (запит з 1-2 символів перевіряє всіх), далі перевірка підрядком. Спершу йдуть
+    користувачі, в яких одне з полів починається із запиту, потім решта - у порядку завантаження.
+    """
+
+    def __init__(self, users=()):
+        self.users = []
+        self._texts = []
+        self._postings = {}
+        self.extend(users)
+
+    def __len__(self):
+        return len(self.users)
+
+    def extend(self, users):
+        for user in users:
+            position = len(self.users)
+            texts = tuple(fold(user[field]) for field in SEARCH_FIELDS)
+            self.users.append(user)
+            self._texts.append(texts)
+
+            for gram in grams(texts[0], 3) | grams(texts[1], 3) | grams(texts[2], 3):
+                self._postings.setdefault(gram, []).append(position)
+
+    def search(self, term):
+        needle = fold(term.strip())
+        if not needle:
+            return list(self.users)
+
+        if len(needle) < 3:
+            candidates = range(len(self.users))
+        else:
+            postings = [self._postings.get(gram) for gram in grams(needle, 3)]
+            if any(positions is None for positions in postings):
+                return []
+
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for positions in postings[1:]:
+                candidates.intersection_update(positions)
+                if not candidates:
+                    return []
+            candidates = sorted(candidates)
+
+        prefix, substring = [], []
+        for position in candidates:
+            texts = self._texts[position]
+            if any(text.startswith(needle) for text in texts):
+                prefix.append(self.users[position])
+            elif any(needle in text for text in texts):
+                substring.append(self.users[position])
+        return prefix + substring
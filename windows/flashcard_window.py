@@ -1,6 +1,8 @@
 import customtkinter as ctk
 from tkinter import messagebox
 
+from card_pipeline import CardPipeline
+
 
 class FlashcardWindow(ctk.CTkToplevel):
     def __init__(self, parent, db_manager, category_id=None):
@@ -9,7 +11,7 @@ class FlashcardWindow(ctk.CTkToplevel):
         self.category_id = category_id
         self.current_word_data = None
         self.is_flipped = False
-        self.session_id = None
+        self.pipeline = None
         self.words_studied = 0
         self.correct_count = 0
         self.title("Learn Easy - Картки")
@@ -37,7 +39,7 @@ class FlashcardWindow(ctk.CTkToplevel):
         # Після появи прибираємо topmost, щоб не заважало іншим вікнам
         self.after(100, lambda: self.attributes('-topmost', False))
 
-        self.session_id = self.db.start_session('flashcard')
+        self.pipeline = CardPipeline(self.db, 'flashcard', self.category_id).start()
         self.create_widgets()
         self.load_next_word()
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -150,9 +152,18 @@ class FlashcardWindow(ctk.CTkToplevel):
         self.bind("<Right>", lambda e: self.rate_card(True) if self.is_flipped else None)
 
     def load_next_word(self):
-        word_data = self.db.get_next_word_for_learning('flashcard', self.category_id)
+        if not self.winfo_exists():
+            return
+        word_data = self.pipeline.take()
         if not word_data:
-            self.show_session_summary()
+            if self.pipeline.exhausted:
+                self.current_word_data = None
+                self.show_session_summary()
+            else:
+                # Картки ще готуються у фоні - перевіримо трохи згодом
+                self.current_word_data = None
+                self.main_text.configure(text="Завантаження...", text_color="#64748B")
+                self.after(50, self.load_next_word)
             return
         self.current_word_data = word_data
         self.is_flipped = False
@@ -192,7 +203,7 @@ class FlashcardWindow(ctk.CTkToplevel):
     def rate_card(self, knows):
         if not self.is_flipped or not self.current_word_data:
             return
-        self.db.update_word_knowledge(self.current_word_data[0], knows, 'flashcard')
+        self.pipeline.rate(self.current_word_data[0], knows)
         self.words_studied += 1
         if knows:
             self.correct_count += 1
@@ -245,7 +256,7 @@ class FlashcardWindow(ctk.CTkToplevel):
         ctk.CTkButton(
             btn_frame,
             text="Закрити",
-            command=lambda: [summary_window.destroy(), self.destroy()],
+            command=lambda: [summary_window.destroy(), self.on_closing()],
             width=150,
             height=40,
             fg_color="#64748B",
@@ -255,11 +266,12 @@ class FlashcardWindow(ctk.CTkToplevel):
     def restart_session(self):
         self.words_studied = 0
         self.correct_count = 0
-        self.session_id = self.db.start_session('flashcard')
+        self.pipeline.close()
+        self.pipeline = CardPipeline(self.db, 'flashcard', self.category_id).start()
         self.stats_label.configure(text="Вивчено: 0 | Правильно: 0")
         self.load_next_word()
 
     def on_closing(self):
-        if self.session_id:
-            self.db.end_session(self.session_id)
+        # Оцінки дописуються, а сесія завершується у фоні - вікно закривається одразу
+        self.pipeline.close()
         self.destroy()
\ No newline at end of file
@@ -1,15 +1,17 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
+from query_executor import get_executor
+
 
 class StatisticsWindow:
     def __init__(self, parent_container, db_manager):
         self.parent_container = parent_container
         self.db = db_manager
+        self.executor = get_executor(parent_container)
 
         self.end_date = datetime.now()
         self.start_date = self.end_date - timedelta(days=30)
@@ -293,6 +295,7 @@ class StatisticsWindow:
             self.show_tab(self.current_tab)
 
     def clear_tabs_container(self):
+        self.executor.cancel(scope="statistics")
         for widget in self.tabs_container.winfo_children():
             widget.destroy()
 
@@ -319,8 +322,18 @@ class StatisticsWindow:
         scroll_frame = ctk.CTkScrollableFrame(self.tabs_container, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True)
 
-        stats = self.db.get_statistics()
+        self.executor.submit(
+            self.load_overview,
+            on_done=lambda data: self.show_overview(scroll_frame, *data),
+            owner=scroll_frame,
+            placeholder=scroll_frame,
+            scope="statistics"
+        )
+
+    def load_overview(self):
+        return self.db.get_statistics(), self.db.get_daily_statistics(days=30)
 
+    def show_overview(self, scroll_frame, stats, daily_stats):
         cards_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
         cards_frame.pack(fill="x", pady=15)
 
@@ -353,14 +366,21 @@ class StatisticsWindow:
 
         cards_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
 
-        self.create_daily_chart(scroll_frame)
+        self.create_daily_chart(scroll_frame, daily_stats)
 
     def show_categories_tab(self):
         scroll_frame = ctk.CTkScrollableFrame(self.tabs_container, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True, padx=10)
 
-        categories_stats = self.db.get_category_statistics()
+        self.executor.submit(
+            self.db.get_category_statistics,
+            on_done=lambda data: self.show_categories(scroll_frame, data),
+            owner=scroll_frame,
+            placeholder=scroll_frame,
+            scope="statistics"
+        )
 
+    def show_categories(self, scroll_frame, categories_stats):
         if not categories_stats:
             empty_label = ctk.CTkLabel(
                 scroll_frame,
@@ -414,18 +434,29 @@ class StatisticsWindow:
         scroll_frame = ctk.CTkScrollableFrame(self.tabs_container, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True)
 
-        self.create_progress_chart(scroll_frame)
+        self.executor.submit(
+            self.db.get_daily_statistics,
+            days=30,
+            on_done=lambda data: self.create_progress_chart(scroll_frame, data),
+            owner=scroll_frame,
+            placeholder=scroll_frame,
+            scope="statistics"
+        )
 
     def show_knowledge_levels_tab(self):
         scroll_frame = ctk.CTkScrollableFrame(self.tabs_container, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True)
 
-        self.create_knowledge_distribution_chart(scroll_frame)
+        self.executor.submit(
+            self.db.get_knowledge_level_distribution,
+            on_done=lambda data: self.create_knowledge_distribution_chart(scroll_frame, data),
+            owner=scroll_frame,
+            placeholder=scroll_frame,
+            scope="statistics"
+        )
 
-    def create_daily_chart(self, parent):
+    def create_daily_chart(self, parent, daily_stats):
         try:
-            daily_stats = self.db.get_daily_statistics(days=30)
-
             if not daily_stats:
                 ctk.CTkLabel(
                     parent,
@@ -510,10 +541,8 @@ class StatisticsWindow:
                 text_color="#EF4444"
             ).pack(pady=30)
 
-    def create_progress_chart(self, parent):
+    def create_progress_chart(self, parent, daily_stats):
         try:
-            daily_stats = self.db.get_daily_statistics(days=30)
-
             if not daily_stats:
                 ctk.CTkLabel(
                     parent,
@@ -575,10 +604,8 @@ class StatisticsWindow:
                 text_color="#EF4444"
             ).pack(pady=30)
 
-    def create_knowledge_distribution_chart(self, parent):
+    def create_knowledge_distribution_chart(self, parent, knowledge_stats):
         try:
-            knowledge_stats = self.db.get_knowledge_level_distribution()
-
             if not knowledge_stats:
                 ctk.CTkLabel(
                     parent,
@@ -0,0 +1,143 @@
+import threading
+from collections import Counter
+
+from scheduler import LEARNED_LEVEL
+
+_KEEP = object()
+
+
+class WordCounters:
+    """Лічильники слів, що оновлюються дельтами при кожному записі.
+
+    Для кожного слова зберігається (категорія, рівень, складність, архів, улюблене), а
+    агрегати тримаються за ключем (категорія, рівень, складність), тож читання статистики
+    коштує O(кількості груп), а не O(кількості слів).
+    """
+
+    def __init__(self):
+        self._words = {}
+        self._buckets = Counter()
+        self._favorites = 0
+        self._lock = threading.Lock()
+
+    def load(self, rows):
+        """rows: (id, category_id, knowledge_level, difficulty_level, is_archived, is_favorite)"""
+        with self._lock:
+            self._words.clear()
+            self._buckets.clear()
+            self._favorites = 0
+            for word_id, category_id, level, difficulty, archived, favorite in rows:
+                state = (category_id, level or 0, difficulty or 1, bool(archived), bool(favorite))
+                self._words[word_id] = state
+                self._apply(state, 1)
+
+    def __len__(self):
+        return len(self._words)
+
+    def _apply(self, state, sign):
+        category_id, level, difficulty, archived, favorite = state
+        if favorite:
+            self._favorites += sign
+        if archived:
+            return
+
+        key = (category_id, level, difficulty)
+        self._buckets[key] += sign
+        if not self._buckets[key]:
+            del self._buckets[key]
+
+    def put(self, word_id, category_id=_KEEP, knowledge_level=_KEEP, difficulty=_KEEP, archived=_KEEP,
+            favorite=_KEEP):
+        with self._lock:
+            old = self._words.get(word_id, (None, 0, 1, False, False))
+            new = (
+                old[0] if category_id is _KEEP else category_id,
+                old[1] if knowledge_level is _KEEP else knowledge_level,
+                old[2] if difficulty is _KEEP else difficulty,
+                old[3] if archived is _KEEP else bool(archived),
+                old[4] if favorite is _KEEP else bool(favorite)
+            )
+            if word_id in self._words:
+                self._apply(old, -1)
+            self._words[word_id] = new
+            self._apply(new, 1)
+
+    def rate(self, word_id, knows):
+        # Та сама зміна рівня, що й у sp_RecordInteraction
+        with self._lock:
+            state = self._words.get(word_id)
+            if state is None:
+                return
+            level = state[1] + 1 if knows else max(0, state[1] - 1)
+            self._apply(state, -1)
+            state = (state[0], level) + state[2:]
+            self._words[word_id] = state
+            self._apply(state, 1)
+
+    def toggle_favorite(self, word_id):
+        with self._lock:
+            state = self._words.get(word_id)
+            if state is None:
+                return
+            self._apply(state, -1)
+            state = state[:4] + (not state[4],)
+            self._words[word_id] = state
+            self._apply(state, 1)
+
+    def remove(self, word_id):
+        with self._lock:
+            state = self._words.pop(word_id, None)
+            if state is not None:
+                self._apply(state, -1)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._buckets), self._favorites
+
+    def totals(self):
+        buckets, favorites = self.snapshot()
+        stats = {'total_words': 0, 'learned_words': 0, 'learning_words': 0, 'new_words': 0,
+                 'favorite_words': favorites}
+        for (_, level, _), count in buckets.items():
+            stats['total_words'] += count
+            if level >= LEARNED_LEVEL:
+                stats['learned_words'] += count
+            elif level > 0:
+                stats['learning_words'] += count
+            else:
+                stats['new_words'] += count
+
+        if stats['total_words'] > 0:
+            stats['progress_percentage'] = (stats['learned_words'] / stats['total_words']) * 100
+        else:
+            stats['progress_percentage'] = 0
+        return stats
+
+    def by_category(self):
+        """{category_id: [всього, вивчено, вивчається, нові]}"""
+        result = {}
+        for (category_id, level, _), count in self.snapshot()[0].items():
+            row = result.setdefault(category_id, [0, 0, 0, 0])
+            row[0] += count
+            if level >= LEARNED_LEVEL:
+                row[1] += count
+            elif level > 0:
+                row[2] += count
+            else:
+                row[3] += count
+        return result
+
+    def level_distribution(self):
+        levels = Counter()
+        for (_, level, _), count in self.snapshot()[0].items():
+            levels[level] += count
+        return sorted(levels.items())
+
+    def by_difficulty(self):
+        difficulties = {}
+        for (_, level, difficulty), count in self.snapshot()[0].items():
+            row = difficulties.setdefault(difficulty, [0, 0])
+            row[0] += count
+            if level >= LEARNED_LEVEL:
+                row[1] += count
+        return [(difficulty, total, learned) for difficulty, (total, learned) in sorted(difficulties.items())]
@@ -0,0 +1,185 @@
+import threading
+import unicodedata
+from array import array
+
+RANK_STRONG = 'HIGHLIGHT_STRONG'
+RANK_MEDIUM = 'HIGHLIGHT_MEDIUM'
+RANK_LIGHT = 'HIGHLIGHT_LIGHT'
+
+_RANK_ORDER = {RANK_STRONG: 1, RANK_MEDIUM: 2, RANK_LIGHT: 3}
+
+# Різні варіанти апострофа в українських словах зводимо до одного
+_APOSTROPHES = str.maketrans({"’": "'", "ʼ": "'", "`": "'", "‘": "'"})
+
+FUZZY_THRESHOLD = 0.3
+
+
+def fold(text):
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold().translate(_APOSTROPHES)
+    return text.replace("ё", "е")
+
+
+def grams(text, size):
+    if len(text) < size:
+        return set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def padded_trigrams(text):
+    # Межі слова теж враховуються, тож "appel" близьке до "apple"
+    return grams(f"  {text} ", 3) if text else set()
+
+
+class WordIndex:
+    """Інвертований триграмний індекс над словом, перекладом і транскрипцією.
+
+    Пошук повертає [(word_id, ранг)]: STRONG - збіг у слові, MEDIUM - у перекладі,
+    LIGHT - у транскрипції/прикладах або нечіткий збіг за триграмами. Приклади мають окремі
+    списки триграм, щоб не роздувати кандидатів для нечіткого пошуку; тексту в них набагато
+    більше, тож це масиви чисел, а не множини: менше пам'яті, і збирач сміття їх не обходить.
+    Запити з 1-2 символів
+    перевіряються простим переглядом - індексувати їх дорожче, ніж шукати.
+    """
+
+    def __init__(self):
+        self._fields = {}
+        self._postings = {}
+        self._example_postings = {}
+        self._lock = threading.Lock()
+
+    def load(self, rows):
+        """rows: (id, word, translation, transcription, example_sentence, example_translation)"""
+        with self._lock:
+            self._fields.clear()
+            self._postings.clear()
+            self._example_postings.clear()
+            for row in rows:
+                self._add(row[0], row[1:6])
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, word_id):
+        return word_id in self._fields
+
+    def put(self, word_id, word, translation, transcription="", example="", example_trans=""):
+        with self._lock:
+            self._remove(word_id)
+            self._add(word_id, (word, translation, transcription, example, example_trans))
+
+    def remove(self, word_id):
+        with self._lock:
+            self._remove(word_id)
+
+    def _add(self, word_id, texts):
+        word, translation, transcription, *examples = (fold(text) for text in texts)
+        example = "\n".join(text for text in examples if text)
+        self._fields[word_id] = (word, translation, transcription, example)
+
+        for gram in grams(word, 3) | grams(translation, 3) | grams(transcription, 3):
+            self._postings.setdefault(gram, set()).add(word_id)
+        for gram in grams(example, 3):
+            ids = self._example_postings.get(gram)
+            if ids is None:
+                ids = self._example_postings[gram] = array("q")
+            ids.append(word_id)
+
+    def _remove(self, word_id):
+        fields = self._fields.pop(word_id, None)
+        if fields is None:
+            return
+
+        self._unpost(self._postings, word_id, grams(fields[0], 3) | grams(fields[1], 3) | grams(fields[2], 3))
+        self._unpost(self._example_postings, word_id, grams(fields[3], 3))
+
+    @staticmethod
+    def _unpost(postings, word_id, word_grams):
+        for gram in word_grams:
+            ids = postings.get(gram)
+            if ids is not None:
+                if isinstance(ids, set):
+                    ids.discard(word_id)
+                else:
+                    ids.remove(word_id)
+                if not ids:
+                    del postings[gram]
+
+    def search(self, term, fuzzy=True):
+        needle = fold(term.strip())
+        if not needle:
+            return []
+
+        with self._lock:
+            if len(needle) < 3:
+                hits = self._scan(needle, self._fields)
+            else:
+                hits = self._exact(needle)
+                if fuzzy:
+                    found = {word_id for word_id, _ in hits}
+                    hits += [(word_id, RANK_LIGHT) for word_id in self._fuzzy(needle) if word_id not in found]
+
+            hits.sort(key=lambda hit: (_RANK_ORDER[hit[1]], self._fields[hit[0]][0]))
+            return hits
+
+    def _exact(self, needle):
+        needle_grams = grams(needle, 3)
+        candidates = self._intersect(self._postings, needle_grams)
+        candidates |= self._intersect(self._example_postings, needle_grams)
+        return self._scan(needle, candidates)
+
+    @staticmethod
+    def _intersect(postings, needle_grams):
+        lists = [postings.get(gram) for gram in needle_grams]
+        if not lists or any(ids is None for ids in lists):
+            return set()
+
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for ids in lists[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                break
+        return candidates
+
+    def _scan(self, needle, word_ids):
+        hits = []
+        for word_id in word_ids:
+            rank = match_rank(needle, self._fields[word_id])
+            if rank is not None:
+                hits.append((word_id, rank))
+        return hits
+
+    def _fuzzy(self, needle):
+        candidates = set()
+        for gram in grams(needle, 3):
+            candidates |= self._postings.get(gram, set())
+
+        needle_grams = padded_trigrams(needle)
+        return [word_id for word_id in candidates
+                if similarity(needle_grams, self._fields[word_id]) >= FUZZY_THRESHOLD]
+
+
+def match_rank(needle, fields):
+    """fields: (слово, переклад, транскрипція, приклади) після fold()."""
+    word, translation, transcription, example = fields
+    if needle in word:
+        return RANK_STRONG
+    if needle in translation:
+        return RANK_MEDIUM
+    if needle in transcription or needle in example:
+        return RANK_LIGHT
+    return None
+
+
+def similarity(needle_grams, fields):
+    # Схожість Жаккара з найближчим із двох основних полів
+    best = 0.0
+    for text in fields[:2]:
+        text_grams = padded_trigrams(text)
+        if not text_grams:
+            continue
+        common = len(needle_grams & text_grams)
+        best = max(best, common / (len(needle_grams) + len(text_grams) - common))
+    return best